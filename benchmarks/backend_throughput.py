@@ -0,0 +1,62 @@
+"""
+Throughput comparison of cursor output backends
+
+Moves the cursor along a circle with no tween and no pause, and reports
+moves per second for every backend that can run here. The pyautogui and
+xlib backends need a display (Xvfb works: ``xvfb-run python ...``).
+
+Usage:
+    python benchmarks/backend_throughput.py [--moves 5000]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+# Add path to module
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from mouse_controller.backends import BACKENDS, get_backend
+from mouse_controller.core.patterns import PatternGenerator
+
+
+def measure(name: str, moves: int) -> float:
+    """Return moves per second of a backend"""
+    backend = get_backend(name)
+    backend.configure(failsafe=False, pause=0)
+    try:
+        width, height = backend.size()
+        radius = min(width, height) // 4
+        points = PatternGenerator.generate_circle_array(
+            width // 2, height // 2, radius, moves - 1
+        ).tolist()
+
+        start = time.perf_counter()
+        for x, y in points:
+            backend.move_to(x, y)
+        elapsed = time.perf_counter() - start
+    finally:
+        backend.close()
+
+    return len(points) / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--moves", type=int, default=5000)
+    parser.add_argument("backends", nargs="*", default=list(BACKENDS))
+    args = parser.parse_args()
+
+    print(f"{'backend':<12}{'moves/s':>14}")
+    for name in args.backends:
+        try:
+            rate = measure(name, args.moves)
+        except Exception as e:
+            print(f"{name:<12}{'unavailable':>14}  ({type(e).__name__}: {e})")
+            continue
+        print(f"{name:<12}{rate:>14,.0f}")
+
+
+if __name__ == "__main__":
+    main()
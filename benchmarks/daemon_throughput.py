@@ -0,0 +1,64 @@
+"""
+Points per second streamed to the control daemon over its Unix socket
+
+Starts a daemon with the in-memory backend on a temporary socket and sends
+batches of points at rate 0 (no delay), once packed as int16 and once as
+int32, then reports socket throughput.
+
+Usage:
+    python benchmarks/daemon_throughput.py [--points 200000] [--batch 500]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+# Add path to module
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from mouse_controller.backends import MemoryBackend
+from mouse_controller.core.mouse_mover import MouseMover
+from mouse_controller.daemon import MotionClient, MotionDaemon
+
+
+def measure(
+    socket_path: str, points: np.ndarray, batch: int, window: int, wide: bool
+) -> float:
+    """Return points per second of one streaming run"""
+    batches = [points[i : i + batch] for i in range(0, len(points), batch)]
+
+    with MotionClient(socket_path, window=window) as client:
+        start = time.perf_counter()
+        for chunk in batches:
+            client.send_points(chunk, wide=wide)
+        client.flush()
+        elapsed = time.perf_counter() - start
+
+    return len(points) / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--points", type=int, default=200_000)
+    parser.add_argument("--batch", type=int, default=500)
+    parser.add_argument("--window", type=int, default=8)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    points = rng.integers(1, 1000, size=(args.points, 2))
+
+    socket_path = os.path.join(tempfile.mkdtemp(), "bench.sock")
+    mover = MouseMover(failsafe=False, pause=0, backend=MemoryBackend())
+    with MotionDaemon(socket_path, mover=mover, window=args.window):
+        print(f"{'framing':<10}{'batch':>8}{'points/s':>14}")
+        for name, wide in (("int16", False), ("int32", True)):
+            rate = measure(socket_path, points, args.batch, args.window, wide)
+            print(f"{name:<10}{args.batch:>8}{rate:>14,.0f}")
+
+
+if __name__ == "__main__":
+    main()
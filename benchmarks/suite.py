@@ -0,0 +1,378 @@
+"""
+Benchmark suite for pattern generators, helpers and the mover
+
+Times every PatternGenerator method and the helper functions across point
+counts, the per-point overhead of MouseMover.move_smooth_path against a
+backend that does nothing, and the peak memory of each case (tracemalloc).
+Results are written as JSON; ``compare`` diffs two result files and exits
+with status 1 when a case got slower than the threshold.
+
+Usage:
+    python benchmarks/suite.py run [--sizes 100 1000 10000] [--output FILE]
+    python benchmarks/suite.py compare BASELINE CURRENT [--threshold 0.1]
+"""
+
+import argparse
+import inspect
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+from collections import deque
+from typing import Any, Callable, Dict, List, NamedTuple, Optional
+
+import numpy as np
+
+# Add path to module
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from mouse_controller.backends import MemoryBackend
+from mouse_controller.core.mouse_mover import MouseMover
+from mouse_controller.core.patterns import PatternGenerator
+from mouse_controller.utils import helpers
+from mouse_controller.utils.tracing import Tracer
+
+DEFAULT_SIZES = (100, 1000, 10000)
+DEFAULT_OUTPUT = os.path.join(os.path.dirname(__file__), "results", "latest.json")
+SCREEN = (1920, 1080)
+
+# Arguments of each pattern for about n points; None marks fixed-size shapes
+PATTERN_ARGS: Dict[str, Optional[Callable[[int], tuple]]] = {
+    "circle": lambda n: (960, 540, 300, n),
+    "square": None,
+    "triangle": None,
+    "star": lambda n: (960, 540, 300, 150, max(n // 2, 2)),
+    "spiral": lambda n: (960, 540, 300, 1, n),
+    "sine_wave": lambda n: (100, 540, 1600, 200, 3.0, n),
+    "random_walk": lambda n: (960, 540, n, 50, 0),
+    "figure_eight": lambda n: (960, 540, 600, 300, n),
+    "heart": lambda n: (960, 540, 300, n),
+}
+FIXED_ARGS = {"square": (860, 440, 200), "triangle": (960, 540, 200)}
+
+
+class Case(NamedTuple):
+    """One benchmark: a call and the number of points it handles"""
+
+    group: str
+    name: str
+    n: int
+    func: Callable[[], Any]
+
+
+class NullBackend(MemoryBackend):
+    """Backend that accepts moves and does nothing"""
+
+    def move_to(self, x: int, y: int, duration: float = 0.0):
+        pass
+
+    def warp(self, x: int, y: int):
+        pass
+
+
+def consume(iterator) -> int:
+    """Exhaust an iterator without keeping its items"""
+    deque(iterator, maxlen=0)
+    return 0
+
+
+def pattern_cases(sizes) -> List[Case]:
+    """Cases for every public PatternGenerator method"""
+    cases = []
+    for name, method in inspect.getmembers(PatternGenerator, inspect.isfunction):
+        if name.startswith("_"):
+            continue
+        shape = next((s for s in PATTERN_ARGS if s in name), None)
+        if shape is None:
+            raise RuntimeError(f"No benchmark arguments for PatternGenerator.{name}")
+
+        build = PATTERN_ARGS[shape]
+        if build is None:
+            args = FIXED_ARGS[shape]
+            variants = [(len(list(method(*args))), args)]
+        else:
+            variants = [(n, build(n)) for n in sizes]
+
+        for n, args in variants:
+            if name.startswith("iter_"):
+                func = (lambda m, a: lambda: consume(m(*a)))(method, args)
+            else:
+                func = (lambda m, a: lambda: m(*a))(method, args)
+            cases.append(Case("patterns", name, n, func))
+    return cases
+
+
+def helper_cases(sizes) -> List[Case]:
+    """Cases for the helper functions"""
+    width, height = SCREEN
+    cases = [
+        Case(
+            "helpers",
+            "validate_coordinates",
+            1,
+            lambda: helpers.validate_coordinates(500, 500, width, height),
+        ),
+        Case(
+            "helpers",
+            "calculate_distance",
+            1,
+            lambda: helpers.calculate_distance((0, 0), (300, 400)),
+        ),
+        Case(
+            "helpers",
+            "clamp_coordinates",
+            1,
+            lambda: helpers.clamp_coordinates(-5, 5000, width, height),
+        ),
+        Case(
+            "helpers",
+            "scale_coordinates",
+            1,
+            lambda: helpers.scale_coordinates(100, 200, 1.5),
+        ),
+        Case(
+            "helpers",
+            "normalize_duration",
+            1,
+            lambda: helpers.normalize_duration(3.0),
+        ),
+        Case(
+            "helpers",
+            "get_safe_random_position",
+            1,
+            lambda: helpers.get_safe_random_position(width, height),
+        ),
+    ]
+
+    rng = np.random.default_rng(0)
+    for n in sizes:
+        # A tenth of the points fall outside the screen
+        xy = rng.integers(-100, width + 100, size=(n, 2))
+        control = xy[: max(n // 10, 4)]
+        cases += [
+            Case(
+                "helpers",
+                "validate_path",
+                n,
+                (lambda p: lambda: helpers.validate_path(p, width, height))(xy),
+            ),
+            Case(
+                "helpers",
+                "clamp_path",
+                n,
+                (lambda p: lambda: helpers.clamp_path(p, width, height))(xy),
+            ),
+            Case(
+                "helpers",
+                "filter_path",
+                n,
+                (lambda p: lambda: helpers.filter_path(p, width, height))(xy),
+            ),
+            Case(
+                "helpers",
+                "interpolate_points",
+                n,
+                (lambda k: lambda: helpers.interpolate_points((0, 0), SCREEN, k))(
+                    n - 2
+                ),
+            ),
+            Case(
+                "helpers",
+                "create_smooth_curve",
+                len(control),
+                (lambda p: lambda: helpers.create_smooth_curve(p))(control),
+            ),
+        ]
+    return cases
+
+
+def mover_cases(sizes) -> List[Case]:
+    """Per-point cost of move_smooth_path with metrics and tracing off and on"""
+    variants = {
+        "move_smooth_path": {},
+        "move_smooth_path[metrics]": {"metrics": True},
+        "move_smooth_path[tracing]": {"tracer": Tracer(capacity=1000, enabled=True)},
+    }
+    cases = []
+    for name, kwargs in variants.items():
+        mover = MouseMover(failsafe=False, pause=0, backend=NullBackend(), **kwargs)
+        for n in sizes:
+            points = PatternGenerator.generate_circle_points(960, 540, 300, n - 1)
+            func = (lambda m, p: lambda: m.move_smooth_path(p, 0))(mover, points)
+            cases.append(Case("mover", name, n, func))
+    return cases
+
+
+def time_case(case: Case, min_time: float, repeat: int) -> float:
+    """Best seconds per call over several auto-ranged rounds"""
+    loops = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(loops):
+            case.func()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time / repeat:
+            break
+        loops *= 2
+
+    best = elapsed / loops
+    for _ in range(repeat - 1):
+        start = time.perf_counter()
+        for _ in range(loops):
+            case.func()
+        best = min(best, (time.perf_counter() - start) / loops)
+    return best
+
+
+def peak_memory(case: Case) -> int:
+    """Peak bytes allocated by one call"""
+    tracemalloc.start()
+    try:
+        case.func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def environment() -> Dict[str, Any]:
+    """Where and when the results were taken"""
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+        ).stdout.strip()
+    except OSError:
+        commit = ""
+    return {
+        "commit": commit or None,
+        "time": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+    }
+
+
+def run(args) -> Dict[str, Any]:
+    """Run the selected groups and write the results"""
+    groups = {
+        "patterns": pattern_cases,
+        "helpers": helper_cases,
+        "mover": mover_cases,
+    }
+    cases = []
+    for group in args.groups:
+        cases += groups[group](args.sizes)
+
+    results = []
+    for case in cases:
+        seconds = time_case(case, args.min_time, args.repeat)
+        result = {
+            "group": case.group,
+            "name": case.name,
+            "n": case.n,
+            "seconds": seconds,
+            "ns_per_point": seconds / max(case.n, 1) * 1e9,
+            "peak_bytes": peak_memory(case),
+        }
+        results.append(result)
+        print(
+            f"{case.group:<9}{case.name:<28}{case.n:>7}"
+            f"{seconds * 1e6:>12.1f} µs{result['ns_per_point']:>10.0f} ns/pt"
+            f"{result['peak_bytes'] / 1024:>10.1f} KiB"
+        )
+
+    report = {"environment": environment(), "results": results}
+    if args.output:
+        os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"\nResults written to {args.output}")
+    return report
+
+
+def compare(baseline: Dict[str, Any], current: Dict[str, Any], threshold: float):
+    """
+    Print timing changes between two result files
+
+    Args:
+        baseline: Earlier results
+        current: New results
+        threshold: Relative slowdown reported as a regression (0.1 = 10%)
+
+    Returns:
+        List of (group, name, n, ratio) of regressed cases
+    """
+
+    def key(result):
+        return result["group"], result["name"], result["n"]
+
+    before = {key(result): result for result in baseline["results"]}
+    regressions = []
+    for result in current["results"]:
+        old = before.get(key(result))
+        if old is None:
+            continue
+        ratio = result["seconds"] / old["seconds"]
+        marker = ""
+        if ratio > 1 + threshold:
+            marker = "  REGRESSION"
+            regressions.append(key(result) + (ratio,))
+        elif ratio < 1 - threshold:
+            marker = "  faster"
+        group, name, n = key(result)
+        print(f"{group:<9}{name:<28}{n:>7}{ratio:>9.2f}x{marker}")
+
+    print(f"\n{len(regressions)} regression(s) above {threshold:.0%}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="run benchmarks")
+    run_parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES))
+    run_parser.add_argument(
+        "--groups",
+        nargs="+",
+        choices=["patterns", "helpers", "mover"],
+        default=["patterns", "helpers", "mover"],
+    )
+    run_parser.add_argument("--min-time", type=float, default=0.2)
+    run_parser.add_argument("--repeat", type=int, default=5)
+    run_parser.add_argument("--output", default=DEFAULT_OUTPUT)
+    run_parser.add_argument(
+        "--baseline", help="compare with an earlier result file after the run"
+    )
+    run_parser.add_argument("--threshold", type=float, default=0.1)
+
+    compare_parser = commands.add_parser("compare", help="compare two result files")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current")
+    compare_parser.add_argument("--threshold", type=float, default=0.1)
+
+    args = parser.parse_args()
+
+    if args.command == "run":
+        current = run(args)
+        if not args.baseline:
+            return
+        print()
+    else:
+        with open(args.current, encoding="utf-8") as f:
+            current = json.load(f)
+
+    with open(args.baseline, encoding="utf-8") as f:
+        baseline = json.load(f)
+    if compare(baseline, current, args.threshold):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
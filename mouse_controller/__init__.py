@@ -6,6 +6,7 @@ __version__ = "1.0.0"
 __author__ = "Your Name"
 
 from .core.mouse_mover import MouseMover
+from .core.path import Path
 from .core.patterns import PatternGenerator
 
-__all__ = ["MouseMover", "PatternGenerator"]
+__all__ = ["MouseMover", "Path", "PatternGenerator"]
@@ -0,0 +1,57 @@
+"""
+Бекенди виводу курсора Mouse Controller
+"""
+
+import importlib
+from typing import Dict, Union
+
+from .base import FailSafeError, Monitor, MouseBackend
+from .memory import MemoryBackend
+
+# Backend name -> "module:class"; modules are imported on first use so
+# missing optional dependencies only matter for the backend that needs them
+BACKENDS: Dict[str, str] = {
+    "pyautogui": "mouse_controller.backends.pyautogui_backend:PyAutoGUIBackend",
+    "xlib": "mouse_controller.backends.xlib_backend:XlibBackend",
+    "memory": "mouse_controller.backends.memory:MemoryBackend",
+}
+
+DEFAULT_BACKEND = "pyautogui"
+
+
+def get_backend(
+    backend: Union[str, MouseBackend, None] = None, **kwargs
+) -> MouseBackend:
+    """
+    Create backend by name
+
+    Args:
+        backend: Backend name (see BACKENDS), an instance, or None for the
+            default backend
+        **kwargs: Arguments for the backend constructor
+
+    Returns:
+        MouseBackend instance
+    """
+    if isinstance(backend, MouseBackend):
+        return backend
+
+    name = backend or DEFAULT_BACKEND
+    try:
+        module_name, _, class_name = BACKENDS[name].partition(":")
+    except KeyError:
+        raise ValueError(f"Unknown backend: {name}") from None
+
+    module = importlib.import_module(module_name)
+    return getattr(module, class_name)(**kwargs)
+
+
+__all__ = [
+    "BACKENDS",
+    "DEFAULT_BACKEND",
+    "FailSafeError",
+    "MemoryBackend",
+    "Monitor",
+    "MouseBackend",
+    "get_backend",
+]
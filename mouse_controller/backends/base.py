@@ -0,0 +1,142 @@
+"""
+Base interface of cursor output backends
+"""
+
+import time
+from typing import List, NamedTuple, Optional, Tuple
+
+# Frames per second of the generic linear tween
+TWEEN_RATE = 60.0
+
+# Corner distance (pixels) that triggers the failsafe
+FAILSAFE_MARGIN = 0
+
+# Time the screen size used by the failsafe check is reused (seconds)
+FAILSAFE_SIZE_TTL = 1.0
+
+
+class FailSafeError(RuntimeError):
+    """Raised when the cursor is in a screen corner while failsafe is enabled"""
+
+
+class Monitor(NamedTuple):
+    """Monitor rectangle in virtual screen coordinates"""
+
+    x: int
+    y: int
+    width: int
+    height: int
+
+
+class MouseBackend:
+    """Cursor output backend
+
+    Subclasses implement ``size``, ``position`` and ``warp``; the generic
+    ``move_to`` builds a linear tween out of warps and applies the failsafe
+    and pause settings.
+    """
+
+    name = "base"
+    # Whether every instance drives the same physical screen
+    shared_screen = True
+    # Reuse of the screen size by the failsafe check; 0 queries every time
+    failsafe_size_ttl = FAILSAFE_SIZE_TTL
+
+    def __init__(self):
+        """Initialize backend with failsafe enabled and no pause"""
+        self.failsafe = True
+        self.pause = 0.0
+        self._failsafe_size: Optional[Tuple[int, int]] = None
+        self._failsafe_size_at = 0.0
+
+    def configure(self, failsafe: bool = True, pause: float = 0.0):
+        """
+        Apply safety settings
+
+        Args:
+            failsafe: Raise FailSafeError when the cursor is in a screen corner
+            pause: Pause after every move (seconds)
+        """
+        self.failsafe = failsafe
+        self.pause = pause
+
+    def size(self) -> Tuple[int, int]:
+        """Get screen size as (width, height)"""
+        raise NotImplementedError
+
+    def position(self) -> Tuple[int, int]:
+        """Get cursor position as (x, y)"""
+        raise NotImplementedError
+
+    def warp(self, x: int, y: int):
+        """Place cursor at (x, y) immediately, without checks or pauses"""
+        raise NotImplementedError
+
+    def monitors(self) -> List[Monitor]:
+        """List monitors (a single screen-sized monitor by default)"""
+        width, height = self.size()
+        return [Monitor(0, 0, width, height)]
+
+    def check_failsafe(self):
+        """Raise FailSafeError if failsafe is on and the cursor is in a corner"""
+        if not self.failsafe:
+            return
+        x, y = self.position()
+        width, height = self._cached_size()
+        on_x_edge = x <= FAILSAFE_MARGIN or x >= width - 1 - FAILSAFE_MARGIN
+        on_y_edge = y <= FAILSAFE_MARGIN or y >= height - 1 - FAILSAFE_MARGIN
+        if on_x_edge and on_y_edge:
+            raise FailSafeError(f"Failsafe triggered by cursor at ({x}, {y})")
+
+    def _cached_size(self) -> Tuple[int, int]:
+        """Screen size, queried at most once per failsafe_size_ttl"""
+        now = time.monotonic()
+        if (
+            self._failsafe_size is None
+            or now - self._failsafe_size_at >= self.failsafe_size_ttl
+        ):
+            self._failsafe_size = self.size()
+            self._failsafe_size_at = now
+        return self._failsafe_size
+
+    def move_to(self, x: int, y: int, duration: float = 0.0):
+        """
+        Move cursor to (x, y), tweening linearly over duration
+
+        The cursor reaches (x, y) when duration has passed, also for moves
+        too short for a tween frame, so timed paths keep their timing.
+
+        Args:
+            x: X coordinate
+            y: Y coordinate
+            duration: Movement duration in seconds
+        """
+        self.check_failsafe()
+
+        start = time.perf_counter()
+        frames = max(int(duration * TWEEN_RATE), 1)
+        if frames > 1:
+            start_x, start_y = self.position()
+        for frame in range(1, frames + 1):
+            delay = start + duration * frame / frames - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            if frame < frames:
+                share = frame / frames
+                self.warp(
+                    round(start_x + (x - start_x) * share),
+                    round(start_y + (y - start_y) * share),
+                )
+
+        self.warp(x, y)
+        if self.pause > 0:
+            time.sleep(self.pause)
+
+    def close(self):
+        """Release backend resources"""
+
+    def __enter__(self) -> "MouseBackend":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
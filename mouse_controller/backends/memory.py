@@ -0,0 +1,69 @@
+"""
+In-memory backend recording every move without touching a display
+"""
+
+from typing import List, Optional, Tuple
+
+from .base import MouseBackend, Monitor
+
+
+class MemoryBackend(MouseBackend):
+    """Backend that records moves on a virtual clock
+
+    Useful for tests, dry runs and measuring the cost of path generation
+    without any display or real-time waiting.
+    """
+
+    name = "memory"
+    shared_screen = False
+    # The virtual size is free to read and may be changed at any time
+    failsafe_size_ttl = 0.0
+
+    def __init__(
+        self,
+        width: int = 1920,
+        height: int = 1080,
+        position: Optional[Tuple[int, int]] = None,
+        monitors: Optional[List[Monitor]] = None,
+    ):
+        """
+        Initialize MemoryBackend
+
+        Args:
+            width: Virtual screen width
+            height: Virtual screen height
+            position: Initial cursor position (defaults to the center)
+            monitors: Virtual monitors (defaults to one screen-sized monitor)
+        """
+        super().__init__()
+        self.width = width
+        self.height = height
+        self.x, self.y = position or (width // 2, height // 2)
+        self._monitors = monitors
+        # Recorded (x, y, duration) moves and the virtual time they took
+        self.moves: List[Tuple[int, int, float]] = []
+        self.clock = 0.0
+
+    def size(self) -> Tuple[int, int]:
+        return self.width, self.height
+
+    def position(self) -> Tuple[int, int]:
+        return self.x, self.y
+
+    def warp(self, x: int, y: int):
+        self.x, self.y = int(x), int(y)
+        self.moves.append((self.x, self.y, 0.0))
+
+    def monitors(self) -> List[Monitor]:
+        return list(self._monitors) if self._monitors else super().monitors()
+
+    def move_to(self, x: int, y: int, duration: float = 0.0):
+        self.check_failsafe()
+        self.x, self.y = int(x), int(y)
+        self.moves.append((self.x, self.y, duration))
+        self.clock += duration + self.pause
+
+    def clear(self):
+        """Forget recorded moves and reset the virtual clock"""
+        self.moves.clear()
+        self.clock = 0.0
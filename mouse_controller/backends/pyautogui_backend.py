@@ -0,0 +1,37 @@
+"""
+Backend driving the cursor through pyautogui
+"""
+
+from typing import Tuple
+
+import pyautogui
+
+from .base import FailSafeError, MouseBackend
+
+
+class PyAutoGUIBackend(MouseBackend):
+    """Portable backend using pyautogui's tween, failsafe and pause"""
+
+    name = "pyautogui"
+
+    def configure(self, failsafe: bool = True, pause: float = 0.0):
+        super().configure(failsafe, pause)
+        pyautogui.FAILSAFE = failsafe
+        pyautogui.PAUSE = pause
+
+    def size(self) -> Tuple[int, int]:
+        width, height = pyautogui.size()
+        return width, height
+
+    def position(self) -> Tuple[int, int]:
+        pos = pyautogui.position()
+        return pos.x, pos.y
+
+    def warp(self, x: int, y: int):
+        pyautogui.moveTo(x, y, duration=0, _pause=False)
+
+    def move_to(self, x: int, y: int, duration: float = 0.0):
+        try:
+            pyautogui.moveTo(x, y, duration=duration)
+        except pyautogui.FailSafeException as e:
+            raise FailSafeError(str(e)) from e
@@ -0,0 +1,61 @@
+"""
+Backend talking to the X server directly through XTest
+
+Requires python-xlib (``pip install mouse-controller[xlib]``) and an X
+display, e.g. Xvfb for headless runs. A move is a single XTest motion event
+with no tween, failsafe or pause unless configured.
+"""
+
+import os
+from typing import List, Optional, Tuple
+
+from Xlib import X, display
+from Xlib.ext import randr, xtest
+
+from .base import MouseBackend, Monitor
+
+
+class XlibBackend(MouseBackend):
+    """Low-overhead X11 backend using XTest fake motion events"""
+
+    name = "xlib"
+
+    def __init__(self, display_name: Optional[str] = None):
+        """
+        Initialize XlibBackend
+
+        Args:
+            display_name: X display (defaults to $DISPLAY)
+        """
+        super().__init__()
+        self.display = display.Display(display_name or os.environ.get("DISPLAY"))
+        if not self.display.has_extension("XTEST"):
+            self.display.close()
+            raise RuntimeError("X server does not support the XTEST extension")
+
+        self.screen = self.display.screen()
+        self.root = self.screen.root
+
+    def size(self) -> Tuple[int, int]:
+        # The screen info is fixed at connect; the root window follows RandR
+        geometry = self.root.get_geometry()
+        return geometry.width, geometry.height
+
+    def position(self) -> Tuple[int, int]:
+        pointer = self.root.query_pointer()
+        return pointer.root_x, pointer.root_y
+
+    def warp(self, x: int, y: int):
+        xtest.fake_input(self.display, X.MotionNotify, x=int(x), y=int(y))
+        self.display.flush()
+
+    def monitors(self) -> List[Monitor]:
+        if not self.display.has_extension("RANDR"):
+            return super().monitors()
+        monitors = randr.get_monitors(self.root, is_active=True).monitors
+        return [
+            Monitor(m.x, m.y, m.width_in_pixels, m.height_in_pixels) for m in monitors
+        ]
+
+    def close(self):
+        self.display.close()
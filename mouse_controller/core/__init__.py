@@ -2,7 +2,32 @@
 Core модулі Mouse Controller
 """
 
+from .async_mover import AsyncMouseMover
+from .motion_service import MotionService, Priority
 from .mouse_mover import MouseMover
+from .path import Path
 from .patterns import PatternGenerator
+from .recording import TrajectoryReader, TrajectoryRecorder
+from .registry import PatternRegistry, PatternSpec, pattern_registry
+from .sampler import PositionSample, PositionSampler
+from .stop_token import StopToken
+from .templates import ShapeTemplateCache, template_cache
 
-__all__ = ["MouseMover", "PatternGenerator"]
+__all__ = [
+    "AsyncMouseMover",
+    "MotionService",
+    "MouseMover",
+    "Path",
+    "PatternGenerator",
+    "PatternRegistry",
+    "PatternSpec",
+    "PositionSample",
+    "PositionSampler",
+    "Priority",
+    "pattern_registry",
+    "StopToken",
+    "ShapeTemplateCache",
+    "template_cache",
+    "TrajectoryReader",
+    "TrajectoryRecorder",
+]
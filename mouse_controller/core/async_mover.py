@@ -0,0 +1,269 @@
+"""
+Asyncio-native cursor control
+
+Frames are scheduled on the running event loop against absolute deadlines
+(no thread per call), so paths can be cancelled between any two frames.
+Movers driving the same display take turns through one asyncio.Lock per
+event loop: per backend name for real displays, per instance for virtual
+backends, as with the shared screen geometry.
+"""
+
+import asyncio
+import logging
+import weakref
+from typing import Dict, Iterable, Optional, Tuple, Union
+
+import numpy as np
+
+from .path import Path
+from .trig import cos_sin
+from ..backends import FailSafeError, MouseBackend, get_backend
+from ..utils.events import EventLog
+from ..utils.screen import shared_geometry
+
+# Time between shake movements (seconds)
+SHAKE_INTERVAL = 0.05
+
+# Locks of real displays, per event loop and backend name; virtual backends
+# keep theirs in an _async_locks attribute, per event loop
+_Locks = Dict[str, asyncio.Lock]
+_display_locks: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _Locks]"
+_display_locks = weakref.WeakKeyDictionary()
+
+
+def backend_lock(backend: MouseBackend) -> asyncio.Lock:
+    """
+    Get the lock serializing paths on a backend's display
+
+    Must be called from a running event loop; the lock belongs to it.
+
+    Args:
+        backend: Output backend
+
+    Returns:
+        Lock shared by every AsyncMouseMover on the same display and loop
+    """
+    loop = asyncio.get_running_loop()
+    if backend.shared_screen:
+        locks = _display_locks.setdefault(loop, {})
+        key = backend.name
+    else:
+        locks = backend.__dict__.setdefault("_async_locks", weakref.WeakKeyDictionary())
+        key = loop
+    lock = locks.get(key)
+    if lock is None:
+        lock = locks[key] = asyncio.Lock()
+    return lock
+
+
+class AsyncMouseMover:
+    """Awaitable counterpart of MouseMover"""
+
+    def __init__(
+        self,
+        failsafe: bool = True,
+        pause: float = 0.0,
+        backend: Union[str, MouseBackend, None] = None,
+        rate: float = 60.0,
+    ):
+        """
+        Initialize AsyncMouseMover
+
+        Args:
+            failsafe: Enable safe mode (move to corner to stop)
+            pause: Pause after discrete moves (seconds)
+            backend: Output backend name or instance; pass the same instance
+                to several movers to share it
+            rate: Frames per second of tweened moves
+        """
+        self.backend = get_backend(backend)
+        self.backend.configure(failsafe=failsafe, pause=pause)
+        self.pause = pause
+        self.rate = rate
+
+        self.geometry = shared_geometry(self.backend)
+
+        self.logger = logging.getLogger(__name__)
+        self.events = EventLog(self.logger)
+
+    @property
+    def screen_width(self) -> int:
+        """Width of the virtual screen"""
+        return self.geometry.layout.width
+
+    @property
+    def screen_height(self) -> int:
+        """Height of the virtual screen"""
+        return self.geometry.layout.height
+
+    @property
+    def center_x(self) -> int:
+        """X coordinate of the screen center"""
+        return self.geometry.layout.width // 2
+
+    @property
+    def center_y(self) -> int:
+        """Y coordinate of the screen center"""
+        return self.geometry.layout.height // 2
+
+    @property
+    def lock(self) -> asyncio.Lock:
+        """Lock serializing paths on this mover's display in the running loop"""
+        return backend_lock(self.backend)
+
+    def get_current_position(self) -> Tuple[int, int]:
+        """Get current cursor position"""
+        return self.backend.position()
+
+    async def _play(self, path: Path, rate: float):
+        """Send one point per frame, coalescing frames that are late"""
+        coordinates = path.tolist()
+        frames = len(coordinates)
+        period = 1.0 / rate
+        backend = self.backend
+        loop = asyncio.get_running_loop()
+
+        async with self.lock:
+            start = loop.time()
+            index = 0
+            while index < frames:
+                delay = start + index * period - loop.time()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                else:
+                    index = min(int((loop.time() - start) / period), frames - 1)
+                    # Still give other tasks (and cancellation) a turn
+                    await asyncio.sleep(0)
+
+                if backend.failsafe:
+                    backend.check_failsafe()
+                x, y = coordinates[index]
+                backend.warp(x, y)
+                index += 1
+
+    async def _run(self, event: str, path: Path, rate: float) -> bool:
+        """Play path with the error handling shared by all movements"""
+        try:
+            await self._play(path, rate)
+            return True
+        except asyncio.CancelledError:
+            self.events.info(f"{event}.cancelled")
+            raise
+        except FailSafeError as e:
+            self.events.warning(f"{event}.stopped", reason=e)
+            return False
+        except Exception as e:
+            self.events.error(f"{event}.error", error=e)
+            return False
+
+    def _filter(self, points: Iterable) -> Path:
+        path, _, report = self.geometry.filter(points)
+        if report.rejected:
+            self.events.warning(
+                "path.skipped",
+                rejected=report.rejected,
+                total=report.total,
+                first=report.first_rejected,
+            )
+        return path
+
+    async def move_to_position(self, x: int, y: int, duration: float = 1.0) -> bool:
+        """
+        Smoothly move cursor to specified position
+
+        Args:
+            x: X coordinate
+            y: Y coordinate
+            duration: Movement duration in seconds
+
+        Returns:
+            True if movement successful, False if error
+        """
+        if not self.geometry.validate(x, y):
+            self.events.error("move.invalid", x=x, y=y)
+            return False
+
+        start_x, start_y = self.get_current_position()
+        frames = max(int(duration * self.rate), 1)
+        share = np.arange(1, frames + 1) / frames
+        xy = np.column_stack(
+            (start_x + (x - start_x) * share, start_y + (y - start_y) * share)
+        )
+
+        rate = frames / duration if duration > 0 else self.rate
+        result = await self._run("move", Path(np.rint(xy)), rate)
+        if self.pause > 0:
+            await asyncio.sleep(self.pause)
+        return result
+
+    async def move_smooth_path(
+        self, points: Iterable, duration_per_point: float = 0.05
+    ) -> bool:
+        """
+        Move along path, one point every duration_per_point seconds
+
+        Args:
+            points: Path, (N, 2) array or iterable of points
+            duration_per_point: Time per point in seconds
+
+        Returns:
+            True if movement successful, False if error
+        """
+        if duration_per_point <= 0:
+            self.events.error("path.invalid", duration_per_point=duration_per_point)
+            return False
+
+        path = self._filter(points)
+        self.events.info("path.start", points=len(path))
+        return await self._run("path", path, 1.0 / duration_per_point)
+
+    async def move_in_circle(
+        self,
+        center_x: int,
+        center_y: int,
+        radius: int = 100,
+        steps: int = 50,
+        clockwise: bool = True,
+        duration_per_point: float = 0.02,
+    ) -> bool:
+        """
+        Move cursor in a circle
+
+        Args:
+            center_x: X coordinate of circle center
+            center_y: Y coordinate of circle center
+            radius: Circle radius
+            steps: Number of steps for complete circle
+            clockwise: Clockwise movement
+            duration_per_point: Time per step in seconds
+        """
+        if duration_per_point <= 0:
+            self.events.error("circle.invalid", duration_per_point=duration_per_point)
+            return False
+
+        cosines, sines = cos_sin(np.arange(steps + 1), steps)
+        if not clockwise:
+            sines = -sines
+
+        points = Path.from_xy(center_x + radius * cosines, center_y + radius * sines)
+        return await self._run("circle", self._filter(points), 1.0 / duration_per_point)
+
+    async def shake_cursor(
+        self, duration: float = 2.0, intensity: int = 50, seed: Optional[int] = None
+    ) -> bool:
+        """
+        Shake cursor with random movements, then return to the start
+
+        Args:
+            duration: Shake duration in seconds
+            intensity: Shake intensity (maximum offset in pixels)
+            seed: Seed for reproducible shakes
+        """
+        origin_x, origin_y = self.get_current_position()
+        frames = max(int(duration / SHAKE_INTERVAL), 1)
+        offsets = np.random.default_rng(seed).integers(
+            -intensity, intensity, size=(frames, 2), endpoint=True
+        )
+        points = np.vstack((offsets + (origin_x, origin_y), [(origin_x, origin_y)]))
+        path, _, _ = self.geometry.filter(points)
+        return await self._run("shake", path, 1.0 / SHAKE_INTERVAL)
@@ -0,0 +1,130 @@
+"""
+Built-in pattern factories loaded through the pattern registry
+
+Every factory takes a PatternContext and keyword parameters; parameters
+left as None are derived from the context size.
+"""
+
+from typing import Optional
+
+from .path import Path
+from .patterns import PatternGenerator
+from .registry import PatternContext
+from .resample import resample_by_arc_length
+from .templates import template_cache
+
+
+def circle(context: PatternContext, clockwise: bool = True) -> Path:
+    """Circle with radius equal to the size"""
+    return template_cache.place(
+        "circle",
+        context.center_x,
+        context.center_y,
+        context.size,
+        steps=100,
+        clockwise=clockwise,
+    )
+
+
+def square(context: PatternContext) -> Path:
+    """Square centered on the screen"""
+    start_x = context.center_x - context.size // 2
+    start_y = context.center_y - context.size // 2
+    return template_cache.place("square", start_x, start_y, context.size)
+
+
+def triangle(context: PatternContext) -> Path:
+    """Equilateral triangle"""
+    return PatternGenerator.generate_triangle_points(
+        context.center_x, context.center_y, context.size
+    )
+
+
+def star(
+    context: PatternContext, inner_radius: Optional[int] = None, points: int = 5
+) -> Path:
+    """Star with outer radius equal to the size"""
+    if inner_radius is None:
+        inner_radius = context.size // 2
+    return template_cache.place(
+        "star",
+        context.center_x,
+        context.center_y,
+        1,
+        points=points,
+        outer_radius=context.size,
+        inner_radius=int(inner_radius),
+    )
+
+
+def spiral(context: PatternContext, turns: int = 3) -> Path:
+    """Spiral growing to the size, resampled to constant speed"""
+    points = template_cache.place(
+        "spiral",
+        context.center_x,
+        context.center_y,
+        context.size,
+        steps=50,
+        turns=turns,
+    )
+    return resample_by_arc_length(points)
+
+
+def heart(context: PatternContext) -> Path:
+    """Heart about the size wide, resampled to constant speed"""
+    scale = max(context.size // 30, 1)
+    points = template_cache.place(
+        "heart", context.center_x, context.center_y, scale, steps=100
+    )
+    return resample_by_arc_length(points)
+
+
+def sine_wave(
+    context: PatternContext,
+    amplitude: Optional[int] = None,
+    frequency: float = 2.0,
+) -> Path:
+    """Horizontal sine wave as long as the size, with a quarter of it as amplitude"""
+    if amplitude is None:
+        amplitude = context.size // 4
+    start_x = context.center_x - context.size // 2
+    return template_cache.place(
+        "sine_wave",
+        start_x,
+        context.center_y,
+        context.size,
+        amplitude,
+        steps=100,
+        frequency=frequency,
+    )
+
+
+def figure_eight(context: PatternContext, height: Optional[int] = None) -> Path:
+    """Figure eight as wide as the size, resampled to constant speed"""
+    if height is None:
+        height = context.size // 2
+    points = template_cache.place(
+        "figure_eight",
+        context.center_x,
+        context.center_y,
+        context.size,
+        height,
+        steps=100,
+    )
+    return resample_by_arc_length(points)
+
+
+def random_walk(
+    context: PatternContext, steps: int = 20, max_step: Optional[int] = None
+) -> Path:
+    """Random walk from the cursor, reflecting off the screen edges"""
+    if max_step is None:
+        max_step = context.size // 3
+    return PatternGenerator.generate_random_walk(
+        context.cursor_x,
+        context.cursor_y,
+        steps,
+        max_step,
+        bounds=(context.screen_width, context.screen_height),
+        boundary="reflect",
+    )
@@ -0,0 +1,379 @@
+"""
+Lazy pattern composition algebra
+
+Expressions are built from leaves (point sequences or generator calls) with
+concat (``+``), repeat (``*``), reverse, mirror, rotate, translate, scale and
+time-stretch nodes. Nothing is evaluated until the expression is iterated,
+and evaluation streams fixed-size chunks, so repeating a pattern N times
+costs O(1) extra memory and never regenerates it. Reversal is pushed down
+to the leaves, which are read backwards in place, so it streams too.
+"""
+
+import math
+import numbers
+from typing import Callable, Iterable, Iterator, Optional, Tuple, Union
+
+import numpy as np
+
+from .path import Path
+
+CHUNK_SIZE = 1024
+
+# A chunk is (points as float (k, 2), per-point time weights (k,))
+Chunk = Tuple[np.ndarray, np.ndarray]
+About = Optional[Tuple[float, float]]
+
+
+class PatternExpr:
+    """Base class for lazy pattern expressions"""
+
+    def chunks(self) -> Iterator[Chunk]:
+        """
+        Stream the expression as chunks
+
+        Returns:
+            Iterator of (points, time weights) pairs
+        """
+        raise NotImplementedError
+
+    def reversed_chunks(self) -> Iterator[Chunk]:
+        """
+        Stream the expression backwards as chunks
+
+        Built-in nodes reverse their children lazily; this fallback for other
+        expressions evaluates them in full first.
+
+        Returns:
+            Iterator of (points, time weights) pairs, last point first
+        """
+        for xy, weights in reversed(list(self.chunks())):
+            yield xy[::-1], weights[::-1]
+
+    def __len__(self) -> int:
+        raise NotImplementedError
+
+    def __iter__(self) -> Iterator[Tuple[int, int]]:
+        for xy, _ in self.chunks():
+            yield from map(tuple, np.rint(xy).astype(np.int64).tolist())
+
+    def iter_timed(
+        self, duration_per_point: float = 0.05
+    ) -> Iterator[Tuple[int, int, float]]:
+        """
+        Stream points with their durations, applying time-stretch nodes
+
+        Args:
+            duration_per_point: Base time to move to each point
+
+        Returns:
+            Iterator of (x, y, duration) tuples
+        """
+        for xy, weights in self.chunks():
+            xy = np.rint(xy).astype(np.int64).tolist()
+            durations = (weights * duration_per_point).tolist()
+            for (x, y), duration in zip(xy, durations):
+                yield x, y, duration
+
+    def materialize(self) -> Path:
+        """Evaluate the whole expression into a Path"""
+        return Path.concat(*(np.rint(xy) for xy, _ in self.chunks()))
+
+    def center(self) -> Tuple[float, float]:
+        """
+        Get center of the expression's bounding box (one streaming pass)
+
+        Returns:
+            Tuple of (center_x, center_y)
+        """
+        low = np.full(2, np.inf)
+        high = np.full(2, -np.inf)
+        for xy, _ in self.chunks():
+            if len(xy):
+                low = np.minimum(low, xy.min(axis=0))
+                high = np.maximum(high, xy.max(axis=0))
+        if not np.isfinite(low).all():
+            return 0.0, 0.0
+        center = (low + high) / 2
+        return float(center[0]), float(center[1])
+
+    def __add__(self, other) -> "PatternExpr":
+        return Concat(self, pattern(other))
+
+    def __radd__(self, other) -> "PatternExpr":
+        return Concat(pattern(other), self)
+
+    def __mul__(self, times: int) -> "PatternExpr":
+        if not isinstance(times, numbers.Integral) or isinstance(times, bool):
+            return NotImplemented
+        return Repeat(self, int(times))
+
+    __rmul__ = __mul__
+
+    def repeat(self, times: int) -> "PatternExpr":
+        """Repeat expression a number of times"""
+        return Repeat(self, times)
+
+    def reverse(self) -> "PatternExpr":
+        """Traverse expression backwards"""
+        return Reverse(self)
+
+    def translate(self, dx: float, dy: float) -> "PatternExpr":
+        """Shift expression by (dx, dy) pixels"""
+        return Affine(self, np.eye(2), offset=(dx, dy))
+
+    def scale(
+        self, sx: float, sy: Optional[float] = None, about: About = None
+    ) -> "PatternExpr":
+        """
+        Scale expression
+
+        Args:
+            sx: Horizontal scale factor
+            sy: Vertical scale factor (defaults to sx)
+            about: Fixed point (defaults to the bounding box center)
+        """
+        if sy is None:
+            sy = sx
+        return Affine(self, np.diag([sx, sy]), about=about)
+
+    def rotate(self, degrees: float, about: About = None) -> "PatternExpr":
+        """
+        Rotate expression (clockwise on screen, where Y points down)
+
+        Args:
+            degrees: Rotation angle in degrees
+            about: Rotation center (defaults to the bounding box center)
+        """
+        angle = math.radians(degrees)
+        cos, sin = math.cos(angle), math.sin(angle)
+        return Affine(self, np.array([[cos, -sin], [sin, cos]]), about=about)
+
+    def mirror(self, axis: str = "x", about: About = None) -> "PatternExpr":
+        """
+        Mirror expression
+
+        Args:
+            axis: "x" flips X coordinates (left-right), "y" flips Y (up-down)
+            about: Mirror center (defaults to the bounding box center)
+        """
+        if axis not in ("x", "y"):
+            raise ValueError(f"Unknown mirror axis: {axis}")
+        matrix = np.diag([-1.0, 1.0] if axis == "x" else [1.0, -1.0])
+        return Affine(self, matrix, about=about)
+
+    def stretch(self, factor: float) -> "PatternExpr":
+        """
+        Stretch expression in time
+
+        Args:
+            factor: Duration multiplier (2.0 plays twice as slow)
+        """
+        return Stretch(self, factor)
+
+
+class Points(PatternExpr):
+    """Leaf holding an already generated path"""
+
+    def __init__(self, points: Union[Path, np.ndarray, Iterable]):
+        """
+        Initialize Points
+
+        Args:
+            points: Path, (N, 2) array or iterable of points
+        """
+        self.path = Path(points)
+
+    def __len__(self) -> int:
+        return len(self.path)
+
+    def chunks(self, backwards: bool = False) -> Iterator[Chunk]:
+        data = self.path.array
+        starts = range(0, len(data), CHUNK_SIZE)
+        for start in reversed(starts) if backwards else starts:
+            xy = data[start : start + CHUNK_SIZE].astype(float)
+            if backwards:
+                xy = xy[::-1]
+            yield xy, np.ones(len(xy))
+
+    def reversed_chunks(self) -> Iterator[Chunk]:
+        return self.chunks(backwards=True)
+
+
+class Generated(Points):
+    """Leaf evaluating a generator call once, on first use"""
+
+    def __init__(self, factory: Callable[..., Iterable], *args, **kwargs):
+        """
+        Initialize Generated
+
+        Args:
+            factory: Function returning points (e.g. a PatternGenerator method)
+            *args: Positional arguments for the factory
+            **kwargs: Keyword arguments for the factory
+        """
+        self.factory = factory
+        self.args = args
+        self.kwargs = kwargs
+        self._path: Optional[Path] = None
+
+    @property
+    def path(self) -> Path:
+        if self._path is None:
+            self._path = Path(self.factory(*self.args, **self.kwargs))
+        return self._path
+
+
+class Concat(PatternExpr):
+    """Expressions played one after another"""
+
+    def __init__(self, *parts: PatternExpr):
+        # Flatten nested concatenations to keep the tree shallow
+        self.parts = []
+        for part in parts:
+            self.parts.extend(part.parts if isinstance(part, Concat) else [part])
+
+    def __len__(self) -> int:
+        return sum(len(part) for part in self.parts)
+
+    def chunks(self) -> Iterator[Chunk]:
+        for part in self.parts:
+            yield from part.chunks()
+
+    def reversed_chunks(self) -> Iterator[Chunk]:
+        for part in reversed(self.parts):
+            yield from part.reversed_chunks()
+
+
+class Repeat(PatternExpr):
+    """Expression played several times"""
+
+    def __init__(self, child: PatternExpr, times: int):
+        if times < 0:
+            raise ValueError("times must not be negative")
+        self.child = child
+        self.times = times
+
+    def __len__(self) -> int:
+        return len(self.child) * self.times
+
+    def chunks(self) -> Iterator[Chunk]:
+        for _ in range(self.times):
+            yield from self.child.chunks()
+
+    def reversed_chunks(self) -> Iterator[Chunk]:
+        for _ in range(self.times):
+            yield from self.child.reversed_chunks()
+
+
+class Reverse(PatternExpr):
+    """Expression played backwards
+
+    The reversal is passed down to the leaves, which are read backwards in
+    place, so nothing is buffered.
+    """
+
+    def __init__(self, child: PatternExpr):
+        self.child = child
+
+    def __len__(self) -> int:
+        return len(self.child)
+
+    def chunks(self) -> Iterator[Chunk]:
+        return self.child.reversed_chunks()
+
+    def reversed_chunks(self) -> Iterator[Chunk]:
+        return self.child.chunks()
+
+
+class Affine(PatternExpr):
+    """Expression transformed by p' = matrix @ p + offset"""
+
+    def __init__(
+        self,
+        child: PatternExpr,
+        matrix: np.ndarray,
+        offset: Optional[Tuple[float, float]] = None,
+        about: About = None,
+    ):
+        """
+        Initialize Affine
+
+        Args:
+            child: Expression to transform
+            matrix: 2x2 linear part
+            offset: Explicit translation; if None the transform keeps the
+                point `about` fixed
+            about: Fixed point (bounding box center of child if None,
+                resolved on first evaluation)
+        """
+        self.child = child
+        self.matrix = np.asarray(matrix, dtype=float)
+        self.offset = None if offset is None else np.asarray(offset, dtype=float)
+        self.about = about
+
+    def __len__(self) -> int:
+        return len(self.child)
+
+    def _resolve_offset(self) -> np.ndarray:
+        if self.offset is None:
+            about = self.about if self.about is not None else self.child.center()
+            about = np.asarray(about, dtype=float)
+            self.offset = about - self.matrix @ about
+        return self.offset
+
+    def chunks(self) -> Iterator[Chunk]:
+        offset = self._resolve_offset()
+        transposed = self.matrix.T
+        for xy, weights in self.child.chunks():
+            yield xy @ transposed + offset, weights
+
+    def reversed_chunks(self) -> Iterator[Chunk]:
+        offset = self._resolve_offset()
+        transposed = self.matrix.T
+        for xy, weights in self.child.reversed_chunks():
+            yield xy @ transposed + offset, weights
+
+
+class Stretch(PatternExpr):
+    """Expression with durations multiplied by a factor"""
+
+    def __init__(self, child: PatternExpr, factor: float):
+        if factor <= 0:
+            raise ValueError("factor must be positive")
+        self.child = child
+        self.factor = factor
+
+    def __len__(self) -> int:
+        return len(self.child)
+
+    def chunks(self) -> Iterator[Chunk]:
+        for xy, weights in self.child.chunks():
+            yield xy, weights * self.factor
+
+    def reversed_chunks(self) -> Iterator[Chunk]:
+        for xy, weights in self.child.reversed_chunks():
+            yield xy, weights * self.factor
+
+
+def pattern(source, *args, **kwargs) -> PatternExpr:
+    """
+    Wrap points or a generator call as a pattern expression
+
+    Args:
+        source: Expression, points (Path, array, list) or a callable
+        *args: Arguments for the callable
+        **kwargs: Keyword arguments for the callable
+
+    Returns:
+        PatternExpr
+
+    Example:
+        >>> star = pattern(PatternGenerator.generate_star_points, 500, 500, 100, 50)
+        >>> scenario = star * 10_000 + star.rotate(36).stretch(2)
+        >>> mover.move_timed_path(scenario.iter_timed(0.05))
+    """
+    if isinstance(source, PatternExpr):
+        return source
+    if callable(source):
+        return Generated(source, *args, **kwargs)
+    return Points(source)
@@ -0,0 +1,324 @@
+"""
+Single-owner motion queue
+
+One worker thread owns the cursor and runs commands from a priority queue,
+so callers on any thread never interleave moves. Queued absolute moves of
+the same priority are coalesced (the latest target wins), and a command of
+higher priority stops a running lower-priority path at its next frame.
+"""
+
+import heapq
+import inspect
+import itertools
+import logging
+import threading
+import time
+from concurrent.futures import Future
+from enum import IntEnum
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+from .stop_token import StopToken
+
+
+class Priority(IntEnum):
+    """Command priority; lower values run first"""
+
+    HIGH = 0
+    NORMAL = 1
+    LOW = 2
+
+
+class MotionMetrics(NamedTuple):
+    """Snapshot of the queue counters"""
+
+    # Every request counts once: submitted = completed + coalesced +
+    # cancelled + depth, plus one while a command is running
+    submitted: int
+    # Commands that ran, including ones stopped by preemption
+    completed: int
+    # Moves replaced by a later queued move before they started
+    coalesced: int
+    preempted: int
+    # Commands dropped by cancel_all or cancelled through their future
+    # before they started
+    cancelled: int
+    # Commands waiting in the queue now, and the most ever waiting
+    depth: int
+    max_depth: int
+    # Time between submit and start of the started commands (seconds)
+    mean_wait: float
+    max_wait: float
+
+
+class _Command:
+    """Queued call with its result future and stop token"""
+
+    __slots__ = (
+        "func",
+        "args",
+        "kwargs",
+        "priority",
+        "future",
+        "token",
+        "stoppable",
+        "queued_at",
+    )
+
+    def __init__(self, func: Callable, args: tuple, kwargs: dict, priority: int):
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+        self.priority = priority
+        self.future: Future = Future()
+
+        # Calls taking a stop_token get the command's token (or keep their
+        # own), so preemption can stop them at the next frame
+        token = kwargs.get("stop_token")
+        if token is None and _accepts_stop_token(func):
+            token = kwargs["stop_token"] = StopToken()
+        self.stoppable = isinstance(token, StopToken)
+        self.token = token if self.stoppable else StopToken()
+        # Lets the caller read halted_at to resume a preempted path
+        self.future.stop_token = self.token
+        self.queued_at = time.perf_counter()
+
+
+def _accepts_stop_token(func: Callable) -> bool:
+    """Whether func takes a stop_token keyword"""
+    try:
+        return "stop_token" in inspect.signature(func).parameters
+    except (TypeError, ValueError):
+        return False
+
+
+class MotionService:
+    """Runs MouseMover commands one at a time on a worker thread"""
+
+    def __init__(self, mover, start: bool = True):
+        """
+        Initialize MotionService
+
+        Args:
+            mover: MouseMover owned by the service
+            start: Start the worker thread right away
+        """
+        self.mover = mover
+        self.logger = logging.getLogger(__name__)
+
+        self._queue: List[Tuple[int, int, _Command]] = []
+        self._sequence = itertools.count()
+        # Pending absolute move per priority, for coalescing
+        self._pending_moves: Dict[int, _Command] = {}
+        self._current: Optional[_Command] = None
+        self._condition = threading.Condition()
+        self._closed = False
+        self._thread: Optional[threading.Thread] = None
+
+        self._submitted = 0
+        self._completed = 0
+        self._coalesced = 0
+        self._preempted = 0
+        self._cancelled = 0
+        self._max_depth = 0
+        self._started = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+
+        if start:
+            self.start()
+
+    def start(self):
+        """Start the worker thread"""
+        with self._condition:
+            if self._thread is not None:
+                return
+            self._closed = False
+            self._thread = threading.Thread(
+                target=self._worker, name="motion-service", daemon=True
+            )
+            self._thread.start()
+
+    def submit(
+        self,
+        func: Callable[..., Any],
+        *args,
+        priority: int = Priority.NORMAL,
+        **kwargs,
+    ) -> Future:
+        """
+        Queue a call on the worker thread
+
+        Functions taking a ``stop_token`` keyword get the command's token,
+        so a higher-priority command can stop them at the next frame. The
+        token is available as ``future.stop_token``; its ``halted_at`` is
+        the index to resume a preempted path from with ``start_index``.
+
+        Args:
+            func: Callable to run, usually a MouseMover method
+            *args: Positional arguments of func
+            priority: Priority of the command
+            **kwargs: Keyword arguments of func
+
+        Returns:
+            Future resolved with the return value of func
+        """
+        command = _Command(func, args, kwargs, priority)
+        with self._condition:
+            self._enqueue(command)
+        return command.future
+
+    def move_to(
+        self, x: int, y: int, duration: float = 1.0, priority: int = Priority.NORMAL
+    ) -> Future:
+        """
+        Queue an absolute move; replaces a queued move of the same priority
+
+        Args:
+            x: X coordinate
+            y: Y coordinate
+            duration: Movement duration in seconds
+            priority: Priority of the command
+
+        Returns:
+            Future of the move (shared with coalesced moves)
+        """
+        with self._condition:
+            pending = self._pending_moves.get(priority)
+            if pending is not None:
+                pending.args = (x, y, duration)
+                self._submitted += 1
+                self._coalesced += 1
+                return pending.future
+
+            command = _Command(
+                self.mover.move_to_position, (x, y, duration), {}, priority
+            )
+            self._pending_moves[priority] = command
+            self._enqueue(command)
+        return command.future
+
+    def _enqueue(self, command: _Command):
+        """Push command and preempt a running lower-priority one"""
+        if self._closed:
+            raise RuntimeError("MotionService is shut down")
+
+        heapq.heappush(self._queue, (command.priority, next(self._sequence), command))
+        self._submitted += 1
+        self._max_depth = max(self._max_depth, len(self._queue))
+
+        current = self._current
+        if current is not None and command.priority < current.priority:
+            # Commands ignoring the token run to the end; not a preemption
+            if current.stoppable and not current.token.stopped:
+                current.token.stop("preempted")
+                self._preempted += 1
+        self._condition.notify()
+
+    def cancel_all(self, reason: str = "cancelled") -> int:
+        """
+        Drop queued commands and stop the running one
+
+        Args:
+            reason: Stop reason passed to the running command
+
+        Returns:
+            Number of dropped queued commands
+        """
+        with self._condition:
+            dropped = [command for _, _, command in self._queue]
+            self._queue.clear()
+            self._pending_moves.clear()
+            self._cancelled += len(dropped)
+            if self._current is not None:
+                self._current.token.stop(reason)
+
+        for command in dropped:
+            command.future.cancel()
+        return len(dropped)
+
+    def shutdown(self, wait: bool = True, timeout: Optional[float] = None):
+        """
+        Cancel queued commands, stop accepting new ones and end the worker
+
+        Args:
+            wait: Wait for the worker to exit
+            timeout: Maximum time to wait in seconds
+        """
+        self.cancel_all("shutdown")
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+            thread = self._thread
+            self._thread = None
+        if wait and thread is not None:
+            thread.join(timeout)
+
+    @property
+    def depth(self) -> int:
+        """Commands waiting in the queue"""
+        return len(self._queue)
+
+    @property
+    def busy(self) -> bool:
+        """Whether a command is running or waiting"""
+        return self._current is not None or bool(self._queue)
+
+    def metrics(self) -> MotionMetrics:
+        """Snapshot of the queue depth, wait times and counters"""
+        with self._condition:
+            return MotionMetrics(
+                submitted=self._submitted,
+                completed=self._completed,
+                coalesced=self._coalesced,
+                preempted=self._preempted,
+                cancelled=self._cancelled,
+                depth=len(self._queue),
+                max_depth=self._max_depth,
+                mean_wait=self._total_wait / self._started if self._started else 0.0,
+                max_wait=self._max_wait,
+            )
+
+    def _next(self) -> Optional[_Command]:
+        """Wait for the next command; None when shut down"""
+        with self._condition:
+            while not self._queue and not self._closed:
+                self._condition.wait()
+            if not self._queue:
+                return None
+
+            _, _, command = heapq.heappop(self._queue)
+            if self._pending_moves.get(command.priority) is command:
+                del self._pending_moves[command.priority]
+
+            wait = time.perf_counter() - command.queued_at
+            self._started += 1
+            self._total_wait += wait
+            self._max_wait = max(self._max_wait, wait)
+            self._current = command
+            return command
+
+    def _worker(self):
+        """Run commands until shutdown"""
+        while True:
+            command = self._next()
+            if command is None:
+                return
+
+            ran = False
+            try:
+                if command.future.set_running_or_notify_cancel():
+                    ran = True
+                    try:
+                        result = command.func(*command.args, **command.kwargs)
+                    except BaseException as e:
+                        self.logger.error(f"Motion command failed: {e}")
+                        command.future.set_exception(e)
+                    else:
+                        command.future.set_result(result)
+            finally:
+                with self._condition:
+                    self._current = None
+                    if ran:
+                        self._completed += 1
+                    else:
+                        self._cancelled += 1
@@ -2,45 +2,164 @@
 Core MouseMover module for mouse cursor control
 """
 
-import pyautogui
 import time
-import math
 import logging
-from typing import Tuple
-from ..utils.helpers import validate_coordinates
+import threading
+import numpy as np
+from contextlib import contextmanager
+from itertools import islice
+from typing import Callable, Iterable, Iterator, Optional, Set, Tuple, Union
+from .path import Path
+from .playback import PlaybackReport, PlaybackScheduler
+from .stop_token import StopToken
+from .trajectory import TrajectoryPlanner
+from .trig import cos_sin
+from ..backends import MouseBackend, get_backend
+from ..utils.events import EventLog
+from ..utils.helpers import BoundsReport
+from ..utils.metrics import MoverMetrics
+from ..utils.screen import shared_geometry
+from ..utils.tracing import Tracer, tracer as default_tracer
+
+# Points read ahead from unsized streams for one bounds check
+STREAM_FILTER_CHUNK = 256
+
+# Time between shake movements (seconds)
+SHAKE_INTERVAL = 0.05
+
+# Log only every Nth invalid sample of a timed path
+INVALID_POINT_LOG_EVERY = 100
+
+
+class _SkipSummary:
+    """Rejected points of a path checked chunk by chunk, logged once"""
+
+    __slots__ = ("total", "rejected", "first")
+
+    def __init__(self):
+        self.total = 0
+        self.rejected = 0
+        self.first: Optional[int] = None
+
+    def add(self, report: BoundsReport, offset: int):
+        self.total += report.total
+        self.rejected += report.rejected
+        if self.first is None and report.first_rejected is not None:
+            self.first = offset + report.first_rejected
+
+    def log(self, events: EventLog):
+        if self.rejected:
+            events.warning(
+                "path.skipped",
+                rejected=self.rejected,
+                total=self.total,
+                first=self.first,
+            )
 
 
 class MouseMover:
     """Class for controlling mouse cursor movement"""
 
-    def __init__(self, failsafe: bool = True, pause: float = 0.1):
+    def __init__(
+        self,
+        failsafe: bool = True,
+        pause: float = 0.1,
+        backend: Union[str, MouseBackend, None] = None,
+        metrics: bool = False,
+        tracer: Optional[Tracer] = None,
+    ):
         """
         Initialize MouseMover
 
         Args:
             failsafe: Enable safe mode (move to corner to stop)
             pause: Pause between commands (seconds)
+            backend: Output backend name ("pyautogui", "xlib", "memory") or
+                instance; defaults to pyautogui
+            metrics: Collect movement counters and backend latencies
+            tracer: Tracer for spans of path preprocessing and backend calls
+                (defaults to the shared ``utils.tracing.tracer``)
         """
-        pyautogui.FAILSAFE = failsafe
-        pyautogui.PAUSE = pause
+        self.backend = get_backend(backend)
+        self.backend.configure(failsafe=failsafe, pause=pause)
 
-        self.screen_width, self.screen_height = pyautogui.size()
-        self.center_x = self.screen_width // 2
-        self.center_y = self.screen_height // 2
+        # Monitor layout shared with every user of the same screen
+        self.geometry = shared_geometry(self.backend)
 
-        # Setup logging
-        logging.basicConfig(level=logging.INFO)
-        self.logger = logging.getLogger(__name__)
+        self.planner = TrajectoryPlanner()
+        self.last_playback: Optional[PlaybackReport] = None
+
+        # Tokens of running movements, stopped by emergency_stop
+        self._active_tokens: Set[StopToken] = set()
+        self._tokens_lock = threading.Lock()
 
-        self.logger.info(
-            f"MouseMover initialized. "
-            f"Screen size: {self.screen_width}x{self.screen_height}"
+        # Logging is configured by the application, not the library
+        self.logger = logging.getLogger(__name__)
+        self.events = EventLog(self.logger)
+        self.metrics = MoverMetrics(enabled=metrics)
+        self.tracer = default_tracer if tracer is None else tracer
+
+        self.events.info(
+            "mover.init",
+            backend=self.backend.name,
+            screen=self.geometry.layout[:2],
         )
 
+    @property
+    def screen_width(self) -> int:
+        """Width of the virtual screen"""
+        return self.geometry.layout.width
+
+    @property
+    def screen_height(self) -> int:
+        """Height of the virtual screen"""
+        return self.geometry.layout.height
+
+    @property
+    def center_x(self) -> int:
+        """X coordinate of the screen center"""
+        return self.geometry.layout.width // 2
+
+    @property
+    def center_y(self) -> int:
+        """Y coordinate of the screen center"""
+        return self.geometry.layout.height // 2
+
     def get_current_position(self) -> Tuple[int, int]:
         """Get current cursor position"""
-        pos = pyautogui.position()
-        return pos.x, pos.y
+        return self.backend.position()
+
+    def _mover(self, call: Optional[Callable[..., None]] = None) -> Callable[..., None]:
+        """
+        Pick the per-point backend call once per movement
+
+        Args:
+            call: Backend method (defaults to backend.move_to)
+
+        Returns:
+            The method itself, or a wrapper while metrics or tracing are on
+        """
+        call = call or self.backend.move_to
+        name = f"backend.{call.__name__}"
+        if self.metrics.enabled:
+            call = self.metrics.timed(call)
+        if self.tracer.enabled:
+            call = self.tracer.wrap(call, name)
+        return call
+
+    def _error(self, event: str, error: Exception) -> bool:
+        """Log a failed movement and count it"""
+        if self.metrics.enabled:
+            self.metrics.errors += 1
+        self.events.error(event, error=error)
+        return False
+
+    def _invalid(self, x: int, y: int) -> bool:
+        """Log a rejected target and count it as a skipped point"""
+        if self.metrics.enabled:
+            self.metrics.skipped_points += 1
+        self.events.error("move.invalid", x=x, y=y)
+        return False
 
     def move_to_position(self, x: int, y: int, duration: float = 1.0) -> bool:
         """
@@ -55,17 +174,69 @@ class MouseMover:
             True if movement successful, False if error
         """
         try:
-            if not validate_coordinates(x, y, self.screen_width, self.screen_height):
-                self.logger.error(f"Invalid coordinates: ({x}, {y})")
-                return False
+            if not self.geometry.validate(x, y):
+                return self._invalid(x, y)
+
+            self.events.info("move.start", x=x, y=y, duration=duration)
+            self._mover()(x, y, duration=duration)
+            return True
+
+        except Exception as e:
+            return self._error("move.error", e)
+
+    def move_human_like(
+        self,
+        x: int,
+        y: int,
+        planner: Optional[TrajectoryPlanner] = None,
+        stop_token: Optional[StopToken] = None,
+    ) -> bool:
+        """
+        Move cursor to position along a human-like trajectory
+
+        The move follows a minimum-jerk profile with a Fitts' law duration,
+        plus any overshoot and corrections the planner is configured for.
+        Samples are sent at their planned times on an absolute clock; the
+        timing report is kept in ``last_playback``.
+
+        Args:
+            x: X coordinate
+            y: Y coordinate
+            planner: Trajectory planner (defaults to a plain minimum-jerk one)
+            stop_token: Token checked before every sample
+
+        Returns:
+            True if movement successful, False if error
+        """
+        try:
+            if not self.geometry.validate(x, y):
+                return self._invalid(x, y)
 
-            self.logger.info(f"Moving to position ({x}, {y})")
-            pyautogui.moveTo(x, y, duration=duration)
+            planner = planner or self.planner
+            trajectory = planner.plan_one(self.get_current_position(), (x, y))
+
+            self.events.info(
+                "human.start", x=x, y=y, duration=float(trajectory.durations[0])
+            )
+
+            # The first sample is the start point the cursor is already at
+            path, times = trajectory.move(0)
+            path, kept = self._filter_indexed(path[1:])
+            scheduler = PlaybackScheduler(self.backend)
+            with self._operation(stop_token) as token:
+                report = self.last_playback = scheduler.play(
+                    path,
+                    stop_token=token,
+                    warp=self._mover(self.backend.warp),
+                    times=times[1:][kept],
+                )
+
+            if report.halted_at is not None:
+                return self._halt(token, int(kept[report.halted_at]))
             return True
 
         except Exception as e:
-            self.logger.error(f"Error during movement: {e}")
-            return False
+            return self._error("human.error", e)
 
     def move_relative(
         self, x_offset: int, y_offset: int, duration: float = 1.0
@@ -86,8 +257,7 @@ class MouseMover:
             return self.move_to_position(new_x, new_y, duration)
 
         except Exception as e:
-            self.logger.error(f"Error during relative movement: {e}")
-            return False
+            return self._error("relative.error", e)
 
     def move_to_center(self, duration: float = 1.0) -> bool:
         """Move cursor to screen center"""
@@ -100,6 +270,8 @@ class MouseMover:
         radius: int = 100,
         steps: int = 50,
         clockwise: bool = True,
+        stop_token: Optional[StopToken] = None,
+        start_index: int = 0,
     ) -> bool:
         """
         Move cursor in a circle
@@ -110,33 +282,33 @@ class MouseMover:
             radius: Circle radius
             steps: Number of steps for complete circle
             clockwise: Clockwise movement
+            stop_token: Token checked before every step
+            start_index: Step to start from (e.g. a previous halted_at)
         """
         try:
-            self.logger.info(
-                f"Moving in circle: center ({center_x}, {center_y}), radius {radius}"
-            )
-
-            direction = 1 if clockwise else -1
-
-            for i in range(steps + 1):
-                angle = direction * 2 * math.pi * i / steps
-                x = int(center_x + radius * math.cos(angle))
-                y = int(center_y + radius * math.sin(angle))
-
-                if not validate_coordinates(
-                    x, y, self.screen_width, self.screen_height
-                ):
-                    continue
+            self.events.info("circle.start", center=(center_x, center_y), radius=radius)
 
-                pyautogui.moveTo(x, y, duration=0.02)
+            cosines, sines = cos_sin(np.arange(steps + 1), steps)
+            if not clockwise:
+                sines = -sines
 
-            return True
+            points = Path.from_xy(
+                center_x + radius * cosines, center_y + radius * sines
+            )
+            with self._operation(stop_token) as token:
+                return self._move_along(points, 0.02, token, start_index)
 
         except Exception as e:
-            self.logger.error(f"Error during circle movement: {e}")
-            return False
+            return self._error("circle.error", e)
 
-    def move_in_square(self, start_x: int, start_y: int, size: int = 200) -> bool:
+    def move_in_square(
+        self,
+        start_x: int,
+        start_y: int,
+        size: int = 200,
+        stop_token: Optional[StopToken] = None,
+        start_index: int = 0,
+    ) -> bool:
         """
         Move cursor in a square
 
@@ -144,11 +316,11 @@ class MouseMover:
             start_x: X coordinate of starting point
             start_y: Y coordinate of starting point
             size: Square side size
+            stop_token: Token checked before every side
+            start_index: Corner to start from (e.g. a previous halted_at)
         """
         try:
-            self.logger.info(
-                f"Moving in square: start ({start_x}, {start_y}), size {size}"
-            )
+            self.events.info("square.start", start=(start_x, start_y), size=size)
 
             points = [
                 (start_x, start_y),
@@ -158,87 +330,341 @@ class MouseMover:
                 (start_x, start_y),
             ]
 
-            for point in points:
-                if validate_coordinates(
-                    point[0], point[1], self.screen_width, self.screen_height
-                ):
-                    pyautogui.moveTo(point[0], point[1], duration=0.5)
-
-            return True
+            with self._operation(stop_token) as token:
+                return self._move_along(points, 0.5, token, start_index)
 
         except Exception as e:
-            self.logger.error(f"Error during square movement: {e}")
-            return False
+            return self._error("square.error", e)
 
-    def shake_cursor(self, duration: float = 2.0, intensity: int = 50) -> bool:
+    def shake_cursor(
+        self,
+        duration: float = 2.0,
+        intensity: int = 50,
+        stop_token: Optional[StopToken] = None,
+    ) -> bool:
         """
         Shake cursor with random movements
 
         Args:
             duration: Shake duration in seconds
             intensity: Shake intensity (maximum offset in pixels)
+            stop_token: Token checked before every movement; a stopped
+                shake does not return to the original position
         """
         try:
-            import random
+            self.events.info("shake.start", duration=duration, intensity=intensity)
+
+            move = self._mover()
+            start_time = time.time()
+            original_x, original_y = self.backend.position()
+            rng = np.random.default_rng()
+            # Enough offsets for the whole shake, drawn and checked at once
+            batch = int(duration / SHAKE_INTERVAL) + 1
+
+            moves = 0
+
+            with self._operation(stop_token) as token:
+                while time.time() - start_time < duration:
+                    offsets = rng.integers(
+                        -intensity, intensity, size=(batch, 2), endpoint=True
+                    )
+                    points = self._filter_points(
+                        offsets + (original_x, original_y), log=False
+                    )
+                    if not len(points):
+                        token.wait(SHAKE_INTERVAL)
+
+                    for x, y in points.tolist():
+                        if token.stopped:
+                            return self._halt(token, moves)
+                        if time.time() - start_time >= duration:
+                            break
+                        move(x, y, duration=SHAKE_INTERVAL)
+                        moves += 1
+                        token.wait(SHAKE_INTERVAL)
+
+                if token.stopped:
+                    return self._halt(token, moves)
+
+            # Return to original position
+            move(original_x, original_y, duration=0.3)
+            return True
 
-            self.logger.info(
-                f"Shaking cursor: duration {duration}s, intensity {intensity}"
+        except Exception as e:
+            return self._error("shake.error", e)
+
+    def move_smooth_path(
+        self,
+        points: Iterable,
+        duration_per_point: float = 0.5,
+        realtime: bool = False,
+        stop_token: Optional[StopToken] = None,
+        start_index: int = 0,
+    ) -> bool:
+        """
+        Smooth movement along specified path
+
+        Points are consumed in fixed-size chunks: arrays and Paths are
+        sliced, and any other iterable (generators, ``PatternGenerator.iter_*``,
+        pattern expressions) is streamed, so memory use does not grow with
+        the path length.
+
+        Args:
+            points: Path, (N, 2) array or any iterable of points [(x1, y1), ...]
+            duration_per_point: Time to move to each point
+            realtime: Play at exactly 1 / duration_per_point points per second
+                with the playback scheduler instead of tweening to each point;
+                duration_per_point must then be positive
+            stop_token: Token checked before every point
+            start_index: Index of the first point to move to (e.g. a previous
+                halted_at)
+        """
+        if realtime:
+            if duration_per_point <= 0:
+                self.events.error("path.invalid", duration_per_point=duration_per_point)
+                return False
+            return self.play_path(
+                points, 1.0 / duration_per_point, stop_token, start_index
             )
 
-            start_time = time.time()
-            original_pos = pyautogui.position()
+        try:
+            self.events.info(
+                "path.start",
+                points=len(points) if hasattr(points, "__len__") else "stream",
+            )
 
-            while time.time() - start_time < duration:
-                x_offset = random.randint(-intensity, intensity)
-                y_offset = random.randint(-intensity, intensity)
+            skipped = _SkipSummary()
+            with self._operation(stop_token) as token:
+                try:
+                    for offset, chunk in self._chunks(points, start_index):
+                        if not self._move_along(
+                            chunk, duration_per_point, token, 0, offset, skipped
+                        ):
+                            return False
+                    return True
+                finally:
+                    skipped.log(self.events)
 
-                new_x = original_pos.x + x_offset
-                new_y = original_pos.y + y_offset
+        except Exception as e:
+            return self._error("path.error", e)
 
-                if validate_coordinates(
-                    new_x, new_y, self.screen_width, self.screen_height
-                ):
-                    pyautogui.moveTo(new_x, new_y, duration=0.05)
+    @staticmethod
+    def _chunks(points: Iterable, start_index: int = 0) -> Iterator[Tuple[int, Path]]:
+        """
+        Split points into chunks of at most STREAM_FILTER_CHUNK points
 
-                time.sleep(0.05)
+        Args:
+            points: Path, array, list or any iterable of points
+            start_index: Index of the first point
 
-            # Return to original position
-            pyautogui.moveTo(original_pos.x, original_pos.y, duration=0.3)
+        Yields:
+            Tuples of (index of the chunk's first point, chunk)
+        """
+        if isinstance(points, (Path, np.ndarray, list, tuple)):
+            path = Path(points)
+            for offset in range(start_index, len(path), STREAM_FILTER_CHUNK):
+                yield offset, path[offset : offset + STREAM_FILTER_CHUNK]
+            return
+
+        offset = start_index
+        stream = islice(points, start_index, None)
+        for chunk in iter(lambda: list(islice(stream, STREAM_FILTER_CHUNK)), []):
+            yield offset, Path(chunk)
+            offset += len(chunk)
+
+    def _filter_indexed(
+        self,
+        points: Iterable,
+        log: bool = True,
+        skipped: Optional["_SkipSummary"] = None,
+        offset: int = 0,
+    ) -> Tuple[Path, np.ndarray]:
+        """
+        Drop off-screen points of a whole path in one check
+
+        Args:
+            points: Path, (N, 2) array or list of points
+            log: Log a summary of rejected points
+            skipped: Summary collecting rejected points of several chunks,
+                logged by the caller instead
+            offset: Index of points[0] in the caller's sequence
+
+        Returns:
+            Tuple of (path of on-screen points, their indices in the input)
+        """
+        with self.tracer.span("path.filter"):
+            path, kept, report = self.geometry.filter(points)
+        if skipped is not None:
+            skipped.add(report, offset)
+        if report.rejected:
+            if self.metrics.enabled:
+                self.metrics.skipped_points += report.rejected
+            if log and skipped is None:
+                self.events.warning(
+                    "path.skipped",
+                    rejected=report.rejected,
+                    total=report.total,
+                    first=report.first_rejected,
+                )
+        return path, kept
+
+    def _filter_points(self, points: Iterable, log: bool = True) -> Path:
+        """Drop off-screen points of a whole path in one check"""
+        return self._filter_indexed(points, log)[0]
+
+    @contextmanager
+    def _operation(self, stop_token: Optional[StopToken]) -> Iterator[StopToken]:
+        """Register the token of a running movement for emergency_stop"""
+        token = stop_token or StopToken()
+        with self._tokens_lock:
+            self._active_tokens.add(token)
+        try:
+            yield token
+        finally:
+            with self._tokens_lock:
+                self._active_tokens.discard(token)
+
+    def _halt(self, token: StopToken, index: int) -> bool:
+        """Record where a movement stopped"""
+        token.halted_at = index
+        if self.metrics.enabled:
+            self.metrics.stopped += 1
+        self.events.info("move.stopped", index=index, reason=token.reason)
+        return False
+
+    def _move_along(
+        self,
+        points: Iterable,
+        duration: float,
+        token: StopToken,
+        start_index: int = 0,
+        offset: int = 0,
+        skipped: Optional["_SkipSummary"] = None,
+    ) -> bool:
+        """
+        Move through on-screen points, checking the token before each one
+
+        Args:
+            points: Path, (N, 2) array or list of points
+            duration: Time to move to each point
+            token: Stop token
+            start_index: Index of the first point to move to
+            offset: Index of points[0] in the caller's sequence
+            skipped: Summary collecting rejected points across chunks
+
+        Returns:
+            True if all points were visited, False if stopped
+        """
+        path, kept = self._filter_indexed(
+            Path(points)[start_index:],
+            skipped=skipped,
+            offset=start_index + offset,
+        )
+        indices = (kept + start_index + offset).tolist()
+
+        move = self._mover()
+        for (x, y), index in zip(path.tolist(), indices):
+            if token.stopped:
+                return self._halt(token, index)
+            move(x, y, duration=duration)
+
+        if token.stopped:
+            return self._halt(token, start_index + offset + len(kept))
+        return True
+
+    def play_path(
+        self,
+        points: Iterable,
+        rate: float = 60.0,
+        stop_token: Optional[StopToken] = None,
+        start_index: int = 0,
+    ) -> bool:
+        """
+        Play path at a fixed frame rate, one point per frame
+
+        Frames follow absolute deadlines, so the run takes len(points) / rate
+        seconds regardless of backend overhead; late frames are coalesced.
+        The timing report is kept in ``last_playback``.
+
+        Args:
+            points: Path, (N, 2) array or any iterable of points
+            rate: Frames per second
+            stop_token: Token checked before every frame
+            start_index: Index of the first point to play
+        """
+        try:
+            path, kept = self._filter_indexed(Path(points)[start_index:])
+            self.events.info("playback.start", points=len(path), rate=rate)
+
+            scheduler = PlaybackScheduler(self.backend, rate)
+            with self._operation(stop_token) as token:
+                report = self.last_playback = scheduler.play(
+                    path, stop_token=token, warp=self._mover(self.backend.warp)
+                )
+
+            if self.events.enabled(logging.INFO):
+                self.events.info("playback.done", summary=report.summary())
+            if report.halted_at is not None:
+                return self._halt(token, start_index + int(kept[report.halted_at]))
             return True
 
         except Exception as e:
-            self.logger.error(f"Error during cursor shake: {e}")
-            return False
+            return self._error("playback.error", e)
 
-    def move_smooth_path(self, points: list, duration_per_point: float = 0.5) -> bool:
+    def move_timed_path(
+        self,
+        samples: Iterable,
+        stop_token: Optional[StopToken] = None,
+        start_index: int = 0,
+    ) -> bool:
         """
-        Smooth movement along specified path
+        Movement along path where every point has its own duration
+
+        Samples are consumed incrementally, e.g. from
+        ``PatternExpr.iter_timed()``.
 
         Args:
-            points: List of points [(x1, y1), (x2, y2), ...]
-            duration_per_point: Time to move to each point
+            samples: Iterable of (x, y, duration) tuples
+            stop_token: Token checked before every sample
+            start_index: Index of the first sample to play
         """
         try:
-            self.logger.info(f"Moving along path with {len(points)} points")
-
-            for point in points:
-                if validate_coordinates(
-                    point[0], point[1], self.screen_width, self.screen_height
-                ):
-                    pyautogui.moveTo(point[0], point[1], duration=duration_per_point)
-                else:
-                    self.logger.warning(f"Skipping invalid point: {point}")
+            self.events.info("timed.start")
+
+            move = self._mover()
+            validate = self.geometry.validate
+            with self._operation(stop_token) as token:
+                stream = islice(samples, start_index, None)
+                for index, (x, y, duration) in enumerate(stream, start_index):
+                    if token.stopped:
+                        return self._halt(token, index)
+                    if validate(x, y):
+                        move(x, y, duration=duration)
+                    else:
+                        if self.metrics.enabled:
+                            self.metrics.skipped_points += 1
+                        self.events.emit(
+                            logging.WARNING,
+                            "timed.skipped",
+                            sample_every=INVALID_POINT_LOG_EVERY,
+                            index=index,
+                            x=x,
+                            y=y,
+                        )
 
             return True
 
         except Exception as e:
-            self.logger.error(f"Error during path movement: {e}")
-            return False
+            return self._error("timed.error", e)
 
     def emergency_stop(self):
-        """Emergency stop - move cursor to screen corner"""
+        """Emergency stop - halt running movements and move cursor to corner"""
+        with self._tokens_lock:
+            for token in self._active_tokens:
+                token.stop("emergency stop")
+
         try:
-            pyautogui.moveTo(0, 0, duration=0.1)
-            self.logger.info("Emergency stop executed")
+            self.backend.move_to(0, 0, duration=0.1)
+            self.events.info("mover.emergency_stop")
         except Exception:
             pass
@@ -0,0 +1,188 @@
+"""
+Path optimization passes that cut backend calls without visible change
+"""
+
+from typing import Callable, Iterable, List, NamedTuple, Tuple, Union
+
+import numpy as np
+
+from .path import Path
+
+PointsLike = Union[Path, np.ndarray, Iterable]
+
+
+class PassResult(NamedTuple):
+    """Outcome of one optimization pass"""
+
+    name: str
+    points_in: int
+    points_out: int
+
+    @property
+    def removed(self) -> int:
+        """Number of points removed by the pass"""
+        return self.points_in - self.points_out
+
+
+def drop_duplicates(points: PointsLike) -> Path:
+    """
+    Remove consecutive duplicate points
+
+    Args:
+        points: Path, (N, 2) array or list of points
+
+    Returns:
+        Path without repeated neighbours
+    """
+    path = Path(points)
+    if len(path) < 2:
+        return path
+
+    xy = path.array
+    keep = np.empty(len(xy), dtype=bool)
+    keep[0] = True
+    np.any(xy[1:] != xy[:-1], axis=1, out=keep[1:])
+    return path if keep.all() else path[keep]
+
+
+def merge_collinear(points: PointsLike) -> Path:
+    """
+    Remove interior points of straight runs
+
+    A point is dropped when it lies exactly on the segment between its
+    neighbours and the path keeps going in the same direction, so
+    reversals and corners are preserved.
+
+    Args:
+        points: Path, (N, 2) array or list of points
+
+    Returns:
+        Path with each straight run reduced to its end points
+    """
+    path = Path(points)
+    if len(path) < 3:
+        return path
+
+    xy = path.array.astype(np.int64)
+    incoming = xy[1:-1] - xy[:-2]
+    outgoing = xy[2:] - xy[1:-1]
+
+    cross = incoming[:, 0] * outgoing[:, 1] - incoming[:, 1] * outgoing[:, 0]
+    dot = incoming[:, 0] * outgoing[:, 0] + incoming[:, 1] * outgoing[:, 1]
+
+    keep = np.ones(len(xy), dtype=bool)
+    keep[1:-1] = (cross != 0) | (dot <= 0)
+    return path if keep.all() else path[keep]
+
+
+def simplify_rdp(points: PointsLike, tolerance: float = 0.5) -> Path:
+    """
+    Simplify path with the Ramer-Douglas-Peucker algorithm
+
+    Args:
+        points: Path, (N, 2) array or list of points
+        tolerance: Maximum allowed deviation from the original path in pixels
+
+    Returns:
+        Path whose points are a subset of the input within tolerance
+    """
+    path = Path(points)
+    if len(path) < 3:
+        return path
+
+    xy = path.array.astype(float)
+    keep = np.zeros(len(xy), dtype=bool)
+    keep[0] = keep[-1] = True
+
+    stack = [(0, len(xy) - 1)]
+    while stack:
+        start, end = stack.pop()
+        if end - start < 2:
+            continue
+
+        origin = xy[start]
+        chord = xy[end] - origin
+        offsets = xy[start + 1 : end] - origin
+        length = np.hypot(chord[0], chord[1])
+
+        if length == 0:
+            distances = np.hypot(offsets[:, 0], offsets[:, 1])
+        else:
+            cross = chord[0] * offsets[:, 1] - chord[1] * offsets[:, 0]
+            distances = np.abs(cross) / length
+
+        farthest = int(np.argmax(distances))
+        if distances[farthest] > tolerance:
+            split = start + 1 + farthest
+            keep[split] = True
+            stack.append((start, split))
+            stack.append((split, end))
+
+    return path if keep.all() else path[keep]
+
+
+class PathOptimizer:
+    """Chainable pipeline of path optimization passes"""
+
+    def __init__(self):
+        """Initialize an empty pipeline"""
+        self.passes: List[Tuple[str, Callable[[Path], Path]]] = []
+
+    @classmethod
+    def default(cls, tolerance: float = 0.5) -> "PathOptimizer":
+        """
+        Create the standard pipeline: dedupe, collinear merge, RDP
+
+        Args:
+            tolerance: RDP tolerance in pixels
+
+        Returns:
+            Configured PathOptimizer
+        """
+        return cls().dedupe().merge_collinear().simplify(tolerance)
+
+    def dedupe(self) -> "PathOptimizer":
+        """Add consecutive duplicate removal pass"""
+        self.passes.append(("dedupe", drop_duplicates))
+        return self
+
+    def merge_collinear(self) -> "PathOptimizer":
+        """Add collinear run merging pass"""
+        self.passes.append(("merge_collinear", merge_collinear))
+        return self
+
+    def simplify(self, tolerance: float = 0.5) -> "PathOptimizer":
+        """
+        Add Ramer-Douglas-Peucker simplification pass
+
+        Args:
+            tolerance: Maximum deviation in pixels
+        """
+        self.passes.append(
+            (f"simplify_rdp({tolerance})", lambda path: simplify_rdp(path, tolerance))
+        )
+        return self
+
+    def run(self, points: PointsLike) -> Tuple[Path, List[PassResult]]:
+        """
+        Run all passes in order
+
+        Args:
+            points: Path, (N, 2) array or list of points
+
+        Returns:
+            Tuple of (optimized path, per-pass results)
+        """
+        path = Path(points)
+        report = []
+
+        for name, optimization in self.passes:
+            points_in = len(path)
+            path = optimization(path)
+            report.append(PassResult(name, points_in, len(path)))
+
+        return path, report
+
+    def __call__(self, points: PointsLike) -> Path:
+        """Run pipeline and return only the optimized path"""
+        return self.run(points)[0]
@@ -0,0 +1,160 @@
+"""
+Compact array-backed path type for mouse cursor movement
+"""
+
+import itertools
+from collections.abc import Sequence
+from typing import Iterable, Iterator, List, Tuple, Union
+
+import numpy as np
+
+# 8 bytes per point: a million-point path fits in 8 MB
+PATH_DTYPE = np.int32
+
+# Rows converted to Python objects at a time while iterating
+ITER_CHUNK_SIZE = 1024
+
+
+class Path(Sequence):
+    """
+    Immutable sequence of (x, y) points stored in one contiguous (N, 2) buffer
+
+    Indexing returns (x, y) tuples, slicing returns a Path view without
+    copying, and ``+`` concatenates. The underlying buffer is exposed via
+    ``array``, ``memoryview()`` and the NumPy array protocol. ``memoryview(path)``
+    also works on Python 3.12+, which added ``__buffer__``; use ``memoryview()``
+    for zero-copy access on older interpreters.
+    """
+
+    __slots__ = ("_data",)
+
+    def __init__(self, points: Union["Path", np.ndarray, Iterable] = ()):
+        """
+        Initialize Path
+
+        Args:
+            points: Another Path, an (N, 2) array or an iterable of (x, y) pairs
+        """
+        if isinstance(points, Path):
+            data = points._data
+        elif isinstance(points, (np.ndarray, list, tuple)):
+            data = np.asarray(points, dtype=PATH_DTYPE).reshape(-1, 2)
+        else:
+            flat = itertools.chain.from_iterable(points)
+            data = np.fromiter(flat, dtype=PATH_DTYPE).reshape(-1, 2)
+
+        data = data.view()
+        data.flags.writeable = False
+        self._data = data
+
+    @classmethod
+    def from_xy(cls, xs: Iterable, ys: Iterable) -> "Path":
+        """
+        Create path from separate coordinate sequences
+
+        Args:
+            xs: X coordinates
+            ys: Y coordinates
+
+        Returns:
+            New Path
+        """
+        return cls(np.column_stack((np.asarray(xs), np.asarray(ys))))
+
+    @classmethod
+    def concat(cls, *paths: Union["Path", np.ndarray, Iterable]) -> "Path":
+        """
+        Concatenate several paths into one buffer
+
+        Args:
+            *paths: Paths, arrays or point sequences
+
+        Returns:
+            New Path containing all points in order
+        """
+        arrays = [cls(path)._data for path in paths]
+        if not arrays:
+            return cls()
+        return cls(np.concatenate(arrays))
+
+    @property
+    def array(self) -> np.ndarray:
+        """Read-only (N, 2) view of the underlying buffer"""
+        return self._data
+
+    @property
+    def xs(self) -> np.ndarray:
+        """Read-only view of X coordinates"""
+        return self._data[:, 0]
+
+    @property
+    def ys(self) -> np.ndarray:
+        """Read-only view of Y coordinates"""
+        return self._data[:, 1]
+
+    @property
+    def nbytes(self) -> int:
+        """Size of the point buffer in bytes"""
+        return self._data.nbytes
+
+    def memoryview(self) -> memoryview:
+        """Get zero-copy buffer-protocol view of the points on any Python version"""
+        return memoryview(self._data)
+
+    def tolist(self) -> List[Tuple[int, int]]:
+        """Convert to a list of (x, y) tuples"""
+        return list(map(tuple, self._data.tolist()))
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __getitem__(self, index):
+        if isinstance(index, (int, np.integer)):
+            return tuple(self._data[index].tolist())
+        return Path(self._data[index])
+
+    def __iter__(self) -> Iterator[Tuple[int, int]]:
+        data = self._data
+        for start in range(0, len(data), ITER_CHUNK_SIZE):
+            yield from map(tuple, data[start : start + ITER_CHUNK_SIZE].tolist())
+
+    def __reversed__(self) -> Iterator[Tuple[int, int]]:
+        return iter(self[::-1])
+
+    def __add__(self, other) -> "Path":
+        try:
+            return Path.concat(self, other)
+        except (TypeError, ValueError):
+            return NotImplemented
+
+    def __radd__(self, other) -> "Path":
+        try:
+            return Path.concat(other, self)
+        except (TypeError, ValueError):
+            return NotImplemented
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, (Path, np.ndarray, list, tuple)):
+            return NotImplemented
+        try:
+            other = Path(other)
+        except (TypeError, ValueError):
+            return False
+        return np.array_equal(self._data, other._data)
+
+    __hash__ = None
+
+    def __array__(self, dtype=None, copy=None) -> np.ndarray:
+        if dtype is None or dtype == self._data.dtype:
+            return self._data.copy() if copy else self._data
+        return self._data.astype(dtype)
+
+    def __buffer__(self, flags: int) -> memoryview:
+        # Python 3.12+ only (PEP 688); older versions use memoryview()
+        return memoryview(self._data)
+
+    def __repr__(self) -> str:
+        if len(self) <= 6:
+            return f"Path({self.tolist()})"
+        head = ", ".join(map(str, self[:3]))
+        return f"Path([{head}, ...] {len(self)} points)"
@@ -3,13 +3,132 @@ Pattern generator for mouse cursor movement
 """
 
 import math
-import random
-from typing import List, Tuple
+from typing import Callable, Iterator, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .path import PATH_DTYPE, Path
+from .random_walk import RandomWalkEngine
+from .trig import cos_sin, cos_sin_harmonics
+
+# Streams start with small chunks so the first point is available immediately,
+# then grow up to the maximum to amortise the per-chunk NumPy overhead.
+STREAM_FIRST_CHUNK = 16
+STREAM_MAX_CHUNK = 1024
+
+
+def _to_point_array(x: np.ndarray, y: np.ndarray) -> np.ndarray:
+    """Stack coordinate vectors into an (N, 2) integer array, truncating like int()"""
+    return np.column_stack((x, y)).astype(PATH_DTYPE)
+
+
+def _index_chunks(count: int) -> Iterator[np.ndarray]:
+    """Yield consecutive index ranges covering 0..count with growing chunk sizes"""
+    start = 0
+    size = STREAM_FIRST_CHUNK
+    while start < count:
+        stop = min(start + size, count)
+        yield np.arange(start, stop)
+        start = stop
+        size = min(size * 2, STREAM_MAX_CHUNK)
+
+
+def _stream_points(
+    kernel: Callable[..., np.ndarray], count: int, *args
+) -> Iterator[Tuple[int, int]]:
+    """Lazily evaluate a point kernel chunk by chunk, yielding (x, y) tuples"""
+    for i in _index_chunks(count):
+        yield from map(tuple, kernel(i, *args).tolist())
+
+
+def _circle_kernel(i, center_x, center_y, radius, steps, clockwise) -> np.ndarray:
+    cos, sin = cos_sin(i, steps)
+    if not clockwise:
+        sin = -sin
+
+    x = center_x + radius * cos
+    y = center_y + radius * sin
+    return _to_point_array(x, y)
+
+
+def _star_kernel(i, center_x, center_y, outer_radius, inner_radius, points):
+    # Close the shape by wrapping the last index back to the first vertex
+    i = np.where(i == points * 2, 0, i)
+
+    # Angles are not taken from the shared tables: cos(a - pi / 2) differs
+    # from sin(a) in the last bits, which truncation turns into 1 px moves
+    angle = i * (math.pi / points) - math.pi / 2
+    radius = np.where(i % 2 == 0, outer_radius, inner_radius)
+
+    x = center_x + radius * np.cos(angle)
+    y = center_y + radius * np.sin(angle)
+    return _to_point_array(x, y)
+
+
+def _spiral_kernel(i, center_x, center_y, max_radius, turns, steps_per_turn):
+    total_steps = turns * steps_per_turn
+    # Angles grow past one turn, so they are not taken from the shared tables:
+    # wrapping them changes the last bits and truncation moves points 1 px
+    angle = 2 * np.pi * i / steps_per_turn
+    radius = max_radius * i / total_steps
+
+    x = center_x + radius * np.cos(angle)
+    y = center_y + radius * np.sin(angle)
+    return _to_point_array(x, y)
+
+
+def _sine_wave_kernel(i, start_x, start_y, length, amplitude, frequency, steps):
+    x = start_x + np.trunc(length * i / steps)
+    y = start_y + np.trunc(amplitude * np.sin(2 * np.pi * frequency * i / steps))
+    return _to_point_array(x, y)
+
+
+def _figure_eight_kernel(i, center_x, center_y, width, height, steps):
+    _, sin = cos_sin_harmonics(i, steps, 2)
+
+    # Parametric equations for figure 8
+    x = center_x + width * sin[0] / 2
+    y = center_y + height * sin[1] / 4
+    return _to_point_array(x, y)
+
+
+def _heart_kernel(i, center_x, center_y, size, steps):
+    cos, sin = cos_sin_harmonics(i, steps, 4)
+
+    # Parametric equations for heart
+    x = center_x + size * 16 * sin[0] ** 3
+    y = center_y - size * (13 * cos[0] - 5 * cos[1] - 2 * cos[2] - cos[3])
+    return _to_point_array(x, y)
 
 
 class PatternGenerator:
     """Class for generating various cursor movement patterns"""
 
+    @staticmethod
+    def generate_circle_array(
+        center_x: int,
+        center_y: int,
+        radius: int,
+        steps: int = 50,
+        clockwise: bool = True,
+    ) -> np.ndarray:
+        """
+        Generate points for circular movement as an array
+
+        Args:
+            center_x: X coordinate of center
+            center_y: Y coordinate of center
+            radius: Circle radius
+            steps: Number of points
+            clockwise: Clockwise movement
+
+        Returns:
+            Integer array of shape (steps + 1, 2)
+        """
+        return _circle_kernel(
+            np.arange(steps + 1), center_x, center_y, radius, steps, clockwise
+        )
+
     @staticmethod
     def generate_circle_points(
         center_x: int,
@@ -17,7 +136,7 @@ class PatternGenerator:
         radius: int,
         steps: int = 50,
         clockwise: bool = True,
-    ) -> List[Tuple[int, int]]:
+    ) -> Path:
         """
         Generate points for circular movement
 
@@ -29,23 +148,32 @@ class PatternGenerator:
             clockwise: Clockwise movement
 
         Returns:
-            List of coordinates [(x, y), ...]
+            Path of coordinates [(x, y), ...]
         """
-        points = []
-        direction = 1 if clockwise else -1
+        return Path(
+            PatternGenerator.generate_circle_array(
+                center_x, center_y, radius, steps, clockwise
+            )
+        )
 
-        for i in range(steps + 1):
-            angle = direction * 2 * math.pi * i / steps
-            x = int(center_x + radius * math.cos(angle))
-            y = int(center_y + radius * math.sin(angle))
-            points.append((x, y))
+    @staticmethod
+    def generate_square_array(start_x: int, start_y: int, size: int) -> np.ndarray:
+        """
+        Generate points for square movement as an array
 
-        return points
+        Args:
+            start_x: X coordinate of start
+            start_y: Y coordinate of start
+            size: Square side size
+
+        Returns:
+            Integer array of shape (5, 2)
+        """
+        corners = np.array([[0, 0], [1, 0], [1, 1], [0, 1], [0, 0]], dtype=PATH_DTYPE)
+        return corners * size + np.array([start_x, start_y], dtype=PATH_DTYPE)
 
     @staticmethod
-    def generate_square_points(
-        start_x: int, start_y: int, size: int
-    ) -> List[Tuple[int, int]]:
+    def generate_square_points(start_x: int, start_y: int, size: int) -> Path:
         """
         Generate points for square movement
 
@@ -55,22 +183,14 @@ class PatternGenerator:
             size: Square side size
 
         Returns:
-            List of coordinates
+            Path of coordinates
         """
-        return [
-            (start_x, start_y),
-            (start_x + size, start_y),
-            (start_x + size, start_y + size),
-            (start_x, start_y + size),
-            (start_x, start_y),
-        ]
+        return Path(PatternGenerator.generate_square_array(start_x, start_y, size))
 
     @staticmethod
-    def generate_triangle_points(
-        center_x: int, center_y: int, size: int
-    ) -> List[Tuple[int, int]]:
+    def generate_triangle_array(center_x: int, center_y: int, size: int) -> np.ndarray:
         """
-        Generate points for triangle movement
+        Generate points for triangle movement as an array
 
         Args:
             center_x: X coordinate of center
@@ -78,16 +198,64 @@ class PatternGenerator:
             size: Triangle size
 
         Returns:
-            List of coordinates
+            Integer array of shape (4, 2)
         """
         height = int(size * math.sqrt(3) / 2)
 
-        return [
-            (center_x, center_y - height // 2),  # Top point
-            (center_x - size // 2, center_y + height // 2),  # Left bottom
-            (center_x + size // 2, center_y + height // 2),  # Right bottom
-            (center_x, center_y - height // 2),  # Return to start
-        ]
+        return np.array(
+            [
+                (center_x, center_y - height // 2),  # Top point
+                (center_x - size // 2, center_y + height // 2),  # Left bottom
+                (center_x + size // 2, center_y + height // 2),  # Right bottom
+                (center_x, center_y - height // 2),  # Return to start
+            ],
+            dtype=PATH_DTYPE,
+        )
+
+    @staticmethod
+    def generate_triangle_points(center_x: int, center_y: int, size: int) -> Path:
+        """
+        Generate points for triangle movement
+
+        Args:
+            center_x: X coordinate of center
+            center_y: Y coordinate of center
+            size: Triangle size
+
+        Returns:
+            Path of coordinates
+        """
+        return Path(PatternGenerator.generate_triangle_array(center_x, center_y, size))
+
+    @staticmethod
+    def generate_star_array(
+        center_x: int,
+        center_y: int,
+        outer_radius: int,
+        inner_radius: int,
+        points: int = 5,
+    ) -> np.ndarray:
+        """
+        Generate points for star movement as an array
+
+        Args:
+            center_x: X coordinate of center
+            center_y: Y coordinate of center
+            outer_radius: Outer radius
+            inner_radius: Inner radius
+            points: Number of star points
+
+        Returns:
+            Integer array of shape (points * 2 + 1, 2)
+        """
+        return _star_kernel(
+            np.arange(points * 2 + 1),
+            center_x,
+            center_y,
+            outer_radius,
+            inner_radius,
+            points,
+        )
 
     @staticmethod
     def generate_star_points(
@@ -96,7 +264,7 @@ class PatternGenerator:
         outer_radius: int,
         inner_radius: int,
         points: int = 5,
-    ) -> List[Tuple[int, int]]:
+    ) -> Path:
         """
         Generate points for star movement
 
@@ -108,22 +276,43 @@ class PatternGenerator:
             points: Number of star points
 
         Returns:
-            List of coordinates
+            Path of coordinates
         """
-        coordinates = []
-        angle_step = math.pi / points
+        return Path(
+            PatternGenerator.generate_star_array(
+                center_x, center_y, outer_radius, inner_radius, points
+            )
+        )
 
-        for i in range(points * 2):
-            angle = i * angle_step - math.pi / 2
-            radius = outer_radius if i % 2 == 0 else inner_radius
+    @staticmethod
+    def generate_spiral_array(
+        center_x: int,
+        center_y: int,
+        max_radius: int,
+        turns: int = 3,
+        steps_per_turn: int = 50,
+    ) -> np.ndarray:
+        """
+        Generate points for spiral movement as an array
 
-            x = int(center_x + radius * math.cos(angle))
-            y = int(center_y + radius * math.sin(angle))
-            coordinates.append((x, y))
+        Args:
+            center_x: X coordinate of center
+            center_y: Y coordinate of center
+            max_radius: Maximum spiral radius
+            turns: Number of turns
+            steps_per_turn: Steps per turn
 
-        # Close the shape
-        coordinates.append(coordinates[0])
-        return coordinates
+        Returns:
+            Integer array of shape (turns * steps_per_turn + 1, 2)
+        """
+        return _spiral_kernel(
+            np.arange(turns * steps_per_turn + 1),
+            center_x,
+            center_y,
+            max_radius,
+            turns,
+            steps_per_turn,
+        )
 
     @staticmethod
     def generate_spiral_points(
@@ -132,7 +321,7 @@ class PatternGenerator:
         max_radius: int,
         turns: int = 3,
         steps_per_turn: int = 50,
-    ) -> List[Tuple[int, int]]:
+    ) -> Path:
         """
         Generate points for spiral movement
 
@@ -144,20 +333,40 @@ class PatternGenerator:
             steps_per_turn: Steps per turn
 
         Returns:
-            List of coordinates
+            Path of coordinates
         """
-        points = []
-        total_steps = turns * steps_per_turn
+        return Path(
+            PatternGenerator.generate_spiral_array(
+                center_x, center_y, max_radius, turns, steps_per_turn
+            )
+        )
 
-        for i in range(total_steps + 1):
-            angle = 2 * math.pi * i / steps_per_turn
-            radius = max_radius * i / total_steps
+    @staticmethod
+    def generate_sine_wave_array(
+        start_x: int,
+        start_y: int,
+        length: int,
+        amplitude: int,
+        frequency: float = 1.0,
+        steps: int = 100,
+    ) -> np.ndarray:
+        """
+        Generate points for sine wave movement as an array
 
-            x = int(center_x + radius * math.cos(angle))
-            y = int(center_y + radius * math.sin(angle))
-            points.append((x, y))
+        Args:
+            start_x: X coordinate of start
+            start_y: Y coordinate of start
+            length: Wave length
+            amplitude: Wave amplitude
+            frequency: Wave frequency
+            steps: Number of points
 
-        return points
+        Returns:
+            Integer array of shape (steps + 1, 2)
+        """
+        return _sine_wave_kernel(
+            np.arange(steps + 1), start_x, start_y, length, amplitude, frequency, steps
+        )
 
     @staticmethod
     def generate_sine_wave_points(
@@ -167,7 +376,7 @@ class PatternGenerator:
         amplitude: int,
         frequency: float = 1.0,
         steps: int = 100,
-    ) -> List[Tuple[int, int]]:
+    ) -> Path:
         """
         Generate points for sine wave movement
 
@@ -180,21 +389,53 @@ class PatternGenerator:
             steps: Number of points
 
         Returns:
-            List of coordinates
+            Path of coordinates
         """
-        points = []
+        return Path(
+            PatternGenerator.generate_sine_wave_array(
+                start_x, start_y, length, amplitude, frequency, steps
+            )
+        )
 
-        for i in range(steps + 1):
-            x = start_x + int(length * i / steps)
-            y = start_y + int(amplitude * math.sin(2 * math.pi * frequency * i / steps))
-            points.append((x, y))
+    @staticmethod
+    def generate_random_walk_array(
+        start_x: int,
+        start_y: int,
+        steps: int,
+        max_step_size: int = 50,
+        seed: Optional[int] = None,
+        bounds: Optional[Sequence[int]] = None,
+        boundary: str = "none",
+    ) -> np.ndarray:
+        """
+        Generate points for random walk movement as an array
 
-        return points
+        Args:
+            start_x: X coordinate of start
+            start_y: Y coordinate of start
+            steps: Number of steps
+            max_step_size: Maximum step size
+            seed: Seed for reproducible walks (random if None)
+            bounds: Screen rectangle as (width, height) or
+                (left, top, width, height)
+            boundary: Boundary mode - "none", "clamp" or "reflect"
+
+        Returns:
+            Integer array of shape (steps + 1, 2)
+        """
+        engine = RandomWalkEngine(seed, bounds, boundary)
+        return engine.generate_array(start_x, start_y, steps, max_step_size)
 
     @staticmethod
     def generate_random_walk(
-        start_x: int, start_y: int, steps: int, max_step_size: int = 50
-    ) -> List[Tuple[int, int]]:
+        start_x: int,
+        start_y: int,
+        steps: int,
+        max_step_size: int = 50,
+        seed: Optional[int] = None,
+        bounds: Optional[Sequence[int]] = None,
+        boundary: str = "none",
+    ) -> Path:
         """
         Generate points for random walk movement
 
@@ -203,27 +444,45 @@ class PatternGenerator:
             start_y: Y coordinate of start
             steps: Number of steps
             max_step_size: Maximum step size
+            seed: Seed for reproducible walks (random if None)
+            bounds: Screen rectangle as (width, height) or
+                (left, top, width, height)
+            boundary: Boundary mode - "none", "clamp" or "reflect"
 
         Returns:
-            List of coordinates
+            Path of coordinates
         """
-        points = [(start_x, start_y)]
-        current_x, current_y = start_x, start_y
+        return Path(
+            PatternGenerator.generate_random_walk_array(
+                start_x, start_y, steps, max_step_size, seed, bounds, boundary
+            )
+        )
 
-        for _ in range(steps):
-            dx = random.randint(-max_step_size, max_step_size)
-            dy = random.randint(-max_step_size, max_step_size)
+    @staticmethod
+    def generate_figure_eight_array(
+        center_x: int, center_y: int, width: int, height: int, steps: int = 100
+    ) -> np.ndarray:
+        """
+        Generate points for figure-eight movement as an array
 
-            current_x += dx
-            current_y += dy
-            points.append((current_x, current_y))
+        Args:
+            center_x: X coordinate of center
+            center_y: Y coordinate of center
+            width: Figure width
+            height: Figure height
+            steps: Number of points
 
-        return points
+        Returns:
+            Integer array of shape (steps + 1, 2)
+        """
+        return _figure_eight_kernel(
+            np.arange(steps + 1), center_x, center_y, width, height, steps
+        )
 
     @staticmethod
     def generate_figure_eight(
         center_x: int, center_y: int, width: int, height: int, steps: int = 100
-    ) -> List[Tuple[int, int]]:
+    ) -> Path:
         """
         Generate points for figure-eight movement
 
@@ -235,25 +494,36 @@ class PatternGenerator:
             steps: Number of points
 
         Returns:
-            List of coordinates
+            Path of coordinates
         """
-        points = []
-
-        for i in range(steps + 1):
-            t = 2 * math.pi * i / steps
+        return Path(
+            PatternGenerator.generate_figure_eight_array(
+                center_x, center_y, width, height, steps
+            )
+        )
 
-            # Parametric equations for figure 8
-            x = int(center_x + width * math.sin(t) / 2)
-            y = int(center_y + height * math.sin(2 * t) / 4)
+    @staticmethod
+    def generate_heart_array(
+        center_x: int, center_y: int, size: int, steps: int = 100
+    ) -> np.ndarray:
+        """
+        Generate points for heart shape movement as an array
 
-            points.append((x, y))
+        Args:
+            center_x: X coordinate of center
+            center_y: Y coordinate of center
+            size: Heart size
+            steps: Number of points
 
-        return points
+        Returns:
+            Integer array of shape (steps + 1, 2)
+        """
+        return _heart_kernel(np.arange(steps + 1), center_x, center_y, size, steps)
 
     @staticmethod
     def generate_heart_points(
         center_x: int, center_y: int, size: int, steps: int = 100
-    ) -> List[Tuple[int, int]]:
+    ) -> Path:
         """
         Generate points for heart shape movement
 
@@ -264,26 +534,237 @@ class PatternGenerator:
             steps: Number of points
 
         Returns:
-            List of coordinates
-        """
-        points = []
-
-        for i in range(steps + 1):
-            t = 2 * math.pi * i / steps
-
-            # Parametric equations for heart
-            x = int(center_x + size * 16 * math.sin(t) ** 3)
-            y = int(
-                center_y
-                - size
-                * (
-                    13 * math.cos(t)
-                    - 5 * math.cos(2 * t)
-                    - 2 * math.cos(3 * t)
-                    - math.cos(4 * t)
-                )
-            )
+            Path of coordinates
+        """
+        return Path(
+            PatternGenerator.generate_heart_array(center_x, center_y, size, steps)
+        )
+
+    @staticmethod
+    def iter_circle_points(
+        center_x: int,
+        center_y: int,
+        radius: int,
+        steps: int = 50,
+        clockwise: bool = True,
+    ) -> Iterator[Tuple[int, int]]:
+        """
+        Lazily yield points for circular movement
+
+        Args:
+            center_x: X coordinate of center
+            center_y: Y coordinate of center
+            radius: Circle radius
+            steps: Number of points
+            clockwise: Clockwise movement
+
+        Returns:
+            Iterator of coordinates (x, y)
+        """
+        return _stream_points(
+            _circle_kernel, steps + 1, center_x, center_y, radius, steps, clockwise
+        )
+
+    @staticmethod
+    def iter_square_points(
+        start_x: int, start_y: int, size: int
+    ) -> Iterator[Tuple[int, int]]:
+        """
+        Lazily yield points for square movement
+
+        Args:
+            start_x: X coordinate of start
+            start_y: Y coordinate of start
+            size: Square side size
+
+        Returns:
+            Iterator of coordinates (x, y)
+        """
+        return iter(PatternGenerator.generate_square_points(start_x, start_y, size))
+
+    @staticmethod
+    def iter_triangle_points(
+        center_x: int, center_y: int, size: int
+    ) -> Iterator[Tuple[int, int]]:
+        """
+        Lazily yield points for triangle movement
+
+        Args:
+            center_x: X coordinate of center
+            center_y: Y coordinate of center
+            size: Triangle size
+
+        Returns:
+            Iterator of coordinates (x, y)
+        """
+        return iter(PatternGenerator.generate_triangle_points(center_x, center_y, size))
+
+    @staticmethod
+    def iter_star_points(
+        center_x: int,
+        center_y: int,
+        outer_radius: int,
+        inner_radius: int,
+        points: int = 5,
+    ) -> Iterator[Tuple[int, int]]:
+        """
+        Lazily yield points for star movement
+
+        Args:
+            center_x: X coordinate of center
+            center_y: Y coordinate of center
+            outer_radius: Outer radius
+            inner_radius: Inner radius
+            points: Number of star points
+
+        Returns:
+            Iterator of coordinates (x, y)
+        """
+        return _stream_points(
+            _star_kernel,
+            points * 2 + 1,
+            center_x,
+            center_y,
+            outer_radius,
+            inner_radius,
+            points,
+        )
+
+    @staticmethod
+    def iter_spiral_points(
+        center_x: int,
+        center_y: int,
+        max_radius: int,
+        turns: int = 3,
+        steps_per_turn: int = 50,
+    ) -> Iterator[Tuple[int, int]]:
+        """
+        Lazily yield points for spiral movement
+
+        Args:
+            center_x: X coordinate of center
+            center_y: Y coordinate of center
+            max_radius: Maximum spiral radius
+            turns: Number of turns
+            steps_per_turn: Steps per turn
+
+        Returns:
+            Iterator of coordinates (x, y)
+        """
+        return _stream_points(
+            _spiral_kernel,
+            turns * steps_per_turn + 1,
+            center_x,
+            center_y,
+            max_radius,
+            turns,
+            steps_per_turn,
+        )
+
+    @staticmethod
+    def iter_sine_wave_points(
+        start_x: int,
+        start_y: int,
+        length: int,
+        amplitude: int,
+        frequency: float = 1.0,
+        steps: int = 100,
+    ) -> Iterator[Tuple[int, int]]:
+        """
+        Lazily yield points for sine wave movement
 
-            points.append((x, y))
+        Args:
+            start_x: X coordinate of start
+            start_y: Y coordinate of start
+            length: Wave length
+            amplitude: Wave amplitude
+            frequency: Wave frequency
+            steps: Number of points
+
+        Returns:
+            Iterator of coordinates (x, y)
+        """
+        return _stream_points(
+            _sine_wave_kernel,
+            steps + 1,
+            start_x,
+            start_y,
+            length,
+            amplitude,
+            frequency,
+            steps,
+        )
 
-        return points
+    @staticmethod
+    def iter_random_walk(
+        start_x: int,
+        start_y: int,
+        steps: int,
+        max_step_size: int = 50,
+        seed: Optional[int] = None,
+        bounds: Optional[Sequence[int]] = None,
+        boundary: str = "none",
+    ) -> Iterator[Tuple[int, int]]:
+        """
+        Lazily yield points for random walk movement
+
+        Args:
+            start_x: X coordinate of start
+            start_y: Y coordinate of start
+            steps: Number of steps
+            max_step_size: Maximum step size
+            seed: Seed for reproducible walks (random if None)
+            bounds: Screen rectangle as (width, height) or
+                (left, top, width, height)
+            boundary: Boundary mode - "none", "clamp" or "reflect"
+
+        Returns:
+            Iterator of coordinates (x, y)
+        """
+        engine = RandomWalkEngine(seed, bounds, boundary)
+        state = engine.start_state(start_x, start_y)
+
+        yield tuple(state.tolist())
+        for i in _index_chunks(steps):
+            deltas = engine.draw_steps(len(i), max_step_size)
+            positions, state = engine.advance(state, deltas)
+            yield from map(tuple, positions.tolist())
+
+    @staticmethod
+    def iter_figure_eight(
+        center_x: int, center_y: int, width: int, height: int, steps: int = 100
+    ) -> Iterator[Tuple[int, int]]:
+        """
+        Lazily yield points for figure-eight movement
+
+        Args:
+            center_x: X coordinate of center
+            center_y: Y coordinate of center
+            width: Figure width
+            height: Figure height
+            steps: Number of points
+
+        Returns:
+            Iterator of coordinates (x, y)
+        """
+        return _stream_points(
+            _figure_eight_kernel, steps + 1, center_x, center_y, width, height, steps
+        )
+
+    @staticmethod
+    def iter_heart_points(
+        center_x: int, center_y: int, size: int, steps: int = 100
+    ) -> Iterator[Tuple[int, int]]:
+        """
+        Lazily yield points for heart shape movement
+
+        Args:
+            center_x: X coordinate of center
+            center_y: Y coordinate of center
+            size: Heart size
+            steps: Number of points
+
+        Returns:
+            Iterator of coordinates (x, y)
+        """
+        return _stream_points(_heart_kernel, steps + 1, center_x, center_y, size, steps)
@@ -0,0 +1,209 @@
+"""
+Fixed-rate playback of paths against absolute deadlines
+
+Frame i of a run is due at ``start + i / rate`` on the ``perf_counter``
+clock, or at ``start + times[i]`` when the frames carry their own
+timestamps, so per-frame delays never accumulate into drift. A frame that
+is already late is coalesced with the frames that are due by then: only
+the newest due position is sent.
+"""
+
+import time
+from bisect import bisect_left
+from typing import Callable, Iterable, NamedTuple, Optional, Tuple, Union
+
+import numpy as np
+
+from .path import Path
+from .stop_token import StopToken
+
+# Upper edges of the jitter histogram buckets in milliseconds
+JITTER_BINS_MS = (0.1, 0.5, 1.0, 2.0, 5.0, 10.0, 20.0, float("inf"))
+
+# Time before a deadline spent spinning instead of sleeping (seconds)
+SPIN_THRESHOLD = 0.0005
+
+# Frames converted to Python ints at a time
+PLAY_CHUNK = 1024
+
+PointsLike = Union[Path, np.ndarray, Iterable]
+
+
+class PlaybackReport(NamedTuple):
+    """Timing statistics of one playback run"""
+
+    frames: int
+    sent: int
+    skipped: int
+    target_rate: float
+    elapsed: float
+    # Lateness of the last frame against its deadline (seconds)
+    drift: float
+    max_lateness: float
+    # Counts of frame lateness per JITTER_BINS_MS bucket
+    jitter_histogram: Tuple[int, ...]
+    # Index of the first frame not sent if the run was stopped
+    halted_at: Optional[int] = None
+
+    @property
+    def achieved_rate(self) -> float:
+        """Frames per second actually covered by the run"""
+        if self.frames < 2 or self.elapsed <= 0:
+            return 0.0
+        return (self.frames - 1) / self.elapsed
+
+    def summary(self) -> str:
+        """One-line human-readable summary"""
+        return (
+            f"{self.sent}/{self.frames} frames at {self.achieved_rate:.1f}/"
+            f"{self.target_rate:g} fps, drift {self.drift * 1000:+.2f} ms, "
+            f"max lateness {self.max_lateness * 1000:.2f} ms, "
+            f"{self.skipped} coalesced"
+        )
+
+    def histogram_lines(self) -> str:
+        """Jitter histogram as text, one bucket per line"""
+        lines = []
+        lower = 0.0
+        width = max(self.jitter_histogram + (1,))
+        for upper, count in zip(JITTER_BINS_MS, self.jitter_histogram):
+            if upper == float("inf"):
+                label = f">{lower:g} ms"
+            else:
+                label = f"{lower:g}-{upper:g} ms"
+            bar = "#" * round(30 * count / width)
+            lines.append(f"{label:>12} {count:>7} {bar}")
+            lower = upper
+        return "\n".join(lines)
+
+
+def _wait_until(deadline: float, stop_token: Optional[StopToken] = None):
+    """Sleep until shortly before deadline, then spin until it passes
+
+    A stop request wakes the sleep early; the caller checks the token.
+    """
+    remaining = deadline - time.perf_counter()
+    if remaining > SPIN_THRESHOLD:
+        if stop_token is None:
+            time.sleep(remaining - SPIN_THRESHOLD)
+        elif stop_token.wait(remaining - SPIN_THRESHOLD):
+            return
+    while time.perf_counter() < deadline:
+        pass
+
+
+class PlaybackScheduler:
+    """Sends raw positions to a backend at a fixed frame rate"""
+
+    def __init__(self, backend, rate: float = 60.0):
+        """
+        Initialize PlaybackScheduler
+
+        Args:
+            backend: MouseBackend receiving the positions
+            rate: Default frames per second
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.backend = backend
+        self.rate = rate
+
+    def play(
+        self,
+        points: PointsLike,
+        rate: Optional[float] = None,
+        stop_token: Optional[StopToken] = None,
+        warp: Optional[Callable[[int, int], None]] = None,
+        times: Optional[Iterable[float]] = None,
+    ) -> PlaybackReport:
+        """
+        Play path, one point per frame
+
+        Args:
+            points: Path, (N, 2) array or iterable of points
+            rate: Frames per second (defaults to the scheduler rate)
+            stop_token: Token checked before every frame
+            warp: Call sending one frame (defaults to backend.warp)
+            times: Non-decreasing time of each frame in seconds from the start
+                of the run; replaces the fixed rate
+
+        Returns:
+            PlaybackReport of the run
+        """
+        rate = rate or self.rate
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+
+        array = Path(points).array
+        frames = len(array)
+        period = 1.0 / rate
+        if times is not None:
+            times = np.asarray(times, dtype=float)
+            if times.shape != (frames,):
+                raise ValueError("times must have one value per point")
+            if frames > 1 and times[-1] > times[0]:
+                rate = (frames - 1) / float(times[-1] - times[0])
+        edges = [upper / 1000 for upper in JITTER_BINS_MS]
+        histogram = [0] * len(edges)
+        lateness = max_lateness = 0.0
+        sent = 0
+
+        backend = self.backend
+        check_failsafe = backend.failsafe
+        warp = warp or backend.warp
+        # Coordinates of frames chunk_start.. as Python ints
+        chunk: list = []
+        chunk_start = 0
+        start = time.perf_counter()
+        index = 0
+        halted_at = None
+
+        while index < frames:
+            if times is None:
+                deadline = start + index * period
+            else:
+                deadline = start + float(times[index])
+            now = time.perf_counter()
+            if now < deadline:
+                _wait_until(deadline, stop_token)
+            elif times is None:
+                # Late: jump to the newest frame that is already due
+                index = min(int((now - start) / period), frames - 1)
+                deadline = start + index * period
+            else:
+                due = int(np.searchsorted(times, now - start, "right")) - 1
+                index = min(max(due, index), frames - 1)
+                deadline = start + float(times[index])
+
+            if stop_token is not None and stop_token.stopped:
+                halted_at = stop_token.halted_at = index
+                break
+
+            lateness = time.perf_counter() - deadline
+            histogram[bisect_left(edges, lateness)] += 1
+            if lateness > max_lateness:
+                max_lateness = lateness
+            if check_failsafe:
+                backend.check_failsafe()
+            if not chunk_start <= index < chunk_start + len(chunk):
+                chunk_start = index
+                chunk = array[index : index + PLAY_CHUNK].tolist()
+            x, y = chunk[index - chunk_start]
+            warp(x, y)
+
+            sent += 1
+            index += 1
+
+        elapsed = time.perf_counter() - start
+
+        return PlaybackReport(
+            frames=frames,
+            sent=sent,
+            skipped=index - sent,
+            target_rate=rate,
+            elapsed=elapsed,
+            drift=lateness if sent else 0.0,
+            max_lateness=max_lateness if sent else 0.0,
+            jitter_histogram=tuple(histogram),
+            halted_at=halted_at,
+        )
@@ -0,0 +1,263 @@
+"""
+Vectorized, bounded and reproducible random walk engine
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from .path import PATH_DTYPE, Path
+
+BOUNDARY_MODES = ("none", "clamp", "reflect")
+
+# Block sizes for the sticky clamp pass: blocks shrink after an edge hit (the
+# walk is likely to hit again soon) and grow back while it stays inside
+_CLAMP_MIN_BLOCK = 32
+_CLAMP_MAX_BLOCK = 4096
+
+SeedLike = Union[None, int, np.random.SeedSequence]
+
+
+def _reflect(values: np.ndarray, low: int, high: int) -> np.ndarray:
+    """Fold unbounded positions into [low, high] as if reflected off the edges"""
+    span = high - low
+    if span == 0:
+        return np.full_like(values, low)
+
+    offset = np.mod(values - low, 2 * span)
+    return low + np.where(offset > span, 2 * span - offset, offset)
+
+
+def _clamp_accumulate(
+    start: int, deltas: np.ndarray, low: int, high: int
+) -> np.ndarray:
+    """Accumulate steps, pinning the walk to [low, high] whenever it hits an edge"""
+    positions = np.empty(len(deltas), dtype=np.int64)
+    position = start
+    block_size = _CLAMP_MAX_BLOCK
+    i = 0
+
+    while i < len(deltas):
+        block = deltas[i : i + block_size]
+        trial = position + np.cumsum(block)
+        outside = np.flatnonzero((trial < low) | (trial > high))
+
+        if not outside.size:
+            positions[i : i + len(block)] = trial
+            position = trial[-1]
+            i += len(block)
+            block_size = min(block_size * 2, _CLAMP_MAX_BLOCK)
+            continue
+
+        hit = outside[0]
+        positions[i : i + hit] = trial[:hit]
+        position = min(max(trial[hit], low), high)
+        positions[i + hit] = position
+        i += hit + 1
+        block_size = _CLAMP_MIN_BLOCK
+
+    return positions
+
+
+class RandomWalkEngine:
+    """Random walk generator drawing all steps in bulk from a seeded generator"""
+
+    def __init__(
+        self,
+        seed: SeedLike = None,
+        bounds: Optional[Sequence[int]] = None,
+        boundary: str = "none",
+    ):
+        """
+        Initialize RandomWalkEngine
+
+        Args:
+            seed: Integer seed or SeedSequence for reproducible walks
+                (random if None)
+            bounds: Screen rectangle as (width, height) or
+                (left, top, width, height)
+            boundary: Boundary mode - "none", "clamp" or "reflect"
+        """
+        if boundary not in BOUNDARY_MODES:
+            raise ValueError(f"Unknown boundary mode: {boundary}")
+        if boundary != "none" and bounds is None:
+            raise ValueError(f"Boundary mode '{boundary}' requires bounds")
+
+        if isinstance(seed, np.random.SeedSequence):
+            self.seed_sequence = seed
+        else:
+            self.seed_sequence = np.random.SeedSequence(seed)
+
+        self.rng = np.random.default_rng(self.seed_sequence)
+        self.boundary = boundary
+        self.bounds = None
+
+        if bounds is not None:
+            if len(bounds) == 2:
+                bounds = (0, 0, bounds[0], bounds[1])
+            left, top, width, height = bounds
+            # Inclusive coordinate limits per axis: ((x_min, x_max), (y_min, y_max))
+            self.bounds = ((left, left + width - 1), (top, top + height - 1))
+
+    def spawn(self, count: int) -> List["RandomWalkEngine"]:
+        """
+        Create independent child engines, e.g. one per worker
+
+        Children get statistically independent seed streams derived from
+        this engine's seed, so the same seed always reproduces them.
+
+        Args:
+            count: Number of child engines
+
+        Returns:
+            List of RandomWalkEngine sharing bounds and boundary mode
+        """
+        bounds = None
+        if self.bounds is not None:
+            (x_min, x_max), (y_min, y_max) = self.bounds
+            bounds = (x_min, y_min, x_max - x_min + 1, y_max - y_min + 1)
+
+        return [
+            RandomWalkEngine(child, bounds, self.boundary)
+            for child in self.seed_sequence.spawn(count)
+        ]
+
+    def draw_steps(self, count: int, max_step_size: int) -> np.ndarray:
+        """
+        Draw a block of random steps
+
+        Args:
+            count: Number of steps
+            max_step_size: Maximum step size per axis
+
+        Returns:
+            Integer array of shape (count, 2)
+        """
+        return self.rng.integers(
+            -max_step_size, max_step_size + 1, size=(count, 2), dtype=np.int64
+        )
+
+    def start_state(self, start_x: int, start_y: int) -> np.ndarray:
+        """
+        Get initial walk state for a start position
+
+        Args:
+            start_x: X coordinate of start
+            start_y: Y coordinate of start
+
+        Returns:
+            State array to pass to advance()
+        """
+        state = np.array([start_x, start_y], dtype=np.int64)
+        if self.bounds is not None and self.boundary != "none":
+            for axis, (low, high) in enumerate(self.bounds):
+                state[axis] = min(max(state[axis], low), high)
+        return state
+
+    def advance(
+        self, state: np.ndarray, deltas: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Apply a block of steps to the walk
+
+        Args:
+            state: Current walk state (from start_state() or advance())
+            deltas: Steps of shape (count, 2)
+
+        Returns:
+            Tuple of (positions after each step, new state)
+        """
+        if not len(deltas):
+            return np.empty((0, 2), dtype=PATH_DTYPE), state
+
+        if self.boundary == "clamp":
+            positions = np.column_stack(
+                [
+                    _clamp_accumulate(state[axis], deltas[:, axis], low, high)
+                    for axis, (low, high) in enumerate(self.bounds)
+                ]
+            )
+            return positions.astype(PATH_DTYPE), positions[-1]
+
+        # The unbounded walk is the state; reflection is a pure function of it
+        unbounded = state + np.cumsum(deltas, axis=0)
+        positions = unbounded
+        if self.boundary == "reflect":
+            positions = np.column_stack(
+                [
+                    _reflect(unbounded[:, axis], low, high)
+                    for axis, (low, high) in enumerate(self.bounds)
+                ]
+            )
+        return positions.astype(PATH_DTYPE), unbounded[-1]
+
+    def generate_array(
+        self, start_x: int, start_y: int, steps: int, max_step_size: int = 50
+    ) -> np.ndarray:
+        """
+        Generate a whole walk in one vectorized pass
+
+        Args:
+            start_x: X coordinate of start
+            start_y: Y coordinate of start
+            steps: Number of steps
+            max_step_size: Maximum step size per axis
+
+        Returns:
+            Integer array of shape (steps + 1, 2)
+        """
+        state = self.start_state(start_x, start_y)
+        positions, _ = self.advance(state, self.draw_steps(steps, max_step_size))
+        return np.concatenate((state[np.newaxis].astype(PATH_DTYPE), positions))
+
+    def generate(
+        self, start_x: int, start_y: int, steps: int, max_step_size: int = 50
+    ) -> Path:
+        """
+        Generate a whole walk as a Path
+
+        Args:
+            start_x: X coordinate of start
+            start_y: Y coordinate of start
+            steps: Number of steps
+            max_step_size: Maximum step size per axis
+
+        Returns:
+            Path of steps + 1 points
+        """
+        return Path(self.generate_array(start_x, start_y, steps, max_step_size))
+
+    def generate_many(
+        self,
+        starts: Sequence[Tuple[int, int]],
+        steps: int,
+        max_step_size: int = 50,
+        max_workers: Optional[int] = None,
+    ) -> List[Path]:
+        """
+        Generate several independent walks in parallel
+
+        Each walk uses its own spawned seed stream, so results do not depend
+        on scheduling and are identical for the same engine seed.
+
+        Args:
+            starts: Start positions, one per walk
+            steps: Number of steps per walk
+            max_step_size: Maximum step size per axis
+            max_workers: Worker threads (default from ThreadPoolExecutor)
+
+        Returns:
+            List of Paths in the order of starts
+        """
+        engines = self.spawn(len(starts))
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(
+                executor.map(
+                    lambda job: job[0].generate(
+                        job[1][0], job[1][1], steps, max_step_size
+                    ),
+                    zip(engines, starts),
+                )
+            )
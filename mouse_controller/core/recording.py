@@ -0,0 +1,592 @@
+"""
+Recording and replay of cursor traces in a compact binary format
+
+A recording stores only position changes. Samples are grouped into chunks;
+within a chunk the first sample is stored as is and the rest as varint
+time deltas plus zigzag varint coordinate deltas, optionally zlib
+compressed. An index of chunk times at the end of the file lets readers
+jump to a time range without decoding earlier chunks; a file cut short
+(e.g. by a crash) is still readable up to its last complete chunk.
+
+File layout::
+
+    header   <4sBBHddd  magic, version, flags, reserved, tick (s),
+                        recording rate (Hz), start time (Unix epoch)
+    chunk    <IIIqii    samples, payload bytes, payload crc32,
+                        first time (ticks), first x, first y
+             payload    varints of (dt, zigzag dx, zigzag dy) per sample
+    ...
+    index    <qqQI      first time, last time, file offset, samples
+             per chunk
+    footer   <QI4s      index offset, chunk count, index magic
+"""
+
+import logging
+import struct
+import threading
+import time
+import zlib
+from bisect import bisect_left
+from typing import (
+    BinaryIO,
+    Callable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Union,
+)
+
+import numpy as np
+
+from .path import Path
+from .stop_token import StopToken
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"MCTR"
+INDEX_MAGIC = b"MCTI"
+VERSION = 1
+
+# Header flags
+COMPRESSED = 0x01
+
+HEADER = struct.Struct("<4sBBHddd")
+CHUNK = struct.Struct("<IIIqii")
+INDEX_ENTRY = struct.Struct("<qqQI")
+FOOTER = struct.Struct("<QI4s")
+
+# Samples per chunk
+DEFAULT_CHUNK_SIZE = 4096
+
+
+class RecordingError(ValueError):
+    """Raised when a recording file is malformed"""
+
+
+class ChunkInfo(NamedTuple):
+    """Index entry of one chunk"""
+
+    first: int
+    last: int
+    offset: int
+    count: int
+
+
+def zigzag_encode(values: np.ndarray) -> np.ndarray:
+    """Map signed integers to unsigned ones with small magnitudes first"""
+    values = np.asarray(values, dtype=np.int64)
+    return ((values << 1) ^ (values >> 63)).astype(np.uint64)
+
+
+def zigzag_decode(values: np.ndarray) -> np.ndarray:
+    """Inverse of zigzag_encode"""
+    values = np.asarray(values, dtype=np.uint64)
+    sign = (values & np.uint64(1)).astype(np.int64)
+    return (values >> np.uint64(1)).astype(np.int64) ^ -sign
+
+
+def encode_varints(values: np.ndarray) -> bytes:
+    """
+    Encode unsigned integers as LEB128 varints
+
+    Args:
+        values: Array of unsigned integers
+
+    Returns:
+        Concatenated varints, 7 bits per byte, low bits first
+    """
+    values = np.asarray(values, dtype=np.uint64).ravel()
+    if not len(values):
+        return b""
+
+    sizes = np.ones(len(values), dtype=np.int64)
+    for k in range(1, 10):
+        longer = values >= np.uint64(1 << (7 * k))
+        if not longer.any():
+            break
+        sizes += longer
+
+    starts = np.cumsum(sizes) - sizes
+    out = np.empty(int(sizes.sum()), dtype=np.uint8)
+    for k in range(int(sizes.max())):
+        mask = sizes > k
+        byte = (values[mask] >> np.uint64(7 * k)) & np.uint64(0x7F)
+        more = (sizes[mask] - 1 > k).astype(np.uint64) << np.uint64(7)
+        out[starts[mask] + k] = byte | more
+    return out.tobytes()
+
+
+def decode_varints(data: bytes) -> np.ndarray:
+    """
+    Decode concatenated LEB128 varints
+
+    Args:
+        data: Bytes produced by encode_varints
+
+    Returns:
+        Array of uint64 values
+    """
+    raw = np.frombuffer(data, dtype=np.uint8)
+    if not len(raw):
+        return np.zeros(0, dtype=np.uint64)
+    if raw[-1] & 0x80:
+        raise RecordingError("truncated varint")
+
+    ends = np.flatnonzero(raw < 0x80)
+    starts = np.concatenate(([0], ends[:-1] + 1))
+    lengths = ends - starts + 1
+    if lengths.max() > 10:
+        raise RecordingError("varint longer than 64 bits")
+
+    position = np.arange(len(raw)) - np.repeat(starts, lengths)
+    parts = (raw & 0x7F).astype(np.uint64) << (7 * position).astype(np.uint64)
+    return np.add.reduceat(parts, starts)
+
+
+class TrajectoryRecorder:
+    """Writes cursor position changes to a recording file"""
+
+    def __init__(
+        self,
+        target: Union[str, BinaryIO],
+        rate: float = 100.0,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        tick: float = 0.001,
+        compress: bool = True,
+    ):
+        """
+        Initialize TrajectoryRecorder
+
+        Args:
+            target: File path or binary file object to write
+            rate: Polling rate of start() in samples per second
+            chunk_size: Samples per chunk
+            tick: Time resolution in seconds
+            compress: zlib-compress chunk payloads
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+        if tick <= 0:
+            raise ValueError("tick must be positive")
+
+        self.rate = rate
+        self.chunk_size = chunk_size
+        self.tick = tick
+        self.compress = compress
+        # Samples written, for diagnostics
+        self.samples = 0
+
+        self._owned = isinstance(target, str)
+        self._file: BinaryIO = open(target, "wb") if self._owned else target
+        self._origin = time.perf_counter()
+        self._offset = 0
+        self._write(
+            HEADER.pack(
+                MAGIC,
+                VERSION,
+                COMPRESSED if compress else 0,
+                0,
+                tick,
+                rate,
+                time.time(),
+            )
+        )
+
+        self._ticks: List[int] = []
+        self._points: List[Tuple[int, int]] = []
+        self._index: List[ChunkInfo] = []
+        self._last: Optional[Tuple[int, int]] = None
+        self._last_tick = 0
+        self._closed = False
+        self._lock = threading.Lock()
+        self._stop = StopToken()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def bytes_written(self) -> int:
+        """Bytes written to the file so far"""
+        return self._offset
+
+    def _write(self, data: bytes):
+        self._file.write(data)
+        self._offset += len(data)
+
+    def record(self, x: int, y: int, timestamp: Optional[float] = None) -> bool:
+        """
+        Add a sample if the position changed
+
+        Args:
+            x: X coordinate
+            y: Y coordinate
+            timestamp: time.perf_counter() of the sample (now if None)
+
+        Returns:
+            True if the sample was stored
+        """
+        if timestamp is None:
+            timestamp = time.perf_counter()
+
+        with self._lock:
+            if self._closed:
+                raise ValueError("recorder is closed")
+            point = (int(x), int(y))
+            if point == self._last:
+                return False
+
+            ticks = max(round((timestamp - self._origin) / self.tick), self._last_tick)
+            self._ticks.append(ticks)
+            self._points.append(point)
+            self._last = point
+            self._last_tick = ticks
+            self.samples += 1
+
+            if len(self._ticks) >= self.chunk_size:
+                self._flush()
+            return True
+
+    def _flush(self):
+        """Write buffered samples as one chunk"""
+        if not self._ticks:
+            return
+
+        ticks = np.array(self._ticks, dtype=np.int64)
+        xy = np.array(self._points, dtype=np.int64)
+        deltas = np.column_stack(
+            (
+                np.diff(ticks).astype(np.uint64),
+                zigzag_encode(np.diff(xy[:, 0])),
+                zigzag_encode(np.diff(xy[:, 1])),
+            )
+        )
+        payload = encode_varints(deltas)
+        if self.compress:
+            payload = zlib.compress(payload)
+
+        self._index.append(
+            ChunkInfo(int(ticks[0]), int(ticks[-1]), self._offset, len(ticks))
+        )
+        self._write(
+            CHUNK.pack(
+                len(ticks),
+                len(payload),
+                zlib.crc32(payload),
+                int(ticks[0]),
+                int(xy[0, 0]),
+                int(xy[0, 1]),
+            )
+        )
+        self._write(payload)
+        self._ticks.clear()
+        self._points.clear()
+
+    def start(self, mover) -> "TrajectoryRecorder":
+        """
+        Poll a mover's cursor position on a background thread
+
+        Args:
+            mover: Object with get_current_position(), e.g. MouseMover
+
+        Returns:
+            The recorder
+        """
+        if self._thread is not None and self._thread.is_alive():
+            return self
+        self._stop.reset()
+        self._thread = threading.Thread(
+            target=self._run,
+            args=(mover.get_current_position,),
+            name="trajectory-recorder",
+            daemon=True,
+        )
+        self._thread.start()
+        return self
+
+    def _run(self, position: Callable[[], Tuple[int, int]]):
+        """Poll against absolute deadlines until stopped"""
+        period = 1.0 / self.rate
+        deadline = time.perf_counter()
+        while not self._stop.stopped:
+            try:
+                x, y = position()
+            except Exception as e:
+                # Keep polling: a transient backend error must not end the recording
+                logger.error(f"Position polling failed: {e}")
+            else:
+                self.record(x, y)
+
+            deadline += period
+            now = time.perf_counter()
+            if deadline < now:
+                deadline = now
+            self._stop.wait(deadline - now)
+
+    def attach(self, sampler) -> Callable[[], None]:
+        """
+        Record the position changes of a PositionSampler
+
+        Args:
+            sampler: Running PositionSampler
+
+        Returns:
+            Function that detaches the recorder
+        """
+        return sampler.subscribe(
+            lambda sample: self.record(sample.x, sample.y, sample.time)
+        )
+
+    def stop(self, timeout: Optional[float] = 1.0):
+        """
+        Stop polling started with start()
+
+        Args:
+            timeout: Maximum time to wait for the thread in seconds
+        """
+        self._stop.stop("recorder stopped")
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def close(self):
+        """Stop polling, write the last chunk and the index"""
+        self.stop()
+        with self._lock:
+            if self._closed:
+                return
+            self._flush()
+            index_offset = self._offset
+            for info in self._index:
+                self._write(INDEX_ENTRY.pack(*info))
+            self._write(FOOTER.pack(index_offset, len(self._index), INDEX_MAGIC))
+            self._closed = True
+
+        if self._owned:
+            self._file.close()
+        else:
+            self._file.flush()
+
+    def __enter__(self) -> "TrajectoryRecorder":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class TrajectoryReader:
+    """Reads and replays a recording file"""
+
+    def __init__(self, source: Union[str, bytes, BinaryIO]):
+        """
+        Open a recording
+
+        Args:
+            source: File path, file contents or binary file object
+        """
+        if isinstance(source, str):
+            with open(source, "rb") as f:
+                data = f.read()
+        elif isinstance(source, (bytes, bytearray)):
+            data = bytes(source)
+        else:
+            data = source.read()
+
+        if len(data) < HEADER.size:
+            raise RecordingError("file too short for a recording header")
+        magic, version, flags, _, tick, rate, start_time = HEADER.unpack_from(data)
+        if magic != MAGIC:
+            raise RecordingError("not a trajectory recording")
+        if version != VERSION:
+            raise RecordingError(f"unsupported recording version {version}")
+
+        self.tick = tick
+        self.rate = rate
+        # Unix time at which the recording started
+        self.start_time = start_time
+        self.compressed = bool(flags & COMPRESSED)
+        self._data = data
+        self.chunks = self._read_index() or self._scan_chunks()
+
+    def _read_index(self) -> List[ChunkInfo]:
+        """Chunk index from the footer, or [] if the file has none"""
+        data = self._data
+        if len(data) < HEADER.size + FOOTER.size:
+            return []
+        index_offset, count, magic = FOOTER.unpack_from(data, len(data) - FOOTER.size)
+        if magic != INDEX_MAGIC:
+            return []
+        if index_offset + count * INDEX_ENTRY.size != len(data) - FOOTER.size:
+            raise RecordingError("corrupt chunk index")
+        return [
+            ChunkInfo(
+                *INDEX_ENTRY.unpack_from(data, index_offset + i * INDEX_ENTRY.size)
+            )
+            for i in range(count)
+        ]
+
+    def _scan_chunks(self) -> List[ChunkInfo]:
+        """Rebuild the index of a file without one, up to its last whole chunk"""
+        data = self._data
+        chunks = []
+        offset = HEADER.size
+        while offset + CHUNK.size <= len(data):
+            count, size, crc, first = CHUNK.unpack_from(data, offset)[:4]
+            end = offset + CHUNK.size + size
+            if count == 0 or end > len(data):
+                break
+            if zlib.crc32(data[offset + CHUNK.size : end]) != crc:
+                break
+            chunks.append(ChunkInfo(first, -1, offset, count))
+            offset = end
+
+        # Last times are only known after decoding
+        return [info._replace(last=int(self._decode(info)[0][-1])) for info in chunks]
+
+    def __len__(self) -> int:
+        return sum(info.count for info in self.chunks)
+
+    @property
+    def duration(self) -> float:
+        """Seconds from the first to the last sample"""
+        if not self.chunks:
+            return 0.0
+        return (self.chunks[-1].last - self.chunks[0].first) * self.tick
+
+    def _decode(self, info: ChunkInfo) -> Tuple[np.ndarray, np.ndarray]:
+        """Ticks of shape (N,) and positions of shape (N, 2) of one chunk"""
+        count, size, crc, first, x, y = CHUNK.unpack_from(self._data, info.offset)
+        start = info.offset + CHUNK.size
+        payload = self._data[start : start + size]
+        if zlib.crc32(payload) != crc:
+            raise RecordingError(f"checksum mismatch in chunk at {info.offset}")
+        if self.compressed:
+            payload = zlib.decompress(payload)
+
+        deltas = decode_varints(payload)
+        if len(deltas) != 3 * (count - 1):
+            raise RecordingError(f"bad sample count in chunk at {info.offset}")
+        deltas = deltas.reshape(-1, 3)
+
+        ticks = np.empty(count, dtype=np.int64)
+        ticks[0] = first
+        np.cumsum(deltas[:, 0].astype(np.int64), out=ticks[1:])
+        ticks[1:] += first
+
+        xy = np.empty((count, 2), dtype=np.int64)
+        xy[0] = x, y
+        np.cumsum(zigzag_decode(deltas[:, 1:]), axis=0, out=xy[1:])
+        xy[1:] += (x, y)
+        return ticks, xy
+
+    def iter_chunks(
+        self, start: float = 0.0, end: Optional[float] = None
+    ) -> Iterator[Tuple[np.ndarray, Path]]:
+        """
+        Decode chunks overlapping a time range, one at a time
+
+        Args:
+            start: Seconds since the first sample
+            end: Seconds since the first sample (to the end if None)
+
+        Yields:
+            Tuples of (seconds since the first sample, positions)
+        """
+        if not self.chunks:
+            return
+        origin = self.chunks[0].first
+        low = origin + start / self.tick
+        high = None if end is None else origin + end / self.tick
+
+        # Chunks are in time order; skip those ending before the range
+        first = bisect_left([info.last for info in self.chunks], low)
+        for info in self.chunks[first:]:
+            if high is not None and info.first > high:
+                break
+            ticks, xy = self._decode(info)
+            keep = ticks >= low
+            if high is not None:
+                keep &= ticks <= high
+            if keep.any():
+                yield (ticks[keep] - origin) * self.tick, Path(xy[keep])
+
+    def read(
+        self, start: float = 0.0, end: Optional[float] = None
+    ) -> Tuple[np.ndarray, Path]:
+        """
+        Decode samples in a time range
+
+        Args:
+            start: Seconds since the first sample
+            end: Seconds since the first sample (to the end if None)
+
+        Returns:
+            Tuple of (seconds since the first sample, positions)
+        """
+        parts = list(self.iter_chunks(start, end))
+        if not parts:
+            return np.zeros(0), Path(np.zeros((0, 2), dtype=np.int32))
+        return (
+            np.concatenate([times for times, _ in parts]),
+            Path(np.concatenate([path.array for _, path in parts])),
+        )
+
+    def replay(
+        self,
+        mover,
+        speed: float = 1.0,
+        rate: Optional[float] = None,
+        stop_token: Optional[StopToken] = None,
+        max_hold: float = 1.0,
+        start: float = 0.0,
+        end: Optional[float] = None,
+    ) -> bool:
+        """
+        Play the recording back through a mover
+
+        Stretches of movement are resampled to a fixed frame rate and
+        streamed chunk by chunk through ``move_smooth_path`` in realtime
+        mode; pauses longer than max_hold are waited out instead of
+        repeating the held position.
+
+        Args:
+            mover: MouseMover to move the cursor with
+            speed: Playback speed factor (2.0 plays twice as fast)
+            rate: Frames per second (defaults to the recording rate)
+            stop_token: Token stopping the replay
+            max_hold: Longest pause in recording seconds played as frames
+            start: Seconds since the first sample to start from
+            end: Seconds since the first sample to stop at (end if None)
+
+        Returns:
+            True if the whole range was replayed, False if stopped or failed
+        """
+        if speed <= 0:
+            raise ValueError("speed must be positive")
+        rate = rate or self.rate
+        # Recording seconds covered by one output frame
+        step = speed / rate
+        token = stop_token or StopToken()
+
+        began = time.perf_counter()
+        for times, path in self.iter_chunks(start, end):
+            xy = path.array
+            cuts = np.flatnonzero(np.diff(times) > max_hold) + 1
+            for segment in np.split(np.arange(len(times)), cuts):
+                due = began + (times[segment[0]] - start) / speed
+                if token.wait(due - time.perf_counter()):
+                    return False
+
+                segment_times = times[segment]
+                # Frames every step, always ending on the segment's last sample
+                grid = np.append(
+                    np.arange(segment_times[0], segment_times[-1], step),
+                    segment_times[-1],
+                )
+                held = segment[np.searchsorted(segment_times, grid, "right") - 1]
+                if not mover.move_smooth_path(
+                    xy[held], 1.0 / rate, realtime=True, stop_token=token
+                ):
+                    return False
+        return True
@@ -0,0 +1,428 @@
+"""
+Pattern registry with lazy loading of built-in and plugin patterns
+
+A pattern is described by a PatternSpec holding only metadata and a
+"module:attribute" loader string; the module is imported the first time the
+pattern is built. Third-party packages add patterns through the
+``mouse_controller.patterns`` entry point group:
+
+    [project.entry-points."mouse_controller.patterns"]
+    zigzag = "my_package.shapes:zigzag"
+
+The target is called as ``factory(context, **params)`` and returns points.
+Keyword parameters with defaults are exposed to the menus as ParamSpecs.
+"""
+
+import importlib
+import inspect
+import logging
+import threading
+from typing import Any, Callable, Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+from .path import Path
+from ..utils.tracing import tracer
+
+ENTRY_POINT_GROUP = "mouse_controller.patterns"
+PLUGIN_CATEGORY = "Plugins"
+PLUGIN_ICON = "🧩"
+
+logger = logging.getLogger(__name__)
+
+
+class ParamSpec(NamedTuple):
+    """Description of a pattern parameter shown in the menus"""
+
+    name: str
+    label: str
+    type: type = int
+    # None means the pattern derives the value from the context size
+    default: Any = None
+
+
+class PatternContext(NamedTuple):
+    """Screen state a pattern is built for"""
+
+    center_x: int
+    center_y: int
+    size: int
+    screen_width: int
+    screen_height: int
+    cursor_x: int
+    cursor_y: int
+
+    @classmethod
+    def from_mover(cls, mover, size: int) -> "PatternContext":
+        """
+        Create context centered on the monitor under the cursor of a mover
+
+        Args:
+            mover: MouseMover instance
+            size: Pattern size in pixels
+
+        Returns:
+            PatternContext
+        """
+        cursor_x, cursor_y = mover.get_current_position()
+        layout = mover.geometry.layout
+        monitor = layout.nearest_monitor(cursor_x, cursor_y)
+        return cls(
+            monitor.x + monitor.width // 2,
+            monitor.y + monitor.height // 2,
+            size,
+            layout.width,
+            layout.height,
+            cursor_x,
+            cursor_y,
+        )
+
+
+def _params_from_signature(factory: Callable) -> Tuple[ParamSpec, ...]:
+    """Describe keyword parameters with defaults of a pattern factory"""
+    params = []
+    for parameter in inspect.signature(factory).parameters.values():
+        if parameter.default is inspect.Parameter.empty:
+            continue
+        default = parameter.default
+        if parameter.annotation in (int, float, bool, str):
+            kind = parameter.annotation
+        else:
+            kind = type(default) if default is not None else int
+        label = parameter.name.replace("_", " ").capitalize()
+        params.append(ParamSpec(parameter.name, label, kind, default))
+    return tuple(params)
+
+
+class PatternSpec:
+    """Metadata of a pattern and a lazy reference to its factory"""
+
+    def __init__(
+        self,
+        name: str,
+        loader: str,
+        label: Optional[str] = None,
+        icon: str = PLUGIN_ICON,
+        category: str = PLUGIN_CATEGORY,
+        size_label: str = "Size (pixels)",
+        default_size: int = 150,
+        duration: float = 0.05,
+        params: Optional[Tuple[ParamSpec, ...]] = None,
+    ):
+        """
+        Initialize PatternSpec
+
+        Args:
+            name: Unique pattern name
+            loader: Factory reference as "module:attribute"
+            label: Human-readable name (derived from name if None)
+            icon: Icon shown before the label
+            category: Menu section
+            size_label: Prompt for the size value
+            default_size: Default size in pixels
+            duration: Time to move to each point
+            params: Extra parameters (read from the factory signature on
+                first use if None)
+        """
+        if ":" not in loader:
+            raise ValueError(f"Loader must be 'module:attribute': {loader}")
+
+        self.name = name
+        self.loader = loader
+        self.label = label or name.replace("_", " ").title()
+        self.icon = icon
+        self.category = category
+        self.size_label = size_label
+        self.default_size = default_size
+        self.duration = duration
+        self._params = params
+        self._factory: Optional[Callable] = None
+
+    @property
+    def title(self) -> str:
+        """Label with icon, as shown in menus"""
+        return f"{self.icon} {self.label}"
+
+    @property
+    def loaded(self) -> bool:
+        """Whether the factory module has been imported"""
+        return self._factory is not None
+
+    @property
+    def params(self) -> Tuple[ParamSpec, ...]:
+        """Extra parameters of the pattern"""
+        if self._params is None:
+            self._params = _params_from_signature(self.load())
+        return self._params
+
+    def load(self) -> Callable:
+        """
+        Import the factory on first use
+
+        Returns:
+            Pattern factory
+        """
+        if self._factory is None:
+            module_name, _, attribute = self.loader.partition(":")
+            target: Any = importlib.import_module(module_name)
+            for part in attribute.split("."):
+                target = getattr(target, part)
+            self._factory = target
+        return self._factory
+
+    def build(self, context: PatternContext, **params) -> Path:
+        """
+        Generate pattern points
+
+        Args:
+            context: Screen state to build the pattern for
+            **params: Values for the pattern parameters
+
+        Returns:
+            Path of the pattern
+        """
+        factory = self.load()
+        with tracer.span(f"pattern.{self.name}", "pattern", size=context.size):
+            return Path(factory(context, **params))
+
+    def __repr__(self) -> str:
+        return f"PatternSpec({self.name!r}, {self.loader!r})"
+
+
+def builtin_specs() -> List[PatternSpec]:
+    """
+    Create specs of the built-in patterns
+
+    Returns:
+        List of PatternSpec pointing into builtin_patterns
+    """
+    shapes = "Geometric Shapes"
+    waves = "Waves and Complex Movements"
+
+    def spec(name, icon, label, category, **kwargs) -> PatternSpec:
+        loader = f"{__package__}.builtin_patterns:{name}"
+        return PatternSpec(name, loader, label, icon, category, **kwargs)
+
+    return [
+        spec(
+            "circle",
+            "🔄",
+            "Circle",
+            shapes,
+            size_label="Circle radius (pixels)",
+            default_size=100,
+            duration=0.02,
+            params=(ParamSpec("clockwise", "Clockwise?", bool, True),),
+        ),
+        spec(
+            "square",
+            "⬜",
+            "Square",
+            shapes,
+            size_label="Square size (pixels)",
+            default_size=200,
+            duration=0.5,
+            params=(),
+        ),
+        spec(
+            "triangle",
+            "🔺",
+            "Triangle",
+            shapes,
+            size_label="Triangle size (pixels)",
+            default_size=200,
+            duration=0.5,
+            params=(),
+        ),
+        spec(
+            "star",
+            "⭐",
+            "Star",
+            shapes,
+            size_label="Outer radius (pixels)",
+            duration=0.3,
+            params=(
+                ParamSpec("inner_radius", "Inner radius (pixels)"),
+                ParamSpec("points", "Number of points", int, 5),
+            ),
+        ),
+        spec(
+            "spiral",
+            "🌀",
+            "Spiral",
+            shapes,
+            size_label="Maximum radius (pixels)",
+            default_size=200,
+            params=(ParamSpec("turns", "Number of turns", int, 3),),
+        ),
+        spec(
+            "heart",
+            "❤️",
+            "Heart",
+            shapes,
+            size_label="Heart size (pixels)",
+            params=(),
+        ),
+        spec(
+            "sine_wave",
+            "〰️",
+            "Sine Wave",
+            waves,
+            size_label="Wave length (pixels)",
+            default_size=400,
+            params=(
+                ParamSpec("amplitude", "Amplitude (pixels)"),
+                ParamSpec("frequency", "Frequency", float, 2.0),
+            ),
+        ),
+        spec(
+            "figure_eight",
+            "8️⃣",
+            "Figure Eight",
+            waves,
+            size_label="Width (pixels)",
+            default_size=200,
+            params=(ParamSpec("height", "Height (pixels)"),),
+        ),
+        spec(
+            "random_walk",
+            "🎲",
+            "Random Walk",
+            waves,
+            size_label="Walk size (pixels)",
+            duration=0.3,
+            params=(
+                ParamSpec("steps", "Number of steps", int, 20),
+                ParamSpec("max_step", "Maximum step size (pixels)"),
+            ),
+        ),
+    ]
+
+
+def _entry_points(group: str) -> list:
+    """Get entry points of a group on every supported Python version"""
+    from importlib import metadata
+
+    entry_points = metadata.entry_points()
+    if hasattr(entry_points, "select"):
+        return list(entry_points.select(group=group))
+    return list(entry_points.get(group, []))
+
+
+class PatternRegistry:
+    """Ordered collection of pattern specs with entry point discovery"""
+
+    def __init__(self, group: str = ENTRY_POINT_GROUP, builtins: bool = True):
+        """
+        Initialize PatternRegistry
+
+        Args:
+            group: Entry point group to discover plugins from
+            builtins: Register the built-in patterns
+        """
+        self.group = group
+        self._specs: Dict[str, PatternSpec] = {}
+        self._discovered = False
+        self._lock = threading.Lock()
+
+        if builtins:
+            for spec in builtin_specs():
+                self.register(spec)
+
+    def register(self, spec: PatternSpec, replace: bool = False) -> PatternSpec:
+        """
+        Add pattern to the registry
+
+        Args:
+            spec: Pattern spec
+            replace: Allow replacing a pattern with the same name
+
+        Returns:
+            Registered spec
+        """
+        with self._lock:
+            if spec.name in self._specs and not replace:
+                raise ValueError(f"Pattern already registered: {spec.name}")
+            self._specs[spec.name] = spec
+        return spec
+
+    def discover(self) -> int:
+        """
+        Register patterns from installed entry points (once)
+
+        Only entry point metadata is read; plugin modules are imported when
+        a pattern is first built.
+
+        Returns:
+            Number of newly registered patterns
+        """
+        with self._lock:
+            if self._discovered:
+                return 0
+            self._discovered = True
+
+        added = 0
+        try:
+            entry_points = _entry_points(self.group)
+        except Exception as e:
+            logger.warning(f"Pattern discovery failed: {e}")
+            return 0
+
+        for entry_point in entry_points:
+            if entry_point.name in self._specs:
+                logger.warning(f"Skipping duplicate pattern: {entry_point.name}")
+                continue
+            try:
+                self.register(PatternSpec(entry_point.name, entry_point.value))
+                added += 1
+            except ValueError as e:
+                logger.warning(f"Skipping pattern {entry_point.name}: {e}")
+        return added
+
+    def get(self, name: str) -> PatternSpec:
+        """
+        Get pattern by name
+
+        Args:
+            name: Pattern name
+
+        Returns:
+            PatternSpec
+        """
+        self.discover()
+        try:
+            return self._specs[name]
+        except KeyError:
+            raise KeyError(f"Unknown pattern: {name}") from None
+
+    def specs(self, category: Optional[str] = None) -> List[PatternSpec]:
+        """
+        List patterns in registration order
+
+        Args:
+            category: Only patterns of this menu section
+
+        Returns:
+            List of PatternSpec
+        """
+        self.discover()
+        specs = list(self._specs.values())
+        if category is not None:
+            specs = [spec for spec in specs if spec.category == category]
+        return specs
+
+    def categories(self) -> List[str]:
+        """List menu sections in order of first appearance"""
+        return list(dict.fromkeys(spec.category for spec in self.specs()))
+
+    def __contains__(self, name: str) -> bool:
+        self.discover()
+        return name in self._specs
+
+    def __iter__(self) -> Iterator[PatternSpec]:
+        return iter(self.specs())
+
+    def __len__(self) -> int:
+        return len(self.specs())
+
+
+# Shared registry used by the console and GUI
+pattern_registry = PatternRegistry()
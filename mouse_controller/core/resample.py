@@ -0,0 +1,146 @@
+"""
+Arc-length reparameterization of cursor paths
+"""
+
+from typing import Callable, Iterable, Optional, Union
+
+import numpy as np
+
+from .path import Path
+
+# Number of arc-length samples used to integrate a velocity profile
+VELOCITY_GRID_SIZE = 4096
+
+PointsLike = Union[Path, np.ndarray, Iterable]
+VelocityLike = Union[float, np.ndarray, Callable[[np.ndarray], np.ndarray]]
+
+
+def _as_float_points(points: PointsLike) -> np.ndarray:
+    """Convert any path-like input to an (N, 2) float array"""
+    if isinstance(points, np.ndarray):
+        return np.asarray(points, dtype=float).reshape(-1, 2)
+    return Path(points).array.astype(float)
+
+
+def cumulative_arc_length(points: PointsLike) -> np.ndarray:
+    """
+    Compute cumulative arc length at each point of a path
+
+    Args:
+        points: Path, (N, 2) array or list of points
+
+    Returns:
+        Float array of shape (N,), starting at 0
+    """
+    xy = _as_float_points(points)
+    dx = np.diff(xy[:, 0])
+    dy = np.diff(xy[:, 1])
+    cumulative = np.empty(len(xy))
+    cumulative[0] = 0.0
+    np.cumsum(np.sqrt(dx * dx + dy * dy), out=cumulative[1:])
+    return cumulative
+
+
+def _points_at(xy: np.ndarray, cumulative: np.ndarray, s: np.ndarray) -> Path:
+    """Interpolate positions at arc-length offsets s along the polyline"""
+    # np.interp searches with a guess from the previous query, so sorted
+    # offsets are located in amortised constant time
+    positions = np.empty((len(s), 2))
+    positions[:, 0] = np.interp(s, cumulative, xy[:, 0])
+    positions[:, 1] = np.interp(s, cumulative, xy[:, 1])
+    return Path(np.rint(positions, out=positions))
+
+
+def resample_by_arc_length(
+    points: PointsLike,
+    spacing: Optional[float] = None,
+    count: Optional[int] = None,
+) -> Path:
+    """
+    Resample path so that points are evenly spaced along the curve
+
+    Args:
+        points: Path, (N, 2) array or list of points
+        spacing: Distance between samples in pixels
+        count: Number of samples (used when spacing is not given;
+            defaults to the number of input points)
+
+    Returns:
+        Resampled path, including both end points
+    """
+    xy = _as_float_points(points)
+    if len(xy) < 2:
+        return Path(np.rint(xy))
+
+    cumulative = cumulative_arc_length(xy)
+    total = cumulative[-1]
+
+    if spacing is not None:
+        if spacing <= 0:
+            raise ValueError("spacing must be positive")
+        s = np.append(np.arange(0.0, total, spacing), total)
+    else:
+        s = np.linspace(0.0, total, count or len(xy))
+
+    if total == 0:
+        return Path(np.rint(np.repeat(xy[:1], len(s), axis=0)))
+    return _points_at(xy, cumulative, s)
+
+
+def resample_by_velocity(
+    points: PointsLike,
+    velocity: VelocityLike,
+    rate: float = 60.0,
+) -> Path:
+    """
+    Resample path for fixed-rate playback following a velocity profile
+
+    Consecutive samples are 1 / rate seconds apart, so the spacing between
+    them follows the requested speed along the curve.
+
+    Args:
+        points: Path, (N, 2) array or list of points
+        velocity: Speed in pixels per second - a constant, an array of speeds
+            spread evenly over the path, or a function of the normalized
+            arc length u in [0, 1]
+        rate: Playback rate in samples per second
+
+    Returns:
+        Resampled path, including both end points
+    """
+    xy = _as_float_points(points)
+    if len(xy) < 2:
+        return Path(np.rint(xy))
+
+    cumulative = cumulative_arc_length(xy)
+    total = cumulative[-1]
+    if total == 0:
+        return Path(np.rint(xy[:1]))
+
+    u = np.linspace(0.0, 1.0, VELOCITY_GRID_SIZE)
+    if callable(velocity):
+        speed = np.asarray(velocity(u), dtype=float)
+        if speed.shape not in ((), u.shape):
+            raise ValueError(
+                "velocity function must return a scalar or one speed per u "
+                f"value, got shape {speed.shape}"
+            )
+        speed = np.broadcast_to(speed, u.shape)
+    elif np.ndim(velocity) == 0:
+        speed = np.full_like(u, float(velocity))
+    else:
+        profile = np.asarray(velocity, dtype=float)
+        speed = np.interp(u, np.linspace(0.0, 1.0, len(profile)), profile)
+
+    if (speed <= 0).any():
+        raise ValueError("velocity must be positive along the whole path")
+
+    # Time to reach each grid point: integral of ds / v (trapezoidal rule)
+    s_grid = u * total
+    inverse = 1.0 / speed
+    dt = np.diff(s_grid) * (inverse[:-1] + inverse[1:]) / 2
+    t_grid = np.concatenate(([0.0], np.cumsum(dt)))
+
+    frame_times = np.append(np.arange(0.0, t_grid[-1], 1.0 / rate), t_grid[-1])
+    s = np.interp(frame_times, t_grid, s_grid)
+    return _points_at(xy, cumulative, s)
@@ -0,0 +1,261 @@
+"""
+Cursor position sampling on one shared thread
+
+A single PositionSampler polls the backend and keeps timestamped positions
+in a fixed-size ring buffer. Consumers read ``latest()`` or ``history()``
+or subscribe to position changes instead of querying the backend
+themselves. While the cursor is still the sampler drops to a lower rate.
+"""
+
+import logging
+import threading
+import time
+from typing import Callable, List, NamedTuple, Optional, Tuple, Union
+
+import numpy as np
+
+from .stop_token import StopToken
+from ..backends import MouseBackend, get_backend
+
+# Highest supported sampling rate (samples per second)
+MAX_RATE = 1000.0
+
+logger = logging.getLogger(__name__)
+
+
+class PositionSample(NamedTuple):
+    """Cursor position at a perf_counter timestamp"""
+
+    time: float
+    x: int
+    y: int
+
+
+class _Subscriber:
+    __slots__ = ("callback", "min_interval", "last_sent")
+
+    def __init__(self, callback: Callable[[PositionSample], None], min_interval: float):
+        self.callback = callback
+        self.min_interval = min_interval
+        self.last_sent = float("-inf")
+
+
+class PositionSampler:
+    """Polls the cursor position into a ring buffer on a background thread"""
+
+    def __init__(
+        self,
+        backend: Union[str, MouseBackend, None] = None,
+        rate: float = 250.0,
+        idle_rate: float = 20.0,
+        idle_after: float = 0.5,
+        capacity: int = 4096,
+    ):
+        """
+        Initialize PositionSampler
+
+        Args:
+            backend: Output backend name or instance to read positions from
+            rate: Samples per second while the cursor moves (up to MAX_RATE)
+            idle_rate: Samples per second once the cursor is still
+            idle_after: Seconds without movement before dropping to idle_rate
+            capacity: Number of samples kept in the ring buffer
+        """
+        if not 0 < rate <= MAX_RATE:
+            raise ValueError(f"rate must be in (0, {MAX_RATE:g}]")
+        if not 0 < idle_rate <= rate:
+            raise ValueError("idle_rate must be positive and at most rate")
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+
+        self.backend = get_backend(backend)
+        self.rate = rate
+        self.idle_rate = idle_rate
+        self.idle_after = idle_after
+        self.capacity = capacity
+
+        self._times = np.zeros(capacity, dtype=np.float64)
+        self._xy = np.zeros((capacity, 2), dtype=np.int32)
+        # Samples written since start; the newest is at (count - 1) % capacity
+        self._count = 0
+        self._latest: Optional[PositionSample] = None
+        self._last_motion = 0.0
+
+        self._subscribers: List[_Subscriber] = []
+        self._lock = threading.Lock()
+        self._stop = StopToken()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def running(self) -> bool:
+        """Whether the sampling thread is alive"""
+        return self._thread is not None and self._thread.is_alive()
+
+    @property
+    def current_rate(self) -> float:
+        """Rate in use now: rate while moving, idle_rate while still"""
+        if time.perf_counter() - self._last_motion < self.idle_after:
+            return self.rate
+        return self.idle_rate
+
+    @property
+    def count(self) -> int:
+        """Samples taken since start"""
+        return self._count
+
+    def start(self) -> "PositionSampler":
+        """Start the sampling thread"""
+        if self.running:
+            return self
+        self._stop.reset()
+        self._last_motion = time.perf_counter()
+        self._thread = threading.Thread(
+            target=self._run, name="position-sampler", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self, timeout: Optional[float] = 1.0):
+        """
+        Stop the sampling thread
+
+        Args:
+            timeout: Maximum time to wait for the thread in seconds
+        """
+        self._stop.stop("sampler stopped")
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def __enter__(self) -> "PositionSampler":
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def subscribe(
+        self, callback: Callable[[PositionSample], None], min_interval: float = 0.0
+    ) -> Callable[[], None]:
+        """
+        Call back on every position change, from the sampling thread
+
+        Args:
+            callback: Function receiving the new PositionSample; keep it short
+            min_interval: Minimum seconds between calls to this subscriber
+
+        Returns:
+            Function that removes the subscription
+        """
+        subscriber = _Subscriber(callback, min_interval)
+        with self._lock:
+            self._subscribers = self._subscribers + [subscriber]
+
+        def unsubscribe():
+            with self._lock:
+                self._subscribers = [
+                    s for s in self._subscribers if s is not subscriber
+                ]
+
+        return unsubscribe
+
+    def latest(self) -> Optional[PositionSample]:
+        """Newest sample, or None before the first one"""
+        return self._latest
+
+    def history(self, seconds: Optional[float] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Copy buffered samples in chronological order
+
+        Args:
+            seconds: Only samples from the last seconds (all if None)
+
+        Returns:
+            Tuple of (timestamps of shape (N,), positions of shape (N, 2))
+        """
+        with self._lock:
+            count = min(self._count, self.capacity)
+            end = self._count % self.capacity
+            order = np.arange(end - count, end) % self.capacity
+            times = self._times[order]
+            xy = self._xy[order]
+
+        if seconds is not None and len(times):
+            start = np.searchsorted(times, times[-1] - seconds)
+            times, xy = times[start:], xy[start:]
+        return times, xy
+
+    def sample(self) -> PositionSample:
+        """
+        Take one sample now and notify subscribers if the cursor moved
+
+        Returns:
+            The new sample
+        """
+        x, y = self.backend.position()
+        now = time.perf_counter()
+        sample = PositionSample(now, x, y)
+        previous = self._latest
+
+        with self._lock:
+            index = self._count % self.capacity
+            self._times[index] = now
+            self._xy[index] = x, y
+            self._count += 1
+            self._latest = sample
+            subscribers = self._subscribers
+
+        if previous is None or (previous.x, previous.y) != (x, y):
+            self._last_motion = now
+            for subscriber in subscribers:
+                if now - subscriber.last_sent < subscriber.min_interval:
+                    continue
+                subscriber.last_sent = now
+                try:
+                    subscriber.callback(sample)
+                except Exception as e:
+                    logger.error(f"Position subscriber failed: {e}")
+        return sample
+
+    def _run(self):
+        """Sample against absolute deadlines until stopped"""
+        deadline = time.perf_counter()
+        while not self._stop.stopped:
+            try:
+                self.sample()
+            except Exception as e:
+                logger.error(f"Position sampling failed: {e}")
+
+            deadline += 1.0 / self.current_rate
+            now = time.perf_counter()
+            if deadline < now:
+                # Fell behind (or just left idle): restart the schedule
+                deadline = now
+            self._stop.wait(deadline - now)
+
+
+def corner_guard(
+    token: StopToken, width: int, height: int, margin: int = 0
+) -> Callable[[PositionSample], None]:
+    """
+    Build a subscriber that stops a token when the cursor reaches a corner
+
+    Lets movements honor the failsafe corners without polling the backend
+    on every frame.
+
+    Args:
+        token: Token to stop
+        width: Screen width
+        height: Screen height
+        margin: Corner distance in pixels that still triggers
+
+    Returns:
+        Subscriber callback for PositionSampler.subscribe
+    """
+
+    def check(sample: PositionSample):
+        on_x_edge = sample.x <= margin or sample.x >= width - 1 - margin
+        on_y_edge = sample.y <= margin or sample.y >= height - 1 - margin
+        if on_x_edge and on_y_edge:
+            token.stop(f"cursor in corner at ({sample.x}, {sample.y})")
+
+    return check
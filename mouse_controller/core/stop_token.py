@@ -0,0 +1,58 @@
+"""
+Cooperative cancellation of cursor movements
+"""
+
+import threading
+from typing import Optional
+
+
+class StopToken:
+    """Thread-safe stop signal checked by movement loops before every frame
+
+    When a loop stops, it records in ``halted_at`` the index of the first
+    point it did not send, so the same path can be resumed with
+    ``start_index=token.halted_at``.
+    """
+
+    def __init__(self):
+        """Initialize a token that is not stopped"""
+        self._event = threading.Event()
+        self.reason: Optional[str] = None
+        self.halted_at: Optional[int] = None
+
+    @property
+    def stopped(self) -> bool:
+        """Whether stop was requested"""
+        return self._event.is_set()
+
+    def stop(self, reason: str = "stop requested"):
+        """
+        Request stop; running loops halt before their next frame
+
+        Args:
+            reason: Why the movement is stopped (for logs)
+        """
+        self.reason = reason
+        self._event.set()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """
+        Sleep until stop is requested or timeout passes
+
+        Args:
+            timeout: Maximum time to wait in seconds
+
+        Returns:
+            True if stop was requested
+        """
+        return self._event.wait(timeout)
+
+    def reset(self):
+        """Clear the stop request and the halted index for reuse"""
+        self._event.clear()
+        self.reason = None
+        self.halted_at = None
+
+    def __repr__(self) -> str:
+        state = "stopped" if self.stopped else "running"
+        return f"StopToken({state}, halted_at={self.halted_at})"
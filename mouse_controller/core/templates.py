@@ -0,0 +1,200 @@
+"""
+Cached unit-scale shape templates for fast pattern placement
+"""
+
+import math
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, Optional
+
+import numpy as np
+
+from .path import PATH_DTYPE, Path
+from .trig import angle_table
+
+DEFAULT_CACHE_SIZE = 64
+
+
+def _unit_circle(steps: int, clockwise: bool = True) -> np.ndarray:
+    table = angle_table(steps)
+    sin = table.sin[0] if clockwise else -table.sin[0]
+    return np.column_stack((table.cos[0], sin))
+
+
+def _unit_square(steps: int) -> np.ndarray:
+    return np.array([[0, 0], [1, 0], [1, 1], [0, 1], [0, 0]], dtype=float)
+
+
+def _unit_triangle(steps: int) -> np.ndarray:
+    half_height = math.sqrt(3) / 4
+    return np.array(
+        [[0, -half_height], [-0.5, half_height], [0.5, half_height], [0, -half_height]]
+    )
+
+
+def _unit_star(
+    steps: int, points: int = 5, outer_radius: int = 1, inner_radius: float = 0.5
+) -> np.ndarray:
+    # Radii are part of the key rather than a ratio scaled at placement, so
+    # the vertices round exactly like generate_star_points
+    i = np.arange(points * 2 + 1)
+    i[-1] = 0
+    angle = i * (math.pi / points) - math.pi / 2
+    radius = np.where(i % 2 == 0, outer_radius, inner_radius)
+    return np.column_stack((radius * np.cos(angle), radius * np.sin(angle)))
+
+
+def _unit_spiral(steps: int, turns: int = 3) -> np.ndarray:
+    total_steps = turns * steps
+    i = np.arange(total_steps + 1)
+    angle = 2 * np.pi * i / steps
+    radius = i / total_steps
+    return np.column_stack((radius * np.cos(angle), radius * np.sin(angle)))
+
+
+def _unit_sine_wave(steps: int, frequency: float = 1.0) -> np.ndarray:
+    i = np.arange(steps + 1)
+    return np.column_stack((i / steps, np.sin(2 * np.pi * frequency * i / steps)))
+
+
+def _unit_figure_eight(steps: int) -> np.ndarray:
+    sin = angle_table(steps, 2).sin
+    return np.column_stack((sin[0] / 2, sin[1] / 4))
+
+
+def _unit_heart(steps: int) -> np.ndarray:
+    table = angle_table(steps, 4)
+    cos, sin = table.cos, table.sin
+    x = 16 * sin[0] ** 3
+    y = -(13 * cos[0] - 5 * cos[1] - 2 * cos[2] - cos[3])
+    return np.column_stack((x, y))
+
+
+UNIT_SHAPES: Dict[str, Callable[..., np.ndarray]] = {
+    "circle": _unit_circle,
+    "square": _unit_square,
+    "triangle": _unit_triangle,
+    "star": _unit_star,
+    "spiral": _unit_spiral,
+    "sine_wave": _unit_sine_wave,
+    "figure_eight": _unit_figure_eight,
+    "heart": _unit_heart,
+}
+
+
+class ShapeTemplateCache:
+    """Bounded LRU cache of unit-scale shapes placed by translation and scaling"""
+
+    def __init__(self, maxsize: int = DEFAULT_CACHE_SIZE):
+        """
+        Initialize ShapeTemplateCache
+
+        Args:
+            maxsize: Maximum number of templates kept in memory
+        """
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._templates: "OrderedDict[tuple, np.ndarray]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_template(self, shape: str, steps: int = 100, **params) -> np.ndarray:
+        """
+        Get unit-scale template, computing it on first use
+
+        Args:
+            shape: Shape name (see UNIT_SHAPES)
+            steps: Number of steps used to build the shape
+            **params: Shape-specific parameters (e.g. turns, points, frequency)
+
+        Returns:
+            Read-only float array of shape (N, 2)
+        """
+        if shape not in UNIT_SHAPES:
+            raise ValueError(f"Unknown shape: {shape}")
+
+        key = (shape, steps, tuple(sorted(params.items())))
+
+        with self._lock:
+            template = self._templates.get(key)
+            if template is not None:
+                self._templates.move_to_end(key)
+                self.hits += 1
+                return template
+            self.misses += 1
+
+        template = UNIT_SHAPES[shape](steps, **params)
+        template.flags.writeable = False
+
+        with self._lock:
+            self._templates[key] = template
+            self._templates.move_to_end(key)
+            while len(self._templates) > self.maxsize:
+                self._templates.popitem(last=False)
+                self.evictions += 1
+
+        return template
+
+    def place(
+        self,
+        shape: str,
+        origin_x: int,
+        origin_y: int,
+        scale_x: float,
+        scale_y: Optional[float] = None,
+        steps: int = 100,
+        **params,
+    ) -> Path:
+        """
+        Place cached shape on screen
+
+        Args:
+            shape: Shape name (see UNIT_SHAPES)
+            origin_x: X coordinate of shape origin (center, or start for
+                square and sine wave)
+            origin_y: Y coordinate of shape origin
+            scale_x: Horizontal scale in pixels
+            scale_y: Vertical scale in pixels (defaults to scale_x)
+            steps: Number of steps used to build the shape
+            **params: Shape-specific parameters
+
+        Returns:
+            Path of placed coordinates
+        """
+        if scale_y is None:
+            scale_y = scale_x
+
+        template = self.get_template(shape, steps, **params)
+        placed = template * (scale_x, scale_y) + (origin_x, origin_y)
+        return Path(placed.astype(PATH_DTYPE))
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Get cache statistics
+
+        Returns:
+            Dictionary with hits, misses, evictions, size and maxsize
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "size": len(self._templates),
+                "maxsize": self.maxsize,
+            }
+
+    def clear(self):
+        """Drop all cached templates and reset counters"""
+        with self._lock:
+            self._templates.clear()
+            self.hits = self.misses = self.evictions = 0
+
+
+# Process-wide cache shared by the interfaces
+template_cache = ShapeTemplateCache()
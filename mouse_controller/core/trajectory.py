@@ -0,0 +1,241 @@
+"""
+Human-like point-to-point trajectories
+
+Every move is split into submovements (an optional overshoot, optional
+micro-corrections and the final approach). Each submovement follows a
+minimum-jerk position profile and lasts as long as Fitts' law predicts for
+its distance. Whole batches of moves are planned with a handful of array
+operations, so thousands of moves can be planned per second.
+"""
+
+from typing import Iterator, NamedTuple, Optional, Tuple, Union
+
+import numpy as np
+
+from .path import Path
+
+# Fitts' law T = a + b * log2(D / W + 1), with times in seconds
+FITTS_A = 0.1
+FITTS_B = 0.15
+TARGET_WIDTH = 20.0
+
+PointsLike = Union[np.ndarray, Tuple[int, int], list]
+
+
+def fitts_duration(
+    distance: Union[float, np.ndarray],
+    target_width: float = TARGET_WIDTH,
+    a: float = FITTS_A,
+    b: float = FITTS_B,
+) -> Union[float, np.ndarray]:
+    """
+    Predict movement time with the Shannon form of Fitts' law
+
+    Args:
+        distance: Movement distance in pixels (scalar or array)
+        target_width: Target size in pixels
+        a: Start/stop time in seconds
+        b: Seconds per bit of difficulty
+
+    Returns:
+        Movement time in seconds
+    """
+    return a + b * np.log2(np.asarray(distance) / target_width + 1)
+
+
+def minimum_jerk(tau: np.ndarray) -> np.ndarray:
+    """
+    Minimum-jerk position profile
+
+    Args:
+        tau: Normalized time in [0, 1]
+
+    Returns:
+        Normalized position in [0, 1]; velocity and acceleration are zero at
+        both ends
+    """
+    tau2 = tau * tau
+    return tau2 * tau * (10 - 15 * tau + 6 * tau2)
+
+
+class TrajectoryBatch(NamedTuple):
+    """Timestamped samples of a batch of moves"""
+
+    # Float sample positions of all moves, shape (S, 2)
+    positions: np.ndarray
+    # Seconds since the start of each sample's move, shape (S,)
+    times: np.ndarray
+    # Move i owns samples offsets[i]:offsets[i + 1], shape (M + 1,)
+    offsets: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    @property
+    def durations(self) -> np.ndarray:
+        """Total duration of every move in seconds"""
+        return self.times[self.offsets[1:] - 1]
+
+    def move(self, index: int) -> Tuple[Path, np.ndarray]:
+        """
+        Get samples of one move
+
+        Args:
+            index: Move index
+
+        Returns:
+            Tuple of (path of rounded positions, sample times)
+        """
+        start, stop = self.offsets[index], self.offsets[index + 1]
+        return Path(np.rint(self.positions[start:stop])), self.times[start:stop]
+
+    def iter_timed(self, index: int) -> Iterator[Tuple[int, int, float]]:
+        """
+        Stream one move for ``MouseMover.move_timed_path``
+
+        The start sample is skipped since the cursor is already there.
+
+        Args:
+            index: Move index
+
+        Returns:
+            Iterator of (x, y, duration) tuples
+        """
+        path, times = self.move(index)
+        durations = np.diff(times).tolist()
+        for (x, y), duration in zip(path.tolist()[1:], durations):
+            yield x, y, duration
+
+
+class TrajectoryPlanner:
+    """Planner of minimum-jerk moves with Fitts' law timing"""
+
+    def __init__(
+        self,
+        rate: float = 120.0,
+        target_width: float = TARGET_WIDTH,
+        fitts_a: float = FITTS_A,
+        fitts_b: float = FITTS_B,
+        overshoot: float = 0.0,
+        max_overshoot: float = 40.0,
+        corrections: int = 0,
+        correction_size: float = 3.0,
+        seed: Optional[int] = None,
+    ):
+        """
+        Initialize TrajectoryPlanner
+
+        Args:
+            rate: Samples per second
+            target_width: Target size in pixels used for Fitts' law
+            fitts_a: Fitts' law intercept in seconds
+            fitts_b: Fitts' law slope in seconds per bit
+            overshoot: Maximum overshoot as a fraction of the move distance
+                (0 disables overshoot)
+            max_overshoot: Upper bound of the overshoot in pixels
+            corrections: Number of micro-corrections before the final approach
+            correction_size: Maximum error of the first correction in pixels;
+                every next correction halves it
+            seed: Seed for reproducible overshoots and corrections
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        if overshoot < 0 or corrections < 0:
+            raise ValueError("overshoot and corrections must not be negative")
+
+        self.rate = rate
+        self.target_width = target_width
+        self.fitts_a = fitts_a
+        self.fitts_b = fitts_b
+        self.overshoot = overshoot
+        self.max_overshoot = max_overshoot
+        self.corrections = corrections
+        self.correction_size = correction_size
+        self.rng = np.random.default_rng(seed)
+
+    def _waypoints(self, starts: np.ndarray, ends: np.ndarray) -> np.ndarray:
+        """Build submovement waypoints of shape (M, P + 1, 2)"""
+        count = len(starts)
+        waypoints = [starts]
+
+        if self.overshoot > 0:
+            delta = ends - starts
+            distance = np.hypot(delta[:, 0], delta[:, 1])[:, np.newaxis]
+            direction = np.divide(
+                delta, distance, out=np.zeros_like(delta), where=distance > 0
+            )
+            amount = np.minimum(self.overshoot * distance, self.max_overshoot)
+            amount *= self.rng.uniform(0.5, 1.0, size=(count, 1))
+            waypoints.append(ends + direction * amount)
+
+        size = self.correction_size
+        for _ in range(self.corrections):
+            waypoints.append(ends + self.rng.uniform(-size, size, size=(count, 2)))
+            size /= 2
+
+        waypoints.append(ends)
+        return np.stack(waypoints, axis=1)
+
+    def plan(self, starts: PointsLike, ends: PointsLike) -> TrajectoryBatch:
+        """
+        Plan a batch of moves in one vectorized pass
+
+        Args:
+            starts: Start points, (M, 2) array or a single (x, y)
+            ends: Target points, (M, 2) array or a single (x, y)
+
+        Returns:
+            TrajectoryBatch with samples of every move
+        """
+        starts = np.asarray(starts, dtype=float).reshape(-1, 2)
+        ends = np.asarray(ends, dtype=float).reshape(-1, 2)
+        starts, ends = np.broadcast_arrays(starts, ends)
+
+        waypoints = self._waypoints(starts, ends)
+        moves, phases = waypoints.shape[0], waypoints.shape[1] - 1
+
+        # Flatten submovements: phase j of move i is row i * phases + j
+        origin = waypoints[:, :-1].reshape(-1, 2)
+        delta = waypoints[:, 1:].reshape(-1, 2) - origin
+        distance = np.hypot(delta[:, 0], delta[:, 1])
+
+        duration = fitts_duration(
+            distance, self.target_width, self.fitts_a, self.fitts_b
+        )
+        samples = np.maximum(np.ceil(duration * self.rate).astype(np.int64), 1)
+
+        # Each phase contributes samples at tau = k / n for k in 1..n
+        phase = np.repeat(np.arange(len(samples)), samples)
+        first = np.cumsum(samples) - samples
+        k = np.arange(1, len(phase) + 1) - np.repeat(first, samples)
+        tau = k / samples[phase]
+
+        positions = origin[phase] + delta[phase] * minimum_jerk(tau)[:, np.newaxis]
+
+        # Time since the start of the move: earlier phases plus this one
+        phase_duration = duration.reshape(moves, phases)
+        phase_start = np.cumsum(phase_duration, axis=1) - phase_duration
+        times = phase_start.reshape(-1)[phase] + tau * duration[phase]
+
+        # Prepend the start point of every move at time 0
+        per_move = samples.reshape(moves, phases).sum(axis=1)
+        move_first = np.cumsum(per_move) - per_move
+        positions = np.insert(positions, move_first, starts, axis=0)
+        times = np.insert(times, move_first, 0.0)
+
+        offsets = np.zeros(moves + 1, dtype=np.int64)
+        np.cumsum(per_move + 1, out=offsets[1:])
+        return TrajectoryBatch(positions, times, offsets)
+
+    def plan_one(self, start: Tuple[int, int], end: Tuple[int, int]) -> TrajectoryBatch:
+        """
+        Plan a single move
+
+        Args:
+            start: Start point (x, y)
+            end: Target point (x, y)
+
+        Returns:
+            TrajectoryBatch holding one move
+        """
+        return self.plan([start], [end])
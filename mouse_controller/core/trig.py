@@ -0,0 +1,139 @@
+"""
+Shared trigonometric lookup tables for circular patterns
+
+All circular patterns sample angles on the grid t = 2 * pi * i / steps (and
+multiples k * t). Tables for a step count are computed once, stored
+read-only and shared process-wide, so generating thousands of shapes per
+second costs only an index lookup.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Tuple
+
+import numpy as np
+
+# Larger step counts are computed directly instead of being tabulated
+MAX_TABLE_STEPS = 1 << 14
+
+# Total size of the tables kept in the process-wide cache (bytes); the
+# largest single table (4 harmonics of MAX_TABLE_STEPS) takes about 1 MB
+MAX_CACHE_BYTES = 4 << 20
+
+
+class AngleTable:
+    """Cosines and sines of k * 2 * pi * i / steps for i in 0..steps"""
+
+    __slots__ = ("steps", "harmonics", "cos", "sin")
+
+    def __init__(self, steps: int, harmonics: int = 1):
+        """
+        Initialize AngleTable
+
+        Args:
+            steps: Number of steps in a full turn
+            harmonics: Highest angle multiple k to tabulate
+        """
+        t = 2 * np.pi * np.arange(steps + 1) / steps
+        multiples = [t] + [k * t for k in range(2, harmonics + 1)]
+
+        self.steps = steps
+        self.harmonics = harmonics
+        self.cos = np.cos(multiples)
+        self.sin = np.sin(multiples)
+        self.cos.flags.writeable = False
+        self.sin.flags.writeable = False
+
+    @property
+    def nbytes(self) -> int:
+        """Memory taken by the cosines and sines"""
+        return self.cos.nbytes + self.sin.nbytes
+
+
+_tables: "OrderedDict[int, AngleTable]" = OrderedDict()
+_lock = threading.Lock()
+# Total nbytes of the cached tables
+_cached_bytes = 0
+
+
+def angle_table(steps: int, harmonics: int = 1) -> AngleTable:
+    """
+    Get shared angle table for a step count
+
+    Args:
+        steps: Number of steps in a full turn
+        harmonics: Highest angle multiple k needed (e.g. 4 for the heart)
+
+    Returns:
+        AngleTable with rows for k = 1..harmonics (at least)
+    """
+    with _lock:
+        table = _tables.get(steps)
+        if table is not None and table.harmonics >= harmonics:
+            _tables.move_to_end(steps)
+            return table
+
+    table = AngleTable(steps, harmonics)
+
+    global _cached_bytes
+    with _lock:
+        current = _tables.get(steps)
+        if current is not None:
+            if current.harmonics >= harmonics:
+                return current
+            _cached_bytes -= current.nbytes
+        _tables[steps] = table
+        _tables.move_to_end(steps)
+        _cached_bytes += table.nbytes
+        while _cached_bytes > MAX_CACHE_BYTES and len(_tables) > 1:
+            _cached_bytes -= _tables.popitem(last=False)[1].nbytes
+
+    return table
+
+
+def cos_sin_harmonics(
+    i: np.ndarray, steps: int, harmonics: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Get cos and sin of k * 2 * pi * i / steps for k = 1..harmonics
+
+    Uses the shared table when the step count is small enough to tabulate.
+
+    Args:
+        i: Step indices in 0..steps
+        steps: Number of steps in a full turn
+        harmonics: Highest angle multiple k
+
+    Returns:
+        Tuple of (cos, sin) arrays of shape (harmonics, len(i))
+    """
+    if steps <= MAX_TABLE_STEPS:
+        table = angle_table(steps, harmonics)
+        return table.cos[:harmonics, i], table.sin[:harmonics, i]
+
+    t = 2 * np.pi * np.asarray(i) / steps
+    multiples = [t] + [k * t for k in range(2, harmonics + 1)]
+    return np.cos(multiples), np.sin(multiples)
+
+
+def cos_sin(i: np.ndarray, steps: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Get cos and sin of 2 * pi * i / steps
+
+    Args:
+        i: Step indices in 0..steps
+        steps: Number of steps in a full turn
+
+    Returns:
+        Tuple of (cos, sin) arrays
+    """
+    cos, sin = cos_sin_harmonics(i, steps, 1)
+    return cos[0], sin[0]
+
+
+def clear_tables():
+    """Drop all cached tables"""
+    global _cached_bytes
+    with _lock:
+        _tables.clear()
+        _cached_bytes = 0
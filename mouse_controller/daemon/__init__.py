@@ -0,0 +1,16 @@
+"""
+Демон керування курсором через Unix-сокет
+"""
+
+from .client import DaemonError, MotionClient
+from .protocol import ProtocolError
+from .server import DEFAULT_WINDOW, MotionDaemon, default_socket_path
+
+__all__ = [
+    "DEFAULT_WINDOW",
+    "DaemonError",
+    "MotionClient",
+    "MotionDaemon",
+    "ProtocolError",
+    "default_socket_path",
+]
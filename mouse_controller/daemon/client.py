@@ -0,0 +1,208 @@
+"""
+Client of the control daemon
+
+One persistent connection per client. Point batches are pipelined: up to
+``window`` requests are sent before the client waits for replies, so the
+socket stays busy while the daemon moves the cursor. Replies of requests
+sent without ``wait`` are not kept; failed ones are only counted.
+"""
+
+import logging
+import socket
+from typing import Any, Dict, Optional, Set, Tuple
+
+from . import protocol
+from .server import DEFAULT_WINDOW, default_socket_path
+
+logger = logging.getLogger(__name__)
+
+
+class DaemonError(RuntimeError):
+    """Raised when the daemon answers a request with an error"""
+
+
+class MotionClient:
+    """Connection to a running MotionDaemon"""
+
+    def __init__(
+        self,
+        socket_path: Optional[str] = None,
+        window: int = DEFAULT_WINDOW,
+        timeout: Optional[float] = None,
+    ):
+        """
+        Connect to the daemon
+
+        Args:
+            socket_path: Path of the daemon socket (see default_socket_path)
+            window: Requests sent before waiting for replies; keep it at most
+                the daemon window
+            timeout: Socket timeout in seconds (None blocks)
+        """
+        if window < 1:
+            raise ValueError("window must be at least 1")
+
+        self.socket_path = socket_path or default_socket_path()
+        self.window = window
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.settimeout(timeout)
+        self.sock.connect(self.socket_path)
+
+        self._next_id = 0
+        # Request ids sent without a reply yet
+        self._pending: Set[int] = set()
+        # Pending request ids whose reply a caller waits for
+        self._waiting: Set[int] = set()
+        # Replies of waited requests read while waiting for another one
+        self._replies: Dict[int, protocol.Frame] = {}
+        # Failed requests that were sent without waiting
+        self.failures = 0
+        self._unflushed_failures = 0
+
+    def _new_id(self) -> int:
+        """Next request id not used by a pending request or a kept reply"""
+        for _ in range(0x10000):
+            request_id = self._next_id
+            self._next_id = (self._next_id + 1) & 0xFFFF
+            if request_id not in self._pending and request_id not in self._replies:
+                return request_id
+        raise RuntimeError("No free request id")
+
+    def _send(self, kind: int, payload: bytes, wait: bool = True) -> int:
+        """Send a request once the window has room; returns its id"""
+        while len(self._pending) >= self.window:
+            self._read_reply()
+
+        request_id = self._new_id()
+        self.sock.sendall(protocol.encode_frame(kind, request_id, payload))
+        self._pending.add(request_id)
+        if wait:
+            self._waiting.add(request_id)
+        return request_id
+
+    def _read_reply(self):
+        """Read one reply frame, keeping it only if a caller waits for it"""
+        frame = protocol.read_frame(self.sock)
+        self._pending.discard(frame.request_id)
+        if frame.request_id in self._waiting:
+            self._waiting.discard(frame.request_id)
+            self._replies[frame.request_id] = frame
+        elif frame.type != protocol.OK or frame.payload[:1] == b"\x00":
+            self.failures += 1
+            self._unflushed_failures += 1
+            logger.warning(
+                f"Request {frame.request_id} failed: "
+                f"{frame.payload.decode('utf-8', 'replace')}"
+            )
+
+    def _result(self, request_id: int) -> bytes:
+        """Wait for the reply of a request and return its payload"""
+        while request_id not in self._replies:
+            self._read_reply()
+
+        frame = self._replies.pop(request_id)
+        if frame.type == protocol.ERROR:
+            raise DaemonError(frame.payload.decode("utf-8", "replace"))
+        return frame.payload
+
+    def _request(self, kind: int, payload: bytes, wait: bool) -> Optional[bool]:
+        """Send a movement request and optionally wait for its result"""
+        request_id = self._send(kind, payload, wait)
+        if not wait:
+            return None
+        return bool(self._result(request_id)[0])
+
+    def send_points(
+        self, points: Any, rate: float = 0.0, wait: bool = False, wide: bool = False
+    ) -> Optional[bool]:
+        """
+        Stream a batch of points (int16 when the coordinates fit)
+
+        Args:
+            points: Path, (N, 2) array or list of points
+            rate: Points per second (0 moves as fast as the backend allows)
+            wait: Wait until the batch has been played
+            wide: Always pack as int32
+
+        Returns:
+            Movement result if wait is True, else None
+        """
+        kind, payload = protocol.encode_points(points, rate, wide)
+        return self._request(kind, payload, wait)
+
+    def pattern(
+        self,
+        name: str,
+        size: Optional[int] = None,
+        duration: Optional[float] = None,
+        wait: bool = True,
+        **params,
+    ) -> Optional[bool]:
+        """
+        Run a registered pattern centered on the screen
+
+        Args:
+            name: Pattern name
+            size: Pattern size in pixels (pattern default if None)
+            duration: Time to move to each point (pattern default if None)
+            wait: Wait until the pattern has been played
+            **params: Pattern parameters
+
+        Returns:
+            Movement result if wait is True, else None
+        """
+        request: Dict[str, Any] = {"name": name, "params": params}
+        if size is not None:
+            request["size"] = size
+        if duration is not None:
+            request["duration"] = duration
+        return self._request(protocol.PATTERN, protocol.encode_json(request), wait)
+
+    def _control(self, opcode: int) -> bytes:
+        return self._result(self._send(protocol.CONTROL, bytes([opcode])))
+
+    def ping(self):
+        """Check that the daemon answers"""
+        self._control(protocol.PING)
+
+    def stop(self) -> int:
+        """
+        Stop the running movement and drop queued ones of all clients
+
+        Returns:
+            Number of dropped queued movements
+        """
+        return protocol.decode_json(self._control(protocol.STOP))["dropped"]
+
+    def position(self) -> Tuple[int, int]:
+        """Get current cursor position"""
+        return protocol.POSITION.unpack(self._control(protocol.POSITION_REQUEST))
+
+    def stats(self) -> Dict[str, Any]:
+        """Get queue metrics of the daemon"""
+        return protocol.decode_json(self._control(protocol.STATS))
+
+    def flush(self) -> bool:
+        """
+        Wait for replies to every request sent
+
+        Returns:
+            True if every movement sent without waiting since the last flush
+            succeeded
+        """
+        while self._pending:
+            self._read_reply()
+
+        ok = not self._unflushed_failures
+        self._unflushed_failures = 0
+        return ok
+
+    def close(self):
+        """Close the connection"""
+        self.sock.close()
+
+    def __enter__(self) -> "MotionClient":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
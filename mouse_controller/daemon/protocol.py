@@ -0,0 +1,170 @@
+"""
+Binary framing of the control daemon
+
+Every frame is an 8-byte little-endian header followed by the payload:
+
+    version: u8 | type: u8 | request id: u16 | payload length: u32
+
+Point batches carry a float32 rate (points per second, 0 for as fast as
+the backend allows) and packed x, y pairs as int16 or int32. Pattern
+requests carry a small JSON object; control messages carry one opcode byte.
+The daemon answers every request with a frame of the same request id.
+"""
+
+import json
+import socket
+import struct
+from typing import Any, NamedTuple, Tuple
+
+import numpy as np
+
+from ..core.path import Path
+
+VERSION = 1
+
+HEADER = struct.Struct("<BBHI")
+RATE = struct.Struct("<f")
+POSITION = struct.Struct("<ii")
+
+# Largest accepted payload (bytes)
+MAX_PAYLOAD = 16 * 1024 * 1024
+
+# Request types
+POINTS16 = 0x01
+POINTS32 = 0x02
+PATTERN = 0x03
+CONTROL = 0x04
+
+# Reply types
+OK = 0x80
+ERROR = 0x81
+
+# Control opcodes
+PING = 0x01
+STOP = 0x02
+POSITION_REQUEST = 0x03
+STATS = 0x04
+
+POINT_DTYPES = {POINTS16: np.dtype("<i2"), POINTS32: np.dtype("<i4")}
+INT16_RANGE = (-(2**15), 2**15 - 1)
+
+
+class ProtocolError(ValueError):
+    """Raised on malformed frames"""
+
+
+class Frame(NamedTuple):
+    """Decoded frame"""
+
+    type: int
+    request_id: int
+    payload: bytes
+
+
+def encode_frame(kind: int, request_id: int, payload: bytes = b"") -> bytes:
+    """
+    Build a frame
+
+    Args:
+        kind: Frame type
+        request_id: Request id (wraps at 65536)
+        payload: Frame payload
+
+    Returns:
+        Header and payload as bytes
+    """
+    if len(payload) > MAX_PAYLOAD:
+        raise ProtocolError(f"Payload too large: {len(payload)} bytes")
+    return HEADER.pack(VERSION, kind, request_id & 0xFFFF, len(payload)) + payload
+
+
+def _recv_exact(sock: socket.socket, size: int) -> bytes:
+    """Read exactly size bytes; raises EOFError if the peer closed"""
+    buffer = bytearray(size)
+    view = memoryview(buffer)
+    received = 0
+    while received < size:
+        count = sock.recv_into(view[received:])
+        if not count:
+            raise EOFError("Connection closed")
+        received += count
+    return bytes(buffer)
+
+
+def read_frame(sock: socket.socket) -> Frame:
+    """
+    Read one frame from a socket
+
+    Args:
+        sock: Connected stream socket
+
+    Returns:
+        Decoded Frame
+    """
+    version, kind, request_id, length = HEADER.unpack(_recv_exact(sock, HEADER.size))
+    if version != VERSION:
+        raise ProtocolError(f"Unsupported protocol version: {version}")
+    if length > MAX_PAYLOAD:
+        raise ProtocolError(f"Payload too large: {length} bytes")
+    payload = _recv_exact(sock, length) if length else b""
+    return Frame(kind, request_id, payload)
+
+
+def encode_points(
+    points: Any, rate: float = 0.0, wide: bool = False
+) -> Tuple[int, bytes]:
+    """
+    Pack a point batch, as int16 when every coordinate fits
+
+    Args:
+        points: Path, (N, 2) array or list of points
+        rate: Points per second (0 for no delay between points)
+        wide: Always pack as int32
+
+    Returns:
+        Tuple of (frame type, payload)
+    """
+    array = Path(points).array
+    low, high = INT16_RANGE
+    if wide:
+        kind = POINTS32
+    elif not len(array) or (array.min() >= low and array.max() <= high):
+        kind = POINTS16
+    else:
+        kind = POINTS32
+    packed = array.astype(POINT_DTYPES[kind], copy=False).tobytes()
+    return kind, RATE.pack(rate) + packed
+
+
+def decode_points(kind: int, payload: bytes) -> Tuple[Path, float]:
+    """
+    Unpack a point batch
+
+    Args:
+        kind: POINTS16 or POINTS32
+        payload: Frame payload
+
+    Returns:
+        Tuple of (path, rate)
+    """
+    dtype = POINT_DTYPES[kind]
+    if len(payload) < RATE.size or (len(payload) - RATE.size) % (2 * dtype.itemsize):
+        raise ProtocolError("Truncated point batch")
+    (rate,) = RATE.unpack_from(payload)
+    if not np.isfinite(rate) or rate < 0:
+        raise ProtocolError(f"Invalid rate: {rate}")
+    array = np.frombuffer(payload, dtype=dtype, offset=RATE.size).reshape(-1, 2)
+    return Path(array), rate
+
+
+def encode_json(value: Any) -> bytes:
+    """Serialize a JSON payload"""
+    return json.dumps(value, separators=(",", ":")).encode("utf-8")
+
+
+def decode_json(payload: bytes) -> Any:
+    """Parse a JSON payload"""
+    try:
+        return json.loads(payload.decode("utf-8"))
+    except ValueError as e:
+        raise ProtocolError(f"Invalid JSON payload: {e}") from None
@@ -0,0 +1,334 @@
+"""
+Long-running control daemon exposing one MouseMover over a Unix socket
+
+All clients share the daemon's mover and its MotionService, so moves from
+different processes never interleave. Each connection has a window of
+requests in flight; once it is full the daemon stops reading from that
+client, and the kernel socket buffer pushes back on its writes. Replies go
+through a writer thread per connection, so a client that stops reading
+never blocks the motion worker.
+"""
+
+import argparse
+import logging
+import os
+import queue
+import socket
+import stat
+import tempfile
+import threading
+from concurrent.futures import Future
+from typing import Optional, Set, Union
+
+from . import protocol
+from ..backends import MouseBackend
+from ..core.motion_service import MotionService
+from ..core.mouse_mover import MouseMover
+from ..core.registry import PatternContext, pattern_registry
+
+# Requests of one connection that may be queued or running at once
+DEFAULT_WINDOW = 8
+
+# Time a closing connection waits for its queued replies (seconds)
+WRITER_TIMEOUT = 1.0
+
+
+def default_socket_path() -> str:
+    """Socket path in the user's runtime directory"""
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR") or tempfile.gettempdir()
+    return os.path.join(runtime_dir, f"mouse-controller-{os.getuid()}.sock")
+
+
+class _Connection:
+    """Reader and reply writer threads of one client"""
+
+    def __init__(self, daemon: "MotionDaemon", sock: socket.socket):
+        self.daemon = daemon
+        self.sock = sock
+        self.window = threading.BoundedSemaphore(daemon.window)
+        # Encoded reply frames; None stops the writer
+        self.outbox: "queue.Queue[Optional[bytes]]" = queue.Queue()
+        self.writer = threading.Thread(
+            target=self.write, name="mouse-daemon-writer", daemon=True
+        )
+        self.logger = daemon.logger
+
+    def reply(self, kind: int, request_id: int, payload: bytes = b""):
+        """Queue a reply frame for the writer thread"""
+        self.outbox.put(protocol.encode_frame(kind, request_id, payload))
+
+    def write(self):
+        """Send queued replies until stopped; a closed client is ignored"""
+        closed = False
+        while True:
+            frame = self.outbox.get()
+            if frame is None:
+                return
+            if closed:
+                continue
+            try:
+                self.sock.sendall(frame)
+            except OSError:
+                closed = True
+
+    def serve(self):
+        """Read requests until the client disconnects"""
+        self.writer.start()
+        try:
+            while True:
+                # Wait for a free slot before reading: a full window leaves
+                # the client's data in the socket buffer
+                self.window.acquire()
+                try:
+                    frame = protocol.read_frame(self.sock)
+                except BaseException:
+                    self.window.release()
+                    raise
+                self.handle(frame)
+        except EOFError:
+            pass
+        except (OSError, protocol.ProtocolError) as e:
+            self.logger.warning(f"Closing client connection: {e}")
+        finally:
+            self.daemon._forget(self)
+            self.outbox.put(None)
+            self.writer.join(WRITER_TIMEOUT)
+            if self.writer.is_alive():
+                # The client stopped reading; fail the blocked sendall
+                try:
+                    self.sock.shutdown(socket.SHUT_RDWR)
+                except OSError:
+                    pass
+                self.writer.join(WRITER_TIMEOUT)
+            self.sock.close()
+
+    def handle(self, frame: protocol.Frame):
+        """Dispatch one request"""
+        try:
+            future = self.daemon.dispatch(frame)
+        except Exception as e:
+            self.window.release()
+            self.reply(protocol.ERROR, frame.request_id, str(e).encode("utf-8"))
+            return
+
+        if isinstance(future, Future):
+            future.add_done_callback(lambda done: self.finish(frame.request_id, done))
+        else:
+            self.window.release()
+            self.reply(protocol.OK, frame.request_id, future)
+
+    def finish(self, request_id: int, future: Future):
+        """Reply with the result of a queued command"""
+        self.window.release()
+        if future.cancelled():
+            self.reply(protocol.ERROR, request_id, b"cancelled")
+        elif future.exception() is not None:
+            message = str(future.exception()).encode("utf-8")
+            self.reply(protocol.ERROR, request_id, message)
+        else:
+            self.reply(protocol.OK, request_id, bytes([bool(future.result())]))
+
+
+class MotionDaemon:
+    """Unix-socket server driving a shared MouseMover"""
+
+    def __init__(
+        self,
+        socket_path: Optional[str] = None,
+        mover: Optional[MouseMover] = None,
+        backend: Union[str, MouseBackend, None] = None,
+        window: int = DEFAULT_WINDOW,
+    ):
+        """
+        Initialize MotionDaemon
+
+        Args:
+            socket_path: Path of the Unix socket (see default_socket_path)
+            mover: Mover to drive (created with backend if None)
+            backend: Output backend name or instance for a new mover
+            window: Requests per connection queued or running at once
+        """
+        if not hasattr(socket, "AF_UNIX"):
+            raise RuntimeError("Unix domain sockets are not supported here")
+        if window < 1:
+            raise ValueError("window must be at least 1")
+
+        self.socket_path = socket_path or default_socket_path()
+        self.mover = mover or MouseMover(failsafe=True, pause=0, backend=backend)
+        self.motion = MotionService(self.mover)
+        self.window = window
+        self.logger = logging.getLogger(__name__)
+
+        self._server: Optional[socket.socket] = None
+        self._connections: Set[_Connection] = set()
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    def bind(self):
+        """Create the listening socket, replacing a stale socket file"""
+        if os.path.lexists(self.socket_path):
+            if not stat.S_ISSOCK(os.lstat(self.socket_path).st_mode):
+                raise RuntimeError(f"{self.socket_path} exists and is not a socket")
+            probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            try:
+                probe.connect(self.socket_path)
+            except OSError:
+                os.unlink(self.socket_path)
+            else:
+                raise RuntimeError(f"Daemon already running at {self.socket_path}")
+            finally:
+                probe.close()
+
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        server.bind(self.socket_path)
+        # Restrict the socket file before listen(): until then connects are
+        # refused, and unlike os.umask() this leaves other threads alone
+        try:
+            os.chmod(self.socket_path, 0o600)
+        except OSError:
+            server.close()
+            os.unlink(self.socket_path)
+            raise
+        server.listen()
+        self._server = server
+        self.logger.info(f"Listening on {self.socket_path}")
+
+    def serve_forever(self):
+        """Accept clients until close() is called"""
+        if self._server is None:
+            self.bind()
+        server = self._server
+
+        while True:
+            try:
+                sock, _ = server.accept()
+            except OSError:
+                return  # closed
+
+            connection = _Connection(self, sock)
+            with self._lock:
+                self._connections.add(connection)
+            threading.Thread(
+                target=connection.serve, name="mouse-daemon-client", daemon=True
+            ).start()
+
+    def start(self) -> "MotionDaemon":
+        """Serve on a background thread"""
+        self.bind()
+        self._thread = threading.Thread(
+            target=self.serve_forever, name="mouse-daemon", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def close(self):
+        """Stop serving, disconnect clients and remove the socket file"""
+        if self._server is not None:
+            try:
+                # Wakes a blocked accept() on Linux
+                self._server.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+            self._server.close()
+            self._server = None
+            try:
+                os.unlink(self.socket_path)
+            except FileNotFoundError:
+                pass
+
+        with self._lock:
+            connections = list(self._connections)
+        for connection in connections:
+            try:
+                connection.sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+
+        self.motion.shutdown(timeout=1.0)
+        if self._thread is not None:
+            self._thread.join(1.0)
+            self._thread = None
+
+    def __enter__(self) -> "MotionDaemon":
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _forget(self, connection: _Connection):
+        with self._lock:
+            self._connections.discard(connection)
+
+    def dispatch(self, frame: protocol.Frame) -> Union[Future, bytes]:
+        """
+        Run a request
+
+        Args:
+            frame: Decoded request frame
+
+        Returns:
+            Future of a queued movement, or the reply payload of a request
+            answered right away
+        """
+        if frame.type in protocol.POINT_DTYPES:
+            path, rate = protocol.decode_points(frame.type, frame.payload)
+            if rate > 0:
+                return self.motion.submit(self.mover.play_path, path, rate)
+            return self.motion.submit(self.mover.move_smooth_path, path, 0.0)
+
+        if frame.type == protocol.PATTERN:
+            request = protocol.decode_json(frame.payload)
+            spec = pattern_registry.get(request["name"])
+            size = int(request.get("size", spec.default_size))
+            context = PatternContext.from_mover(self.mover, size)
+            points = spec.build(context, **request.get("params", {}))
+            duration = float(request.get("duration", spec.duration))
+            return self.motion.submit(self.mover.move_smooth_path, points, duration)
+
+        if frame.type == protocol.CONTROL and len(frame.payload) == 1:
+            return self._control(frame.payload[0])
+
+        raise protocol.ProtocolError(f"Unknown request type: {frame.type:#x}")
+
+    def _control(self, opcode: int) -> bytes:
+        """Answer a control message"""
+        if opcode == protocol.PING:
+            return b""
+        if opcode == protocol.STOP:
+            dropped = self.motion.cancel_all("client stop")
+            return protocol.encode_json({"dropped": dropped})
+        if opcode == protocol.POSITION_REQUEST:
+            return protocol.POSITION.pack(*self.mover.get_current_position())
+        if opcode == protocol.STATS:
+            metrics = self.motion.metrics()._asdict()
+            metrics["clients"] = len(self._connections)
+            return protocol.encode_json(metrics)
+        raise protocol.ProtocolError(f"Unknown control opcode: {opcode:#x}")
+
+
+def main():
+    """Run the daemon until interrupted"""
+    parser = argparse.ArgumentParser(description="Mouse Controller daemon")
+    parser.add_argument("--socket", default=None, help="Unix socket path")
+    parser.add_argument("--backend", default=None, help="Output backend name")
+    parser.add_argument(
+        "--window",
+        type=int,
+        default=DEFAULT_WINDOW,
+        help="Requests in flight per client",
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    daemon = MotionDaemon(args.socket, backend=args.backend, window=args.window)
+    daemon.bind()
+    try:
+        daemon.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        daemon.close()
+
+
+if __name__ == "__main__":
+    main()
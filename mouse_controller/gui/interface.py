@@ -2,12 +2,20 @@
 Graphical interface for Mouse Controller
 """
 
+import logging
 import tkinter as tk
 from tkinter import ttk, messagebox
-import threading
+from mouse_controller.core.motion_service import MotionService, Priority
 from mouse_controller.core.mouse_mover import MouseMover
-from mouse_controller.core.patterns import PatternGenerator
-from mouse_controller.utils.helpers import get_screen_center
+from mouse_controller.core.registry import PatternContext, pattern_registry
+from mouse_controller.core.sampler import PositionSampler
+
+# Button colors (normal, active) of the pattern sections, in order
+CATEGORY_COLORS = [
+    ("#e74c3c", "#c0392b"),
+    ("#9b59b6", "#8e44ad"),
+    ("#16a085", "#1abc9c"),
+]
 
 
 class MouseControllerGUI:
@@ -21,8 +29,11 @@ class MouseControllerGUI:
 
         # Initialize components
         self.mover = MouseMover(failsafe=True, pause=0.1)
-        self.pattern_gen = PatternGenerator()
-        self.is_running = False
+        # Every movement runs on the service's single worker thread
+        self.motion = MotionService(self.mover)
+        # One thread samples the cursor for the label and other consumers
+        self.sampler = PositionSampler(self.mover.backend, rate=60, idle_rate=10)
+        self.sampler.start()
 
         self.setup_ui()
 
@@ -102,76 +113,36 @@ class MouseControllerGUI:
             btn.grid(row=0, column=i, padx=5, pady=10, sticky="ew")
             basic_frame.grid_columnconfigure(i, weight=1)
 
-        # Geometric shapes
-        shapes_frame = tk.LabelFrame(
-            main_frame,
-            text="Geometric Shapes",
-            font=("Arial", 12, "bold"),
-            fg="#ecf0f1",
-            bg="#34495e",
-            bd=2,
-        )
-        shapes_frame.pack(fill=tk.X, pady=(0, 10))
-
-        shape_buttons = [
-            ("🔄 Circle", self.move_circle),
-            ("⬜ Square", self.move_square),
-            ("🔺 Triangle", self.move_triangle),
-            ("⭐ Star", self.move_star),
-            ("🌀 Spiral", self.move_spiral),
-            ("❤️ Heart", self.move_heart),
-        ]
-
-        for i, (text, command) in enumerate(shape_buttons):
-            btn = tk.Button(
-                shapes_frame,
-                text=text,
-                command=command,
-                font=("Arial", 10),
-                bg="#e74c3c",
-                fg="white",
-                activebackground="#c0392b",
-                relief=tk.FLAT,
-                padx=20,
-                pady=5,
+        # Pattern sections, built from the registry
+        for index, category in enumerate(pattern_registry.categories()):
+            color, active_color = CATEGORY_COLORS[index % len(CATEGORY_COLORS)]
+            category_frame = tk.LabelFrame(
+                main_frame,
+                text=category,
+                font=("Arial", 12, "bold"),
+                fg="#ecf0f1",
+                bg="#34495e",
+                bd=2,
             )
-            row = i // 3
-            col = i % 3
-            btn.grid(row=row, column=col, padx=5, pady=5, sticky="ew")
-            shapes_frame.grid_columnconfigure(col, weight=1)
-
-        # Waves and complex movements
-        waves_frame = tk.LabelFrame(
-            main_frame,
-            text="Waves and Complex Movements",
-            font=("Arial", 12, "bold"),
-            fg="#ecf0f1",
-            bg="#34495e",
-            bd=2,
-        )
-        waves_frame.pack(fill=tk.X, pady=(0, 10))
-
-        wave_buttons = [
-            ("〰️ Sine Wave", self.move_sine),
-            ("8️⃣ Figure Eight", self.move_figure_eight),
-            ("🎲 Random Walk", self.random_walk),
-        ]
-
-        for i, (text, command) in enumerate(wave_buttons):
-            btn = tk.Button(
-                waves_frame,
-                text=text,
-                command=command,
-                font=("Arial", 10),
-                bg="#9b59b6",
-                fg="white",
-                activebackground="#8e44ad",
-                relief=tk.FLAT,
-                padx=20,
-                pady=5,
-            )
-            btn.grid(row=0, column=i, padx=5, pady=10, sticky="ew")
-            waves_frame.grid_columnconfigure(i, weight=1)
+            category_frame.pack(fill=tk.X, pady=(0, 10))
+
+            for i, spec in enumerate(pattern_registry.specs(category)):
+                btn = tk.Button(
+                    category_frame,
+                    text=spec.title,
+                    command=lambda name=spec.name: self.move_pattern(name),
+                    font=("Arial", 10),
+                    bg=color,
+                    fg="white",
+                    activebackground=active_color,
+                    relief=tk.FLAT,
+                    padx=20,
+                    pady=5,
+                )
+                row = i // 3
+                col = i % 3
+                btn.grid(row=row, column=col, padx=5, pady=5, sticky="ew")
+                category_frame.grid_columnconfigure(col, weight=1)
 
         # Settings
         settings_frame = tk.LabelFrame(
@@ -268,149 +239,89 @@ class MouseControllerGUI:
         info_label.pack(pady=(10, 0))
 
     def update_position(self):
-        """Update current cursor position"""
-        if hasattr(self, "mover"):
-            x, y = self.mover.get_current_position()
-            self.position_label.config(text=f"X: {x}, Y: {y}")
-        self.root.after(500, self.update_position)  # Update every 500ms
+        """Update current cursor position from the sampler"""
+        sample = self.sampler.latest()
+        if sample is not None:
+            self.position_label.config(text=f"X: {sample.x}, Y: {sample.y}")
+        self.root.after(100, self.update_position)  # Update every 100ms
 
     def set_status(self, status: str, color: str = "#27ae60"):
         """Set status"""
         self.status_label.config(text=status, fg=color)
 
-    def run_in_thread(self, func, *args, **kwargs):
-        """Run function in separate thread"""
-        if self.is_running:
-            messagebox.showwarning("Warning", "Operation already running!")
+    def track(self, future):
+        """Show status of a queued motion command"""
+        self.set_status(f"🔄 Running... ({self.motion.depth} queued)", "#f39c12")
+        future.add_done_callback(self.on_command_done)
+
+    def on_command_done(self, future):
+        """Update status when a motion command finishes"""
+        if future.cancelled():
             return
+        if future.exception() is not None:
+            self.set_status("❌ Error", "#e74c3c")
+            messagebox.showerror("Error", f"An error occurred: {future.exception()}")
+        elif not self.motion.busy:
+            self.set_status("✅ Completed", "#27ae60")
+            self.root.after(2000, self.reset_status)
+
+    def reset_status(self):
+        """Show Ready unless commands are running"""
+        if not self.motion.busy:
+            self.set_status("🟢 Ready", "#27ae60")
 
-        def wrapper():
-            self.is_running = True
-            self.set_status("🔄 Running...", "#f39c12")
-            try:
-                func(*args, **kwargs)
-                self.set_status("✅ Completed", "#27ae60")
-            except Exception as e:
-                self.set_status("❌ Error", "#e74c3c")
-                messagebox.showerror("Error", f"An error occurred: {e}")
-            finally:
-                self.is_running = False
-                self.root.after(2000, lambda: self.set_status("🟢 Ready", "#27ae60"))
-
-        thread = threading.Thread(target=wrapper, daemon=True)
-        thread.start()
+    def run_in_thread(self, func, *args, **kwargs):
+        """Queue function on the motion worker thread"""
+        self.track(self.motion.submit(func, *args, **kwargs))
 
     def move_to_center(self):
         """Move to screen center"""
-        self.run_in_thread(self.mover.move_to_center, self.speed_var.get())
+        self.track(
+            self.motion.move_to(
+                self.mover.center_x, self.mover.center_y, self.speed_var.get()
+            )
+        )
 
     def move_random(self):
-        """Move to random position"""
+        """Move to random position on the monitor under the cursor"""
         from mouse_controller.utils.helpers import get_safe_random_position
 
-        x, y = get_safe_random_position(
-            self.mover.screen_width, self.mover.screen_height, 100
+        cursor_x, cursor_y = self.mover.get_current_position()
+        monitor = self.mover.geometry.layout.nearest_monitor(cursor_x, cursor_y)
+        x, y = get_safe_random_position(monitor.width, monitor.height, 100)
+        self.track(
+            self.motion.move_to(monitor.x + x, monitor.y + y, self.speed_var.get())
         )
-        self.run_in_thread(self.mover.move_to_position, x, y, self.speed_var.get())
 
     def shake_cursor(self):
         """Shake cursor"""
         self.run_in_thread(self.mover.shake_cursor, 3.0, 30)
 
-    def move_circle(self):
-        """Move in circle"""
-        center_x, center_y = get_screen_center()
-        radius = self.size_var.get()
-        self.run_in_thread(
-            self.mover.move_in_circle, center_x, center_y, radius, 100, True
-        )
-
-    def move_square(self):
-        """Move in square"""
-        center_x, center_y = get_screen_center()
-        size = self.size_var.get()
-        start_x = center_x - size // 2
-        start_y = center_y - size // 2
-        self.run_in_thread(self.mover.move_in_square, start_x, start_y, size)
-
-    def move_triangle(self):
-        """Move in triangle"""
-        center_x, center_y = get_screen_center()
-        size = self.size_var.get()
-        points = self.pattern_gen.generate_triangle_points(center_x, center_y, size)
-        self.run_in_thread(self.mover.move_smooth_path, points, 0.5)
-
-    def move_star(self):
-        """Move in star"""
-        center_x, center_y = get_screen_center()
-        size = self.size_var.get()
-        outer_radius = size
-        inner_radius = size // 2
-        points = self.pattern_gen.generate_star_points(
-            center_x, center_y, outer_radius, inner_radius, 5
-        )
-        self.run_in_thread(self.mover.move_smooth_path, points, 0.3)
-
-    def move_spiral(self):
-        """Move in spiral"""
-        center_x, center_y = get_screen_center()
-        max_radius = self.size_var.get()
-        points = self.pattern_gen.generate_spiral_points(
-            center_x, center_y, max_radius, 3, 50
-        )
-        self.run_in_thread(self.mover.move_smooth_path, points, 0.05)
-
-    def move_heart(self):
-        """Move in heart shape"""
-        center_x, center_y = get_screen_center()
-        size = self.size_var.get() // 30  # Scaling for heart
-        points = self.pattern_gen.generate_heart_points(center_x, center_y, size, 100)
-        self.run_in_thread(self.mover.move_smooth_path, points, 0.05)
-
-    def move_sine(self):
-        """Move in sine wave"""
-        center_x, center_y = get_screen_center()
-        length = self.size_var.get() * 2
-        amplitude = self.size_var.get() // 3
-        start_x = center_x - length // 2
-        points = self.pattern_gen.generate_sine_wave_points(
-            start_x, center_y, length, amplitude, 2.0, 100
-        )
-        self.run_in_thread(self.mover.move_smooth_path, points, 0.05)
-
-    def move_figure_eight(self):
-        """Move in figure eight"""
-        center_x, center_y = get_screen_center()
-        width = self.size_var.get()
-        height = self.size_var.get() // 2
-        points = self.pattern_gen.generate_figure_eight(
-            center_x, center_y, width, height, 100
-        )
-        self.run_in_thread(self.mover.move_smooth_path, points, 0.05)
-
-    def random_walk(self):
-        """Random walk"""
-        current_x, current_y = self.mover.get_current_position()
-        steps = 20
-        max_step = self.size_var.get() // 3
-        points = self.pattern_gen.generate_random_walk(
-            current_x, current_y, steps, max_step
-        )
-        self.run_in_thread(self.mover.move_smooth_path, points, 0.3)
+    def move_pattern(self, name: str):
+        """Move along a registered pattern sized by the Size slider"""
+        spec = pattern_registry.get(name)
+        context = PatternContext.from_mover(self.mover, self.size_var.get())
+        points = spec.build(context)
+        self.run_in_thread(self.mover.move_smooth_path, points, spec.duration)
 
     def emergency_stop(self):
         """Emergency stop"""
-        self.is_running = False
-        self.mover.emergency_stop()
+        self.motion.cancel_all("emergency stop")
+        self.motion.submit(self.mover.emergency_stop, priority=Priority.HIGH)
         self.set_status("🛑 Stopped", "#e74c3c")
 
     def run(self):
         """Run GUI"""
-        self.root.mainloop()
+        try:
+            self.root.mainloop()
+        finally:
+            self.sampler.stop()
+            self.motion.shutdown(wait=False)
 
 
 def main():
     """Main function to run GUI"""
+    logging.basicConfig(level=logging.INFO)
     try:
         app = MouseControllerGUI()
         app.run()
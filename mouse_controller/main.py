@@ -2,32 +2,40 @@
 Console interface for Mouse Controller
 """
 
+import logging
 import sys
 import time
 from mouse_controller.core.mouse_mover import MouseMover
-from mouse_controller.core.patterns import PatternGenerator
-from mouse_controller.utils.helpers import get_screen_center, get_safe_random_position
-
-
-def print_menu():
+from mouse_controller.core.registry import PatternContext, pattern_registry
+from mouse_controller.utils.helpers import get_safe_random_position
+
+
+def build_menu():
+    """
+    Build main menu entries from the pattern registry
+
+    Returns:
+        List of (title, action) pairs; action is a pattern name or a
+        built-in command
+    """
+    entries = [("📍 Move to screen center", "center")]
+    entries += [(spec.title, spec.name) for spec in pattern_registry.specs()]
+    entries += [
+        ("🫨 Shake cursor", "shake"),
+        ("🎯 Move to random position", "random_position"),
+        ("📍 Move to custom position", "custom_position"),
+        ("🖱️ Show current cursor position", "show_position"),
+    ]
+    return entries
+
+
+def print_menu(entries):
     """Display main menu"""
     print("\n" + "=" * 50)
     print("🖱️  MOUSE CONTROLLER v1.0")
     print("=" * 50)
-    print("1  - Move to screen center")
-    print("2  - Move in circle")
-    print("3  - Move in square")
-    print("4  - Move in triangle")
-    print("5  - Move in star")
-    print("6  - Move in spiral")
-    print("7  - Move in sine wave")
-    print("8  - Move in heart shape")
-    print("9  - Move in figure eight")
-    print("10 - Shake cursor")
-    print("11 - Random walk")
-    print("12 - Move to random position")
-    print("13 - Move to custom position")
-    print("14 - Show current cursor position")
+    for number, (title, _) in enumerate(entries, start=1):
+        print(f"{number:<2} - {title}")
     print("0  - Exit")
     print("-" * 50)
     print("💡 Tip: Move mouse to top-left corner for emergency stop")
@@ -49,6 +57,23 @@ def get_user_input(prompt: str, input_type=str, default=None):
         sys.exit(0)
 
 
+def get_pattern_params(spec):
+    """Ask for pattern size and parameters"""
+    size = get_user_input(spec.size_label, int, spec.default_size)
+    params = {}
+    for param in spec.params:
+        if param.type is bool:
+            default = "y" if param.default else "n"
+            answer = get_user_input(f"{param.label} (y/n)", str, default)
+            params[param.name] = answer.lower() == "y"
+        elif param.default is None:
+            answer = get_user_input(f"{param.label} (Enter for auto)", str, "")
+            params[param.name] = param.type(answer) if answer else None
+        else:
+            params[param.name] = get_user_input(param.label, param.type, param.default)
+    return size, params
+
+
 def safe_execute(func, *args, **kwargs):
     """Safely execute function with error handling"""
     try:
@@ -74,134 +99,40 @@ def wait_with_countdown(seconds: int, message: str = "Operation will start in"):
 
 def main():
     """Main function for console interface"""
+    logging.basicConfig(level=logging.INFO)
     print("🎯 Initializing Mouse Controller...")
 
     try:
         mover = MouseMover(failsafe=True, pause=0.1)
-        pattern_gen = PatternGenerator()
     except Exception as e:
         print(f"❌ Initialization error: {e}")
         return
 
     print("✅ Mouse Controller ready!")
 
+    entries = build_menu()
+
     while True:
         try:
-            print_menu()
+            print_menu(entries)
             choice = get_user_input("Select option", str, "0")
 
             if choice == "0":
                 print("👋 Goodbye!")
                 break
 
-            elif choice == "1":
-                print("📍 Moving to screen center...")
-                wait_with_countdown(3)
-                safe_execute(mover.move_to_center, 1.0)
-
-            elif choice == "2":
-                print("🔄 Setting up circle movement")
-                center_x, center_y = get_screen_center()
-                radius = get_user_input("Circle radius (pixels)", int, 100)
-                clockwise = get_user_input("Clockwise? (y/n)", str, "y").lower() == "y"
-
-                print(
-                    f"🔄 Moving in circle "
-                    f"(radius: {radius}, center: {center_x}, {center_y})"
-                )
-                wait_with_countdown(3)
-                safe_execute(
-                    mover.move_in_circle, center_x, center_y, radius, 100, clockwise
-                )
-
-            elif choice == "3":
-                print("⬜ Setting up square movement")
-                center_x, center_y = get_screen_center()
-                size = get_user_input("Square size (pixels)", int, 200)
-                start_x = center_x - size // 2
-                start_y = center_y - size // 2
-
-                print(f"⬜ Moving in square (size: {size})")
-                wait_with_countdown(3)
-                safe_execute(mover.move_in_square, start_x, start_y, size)
-
-            elif choice == "4":
-                print("🔺 Moving in triangle")
-                center_x, center_y = get_screen_center()
-                size = get_user_input("Triangle size (pixels)", int, 200)
-
-                points = pattern_gen.generate_triangle_points(center_x, center_y, size)
-                wait_with_countdown(3)
-                safe_execute(mover.move_smooth_path, points, 0.5)
-
-            elif choice == "5":
-                print("⭐ Setting up star movement")
-                center_x, center_y = get_screen_center()
-                outer_radius = get_user_input("Outer radius (pixels)", int, 150)
-                inner_radius = get_user_input("Inner radius (pixels)", int, 75)
-                star_points = get_user_input("Number of points", int, 5)
-
-                points = pattern_gen.generate_star_points(
-                    center_x, center_y, outer_radius, inner_radius, star_points
-                )
-                print(f"⭐ Moving in star ({star_points} points)")
-                wait_with_countdown(3)
-                safe_execute(mover.move_smooth_path, points, 0.3)
-
-            elif choice == "6":
-                print("🌀 Setting up spiral")
-                center_x, center_y = get_screen_center()
-                max_radius = get_user_input("Maximum radius (pixels)", int, 200)
-                turns = get_user_input("Number of turns", int, 3)
-
-                points = pattern_gen.generate_spiral_points(
-                    center_x, center_y, max_radius, turns, 50
-                )
-                print(f"🌀 Moving in spiral ({turns} turns)")
-                wait_with_countdown(3)
-                safe_execute(mover.move_smooth_path, points, 0.05)
-
-            elif choice == "7":
-                print("〰️ Setting up sine wave")
-                center_x, center_y = get_screen_center()
-                length = get_user_input("Wave length (pixels)", int, 400)
-                amplitude = get_user_input("Amplitude (pixels)", int, 100)
-                frequency = get_user_input("Frequency", float, 2.0)
-
-                start_x = center_x - length // 2
-                points = pattern_gen.generate_sine_wave_points(
-                    start_x, center_y, length, amplitude, frequency, 100
-                )
-                print(
-                    f"〰️ Moving in sine wave (length: {length}, amplitude: {amplitude})"
-                )
-                wait_with_countdown(3)
-                safe_execute(mover.move_smooth_path, points, 0.05)
-
-            elif choice == "8":
-                print("❤️ Moving in heart shape")
-                center_x, center_y = get_screen_center()
-                size = get_user_input("Heart size", int, 5)
-
-                points = pattern_gen.generate_heart_points(
-                    center_x, center_y, size, 100
-                )
-                wait_with_countdown(3)
-                safe_execute(mover.move_smooth_path, points, 0.05)
+            if not choice.isdigit() or not 1 <= int(choice) <= len(entries):
+                print("❌ Invalid choice. Please try again.")
+                continue
 
-            elif choice == "9":
-                print("8️⃣ Moving in figure eight")
-                center_x, center_y = get_screen_center()
-                width = get_user_input("Width (pixels)", int, 200)
-                height = get_user_input("Height (pixels)", int, 100)
+            _, action = entries[int(choice) - 1]
 
-                points = pattern_gen.generate_figure_eight(
-                    center_x, center_y, width, height, 100
-                )
+            if action == "center":
+                print("📍 Moving to screen center...")
                 wait_with_countdown(3)
-                safe_execute(mover.move_smooth_path, points, 0.05)
+                safe_execute(mover.move_to_center, 1.0)
 
-            elif choice == "10":
+            elif action == "shake":
                 print("🫨 Setting up cursor shake")
                 duration = get_user_input("Duration (seconds)", float, 3.0)
                 intensity = get_user_input("Intensity (pixels)", int, 50)
@@ -210,20 +141,7 @@ def main():
                 wait_with_countdown(3)
                 safe_execute(mover.shake_cursor, duration, intensity)
 
-            elif choice == "11":
-                print("🎲 Setting up random walk")
-                current_x, current_y = mover.get_current_position()
-                steps = get_user_input("Number of steps", int, 20)
-                max_step = get_user_input("Maximum step size (pixels)", int, 50)
-
-                points = pattern_gen.generate_random_walk(
-                    current_x, current_y, steps, max_step
-                )
-                print(f"🎲 Random walk ({steps} steps)")
-                wait_with_countdown(3)
-                safe_execute(mover.move_smooth_path, points, 0.3)
-
-            elif choice == "12":
+            elif action == "random_position":
                 print("🎯 Moving to random position")
                 x, y = get_safe_random_position(
                     mover.screen_width, mover.screen_height, 100
@@ -232,7 +150,7 @@ def main():
                 wait_with_countdown(3)
                 safe_execute(mover.move_to_position, x, y, 1.0)
 
-            elif choice == "13":
+            elif action == "custom_position":
                 print("📍 Moving to custom position")
                 x = get_user_input("X coordinate", int)
                 y = get_user_input("Y coordinate", int)
@@ -242,12 +160,20 @@ def main():
                 wait_with_countdown(3)
                 safe_execute(mover.move_to_position, x, y, duration)
 
-            elif choice == "14":
+            elif action == "show_position":
                 current_x, current_y = mover.get_current_position()
                 print(f"📍 Current cursor position: ({current_x}, {current_y})")
 
             else:
-                print("❌ Invalid choice. Please try again.")
+                spec = pattern_registry.get(action)
+                print(f"{spec.icon} Setting up {spec.label.lower()}")
+                size, params = get_pattern_params(spec)
+
+                context = PatternContext.from_mover(mover, size)
+                points = spec.build(context, **params)
+                print(f"{spec.icon} Moving in {spec.label.lower()} (size: {size})")
+                wait_with_countdown(3)
+                safe_execute(mover.move_smooth_path, points, spec.duration)
 
         except KeyboardInterrupt:
             print("\n\n🛑 User interruption. Executing emergency stop...")
@@ -3,7 +3,11 @@
 """
 
 from .helpers import (
+    BoundsReport,
     validate_coordinates,
+    validate_path,
+    clamp_path,
+    filter_path,
     get_screen_bounds,
     get_screen_center,
     calculate_distance,
@@ -14,9 +18,18 @@ from .helpers import (
     interpolate_points,
     create_smooth_curve,
 )
+from .events import EventLog
+from .metrics import LatencyHistogram, MoverMetrics
+from .screen import ScreenGeometry, ScreenLayout, shared_geometry
+from .splines import bspline, catmull_rom_spline, cubic_bezier
+from .tracing import Tracer, tracer
 
 __all__ = [
+    "BoundsReport",
     "validate_coordinates",
+    "validate_path",
+    "clamp_path",
+    "filter_path",
     "get_screen_bounds",
     "get_screen_center",
     "calculate_distance",
@@ -26,4 +39,15 @@ __all__ = [
     "get_safe_random_position",
     "interpolate_points",
     "create_smooth_curve",
+    "EventLog",
+    "LatencyHistogram",
+    "MoverMetrics",
+    "ScreenGeometry",
+    "ScreenLayout",
+    "shared_geometry",
+    "bspline",
+    "catmull_rom_spline",
+    "cubic_bezier",
+    "Tracer",
+    "tracer",
 ]
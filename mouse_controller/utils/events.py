@@ -0,0 +1,104 @@
+"""
+Level-gated structured events
+
+An event is a name plus keyword fields. Nothing is formatted unless the
+logger is enabled for the level and a handler actually renders the record,
+and frequent events can be sampled down to every Nth occurrence. Handlers
+get the raw ``event`` and ``fields`` as record attributes for structured
+output.
+"""
+
+import logging
+import threading
+from typing import Any, Dict, Optional, Union
+
+
+class _Fields:
+    """Event fields rendered as key=value only when the record is formatted"""
+
+    __slots__ = ("fields",)
+
+    def __init__(self, fields: Dict[str, Any]):
+        self.fields = fields
+
+    def __str__(self) -> str:
+        return " ".join(f"{key}={value}" for key, value in self.fields.items())
+
+
+class EventLog:
+    """Structured events on top of a standard logger"""
+
+    def __init__(self, logger: Union[str, logging.Logger], sample_every: int = 1):
+        """
+        Initialize EventLog
+
+        Args:
+            logger: Logger or logger name
+            sample_every: Default sampling; keep every Nth occurrence of each
+                event (1 keeps all)
+        """
+        if sample_every < 1:
+            raise ValueError("sample_every must be at least 1")
+        if isinstance(logger, str):
+            logger = logging.getLogger(logger)
+        self.logger = logger
+        self.sample_every = sample_every
+        self._occurrences: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def enabled(self, level: int) -> bool:
+        """Whether events of a level reach any handler"""
+        return self.logger.isEnabledFor(level)
+
+    def emit(
+        self,
+        level: int,
+        event: str,
+        sample_every: Optional[int] = None,
+        **fields: Any,
+    ):
+        """
+        Log an event if the level is enabled and the sample is kept
+
+        Args:
+            level: Logging level
+            event: Event name, e.g. "path.start"
+            sample_every: Keep every Nth occurrence of this event (defaults to
+                the log's sample_every)
+            **fields: Event fields, formatted lazily
+        """
+        if not self.logger.isEnabledFor(level):
+            return
+
+        every = sample_every or self.sample_every
+        if every > 1:
+            with self._lock:
+                count = self._occurrences.get(event, 0)
+                self._occurrences[event] = count + 1
+            if count % every:
+                return
+            fields["sampled"] = f"1/{every}"
+
+        self.logger.log(
+            level,
+            "%s %s",
+            event,
+            _Fields(fields),
+            extra={"event": event, "fields": fields},
+        )
+
+    def debug(self, event: str, **fields: Any):
+        """Log a DEBUG event"""
+        self.emit(logging.DEBUG, event, **fields)
+
+    def info(self, event: str, **fields: Any):
+        """Log an INFO event"""
+        self.emit(logging.INFO, event, **fields)
+
+    def warning(self, event: str, **fields: Any):
+        """Log a WARNING event"""
+        self.emit(logging.WARNING, event, **fields)
+
+    def error(self, event: str, **fields: Any):
+        """Log an ERROR event"""
+        self.emit(logging.ERROR, event, **fields)
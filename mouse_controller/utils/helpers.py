@@ -2,11 +2,54 @@
 Helper functions for mouse_controller
 """
 
-import pyautogui
-from typing import Tuple
-
-
-def validate_coordinates(x: int, y: int, screen_width: int, screen_height: int) -> bool:
+import numpy as np
+from typing import Iterable, NamedTuple, Optional, Sequence, Tuple, Union
+from ..backends import Monitor
+from ..core.path import Path
+
+PointsLike = Union[Path, np.ndarray, Iterable]
+
+
+class BoundsReport(NamedTuple):
+    """Summary of points rejected by a bounds check"""
+
+    total: int
+    rejected: int
+    # Rejected points past each screen edge (corners count twice); points
+    # in gaps between monitors are rejected without an edge
+    left: int
+    right: int
+    top: int
+    bottom: int
+    first_rejected: Optional[int]
+
+    @property
+    def kept(self) -> int:
+        """Number of points inside the screen"""
+        return self.total - self.rejected
+
+
+def _on_monitor(x: int, y: int, monitors: Sequence[Monitor]) -> bool:
+    """Whether a point is inside one of the monitors"""
+    return any(m.x <= x < m.x + m.width and m.y <= y < m.y + m.height for m in monitors)
+
+
+def _monitor_mask(xy: np.ndarray, monitors: Sequence[Monitor]) -> np.ndarray:
+    """Boolean mask of points inside one of the monitors"""
+    x, y = xy[:, 0], xy[:, 1]
+    valid = np.zeros(len(xy), dtype=bool)
+    for m in monitors:
+        valid |= (x >= m.x) & (x < m.x + m.width) & (y >= m.y) & (y < m.y + m.height)
+    return valid
+
+
+def validate_coordinates(
+    x: int,
+    y: int,
+    screen_width: int,
+    screen_height: int,
+    monitors: Optional[Sequence[Monitor]] = None,
+) -> bool:
     """
     Check if coordinates are within screen bounds
 
@@ -15,32 +58,129 @@ def validate_coordinates(x: int, y: int, screen_width: int, screen_height: int)
         y: Y coordinate
         screen_width: Screen width
         screen_height: Screen height
+        monitors: Also require the point to be on one of these monitors
 
     Returns:
         True if coordinates are valid, False otherwise
     """
-    return 0 <= x < screen_width and 0 <= y < screen_height
+    if not (0 <= x < screen_width and 0 <= y < screen_height):
+        return False
+    return not monitors or _on_monitor(x, y, monitors)
+
+
+def validate_path(
+    points: PointsLike,
+    screen_width: int,
+    screen_height: int,
+    monitors: Optional[Sequence[Monitor]] = None,
+) -> np.ndarray:
+    """
+    Check which points of a path are within screen bounds
+
+    Args:
+        points: Path, (N, 2) array or list of points
+        screen_width: Screen width
+        screen_height: Screen height
+        monitors: Also require points to be on one of these monitors
+
+    Returns:
+        Boolean mask of shape (N,), True for valid points
+    """
+    xy = Path(points).array
+    x, y = xy[:, 0], xy[:, 1]
+    valid = (x >= 0) & (x < screen_width) & (y >= 0) & (y < screen_height)
+    if monitors:
+        valid &= _monitor_mask(xy, monitors)
+    return valid
+
+
+def clamp_path(points: PointsLike, screen_width: int, screen_height: int) -> Path:
+    """
+    Clamp every point of a path to screen bounds
+
+    Args:
+        points: Path, (N, 2) array or list of points
+        screen_width: Screen width
+        screen_height: Screen height
+
+    Returns:
+        Clamped path
+    """
+    xy = Path(points).array
+    upper = np.array([screen_width - 1, screen_height - 1])
+    return Path(np.clip(xy, 0, upper))
+
+
+def filter_path(
+    points: PointsLike,
+    screen_width: int,
+    screen_height: int,
+    monitors: Optional[Sequence[Monitor]] = None,
+) -> Tuple[Path, np.ndarray, BoundsReport]:
+    """
+    Drop points outside screen bounds
+
+    Args:
+        points: Path, (N, 2) array or list of points
+        screen_width: Screen width
+        screen_height: Screen height
+        monitors: Also drop points that are not on one of these monitors
+
+    Returns:
+        Tuple of (path of valid points, their indices in the input,
+        summary of rejected points)
+    """
+    path = Path(points)
+    xy = path.array
+    x, y = xy[:, 0], xy[:, 1]
+
+    left, right = x < 0, x >= screen_width
+    top, bottom = y < 0, y >= screen_height
+    valid = ~(left | right | top | bottom)
+    if monitors:
+        valid &= _monitor_mask(xy, monitors)
+    kept = np.flatnonzero(valid)
+
+    rejected = len(path) - len(kept)
+    first_rejected = None
+    if rejected:
+        first_rejected = int(np.argmin(valid))
+        path = path[kept]
+
+    report = BoundsReport(
+        total=len(xy),
+        rejected=rejected,
+        left=int(np.count_nonzero(left)),
+        right=int(np.count_nonzero(right)),
+        top=int(np.count_nonzero(top)),
+        bottom=int(np.count_nonzero(bottom)),
+        first_rejected=first_rejected,
+    )
+    return path, kept, report
 
 
 def get_screen_bounds() -> Tuple[int, int]:
     """
-    Get screen dimensions
+    Get screen dimensions from the shared screen geometry
 
     Returns:
         Tuple of (width, height)
     """
-    return pyautogui.size()
+    from .screen import shared_geometry
+
+    return shared_geometry().size
 
 
 def get_screen_center() -> Tuple[int, int]:
     """
-    Get screen center coordinates
+    Get screen center coordinates from the shared screen geometry
 
     Returns:
         Tuple of (center_x, center_y)
     """
-    width, height = get_screen_bounds()
-    return width // 2, height // 2
+    from .screen import shared_geometry
+
+    return shared_geometry().center
 
 
 def calculate_distance(point1: Tuple[int, int], point2: Tuple[int, int]) -> float:
@@ -136,7 +276,7 @@ def get_safe_random_position(
 
 def interpolate_points(
     start: Tuple[int, int], end: Tuple[int, int], steps: int
-) -> list:
+) -> Path:
     """
     Interpolate points between start and end position
 
@@ -146,50 +286,32 @@ def interpolate_points(
         steps: Number of intermediate points
 
     Returns:
-        List of intermediate points
+        Path of points including start and end
     """
     if steps <= 0:
-        return [start, end]
+        return Path([start, end])
 
-    points = []
+    i = np.arange(steps + 2)
     dx = (end[0] - start[0]) / (steps + 1)
     dy = (end[1] - start[1]) / (steps + 1)
 
-    for i in range(steps + 2):
-        x = int(start[0] + dx * i)
-        y = int(start[1] + dy * i)
-        points.append((x, y))
-
-    return points
+    return Path.from_xy(start[0] + dx * i, start[1] + dy * i)
 
 
-def create_smooth_curve(points: list, smoothness: int = 3) -> list:
+def create_smooth_curve(points: PointsLike, smoothness: int = 3) -> Path:
     """
     Create smooth curve from set of points
 
+    The curve is a Catmull-Rom spline through every point, flattened
+    adaptively with a tolerance of 1 / smoothness pixels.
+
     Args:
-        points: List of points [(x, y), ...]
+        points: Path, (N, 2) array or list of points [(x, y), ...]
         smoothness: Smoothness level
 
     Returns:
-        Smoothed list of points
+        Smoothed path
     """
-    if len(points) < 3:
-        return points
-
-    smooth_points = [points[0]]
-
-    for i in range(1, len(points) - 1):
-        # Add intermediate points for smoothing
-        curr_point = points[i]
-        next_point = points[i + 1]
-
-        # Interpolation between points
-        for j in range(smoothness):
-            t = j / smoothness
-            x = int(curr_point[0] * (1 - t) + next_point[0] * t)
-            y = int(curr_point[1] * (1 - t) + next_point[1] * t)
-            smooth_points.append((x, y))
+    from .splines import catmull_rom_spline
 
-    smooth_points.append(points[-1])
-    return smooth_points
+    return catmull_rom_spline(points, tolerance=1.0 / max(smoothness, 1))
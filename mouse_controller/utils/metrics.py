@@ -0,0 +1,161 @@
+"""
+Counters and latency histograms of cursor movements
+
+Metrics are off by default. Movers check ``enabled`` once per path and
+only then wrap the backend call, so a disabled collector adds nothing to
+the per-point loop.
+"""
+
+import time
+from bisect import bisect_left
+from typing import Any, Callable, Dict, List, Tuple
+
+# Upper edges of the latency buckets in milliseconds
+LATENCY_BUCKETS_MS = (
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    25.0,
+    50.0,
+    100.0,
+    250.0,
+    1000.0,
+    float("inf"),
+)
+
+
+class LatencyHistogram:
+    """Fixed-bucket histogram of durations"""
+
+    def __init__(self, buckets_ms: Tuple[float, ...] = LATENCY_BUCKETS_MS):
+        """
+        Initialize LatencyHistogram
+
+        Args:
+            buckets_ms: Increasing upper bucket edges in milliseconds; the last
+                one should be infinite
+        """
+        self.buckets_ms = tuple(buckets_ms)
+        self._edges = [edge / 1000 for edge in self.buckets_ms]
+        self.reset()
+
+    def reset(self):
+        """Forget all recorded durations"""
+        self.counts: List[int] = [0] * len(self._edges)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, seconds: float):
+        """Add one duration in seconds"""
+        self.counts[min(bisect_left(self._edges, seconds), len(self.counts) - 1)] += 1
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    @property
+    def mean(self) -> float:
+        """Mean duration in seconds"""
+        return self.total / self.count if self.count else 0.0
+
+    def percentile(self, q: float) -> float:
+        """
+        Estimate a percentile as the upper edge of its bucket
+
+        Args:
+            q: Percentile in [0, 100]
+
+        Returns:
+            Duration in seconds (the maximum for the open last bucket)
+        """
+        if not self.count:
+            return 0.0
+        rank = q / 100 * self.count
+        seen = 0
+        for edge, count in zip(self._edges, self.counts):
+            seen += count
+            if seen >= rank and count:
+                return min(edge, self.max)
+        return self.max
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Histogram as a plain dict"""
+        return {
+            "count": self.count,
+            "mean_ms": self.mean * 1000,
+            "p50_ms": self.percentile(50) * 1000,
+            "p99_ms": self.percentile(99) * 1000,
+            "max_ms": self.max * 1000,
+            "buckets_ms": list(self.buckets_ms),
+            "counts": list(self.counts),
+        }
+
+
+class MoverMetrics:
+    """Movement counters plus a latency histogram of backend calls"""
+
+    def __init__(self, enabled: bool = False):
+        """
+        Initialize MoverMetrics
+
+        Args:
+            enabled: Start collecting right away
+        """
+        self.enabled = enabled
+        self.backend_latency = LatencyHistogram()
+        self.reset()
+
+    def reset(self):
+        """Zero all counters and the histogram"""
+        self.moves = 0
+        self.skipped_points = 0
+        self.errors = 0
+        self.stopped = 0
+        self.backend_latency.reset()
+
+    def enable(self):
+        """Start collecting"""
+        self.enabled = True
+
+    def disable(self):
+        """Stop collecting; recorded values are kept"""
+        self.enabled = False
+
+    def timed(self, move: Callable[..., Any]) -> Callable[..., Any]:
+        """
+        Wrap a backend call to count it and record its latency
+
+        Args:
+            move: Backend method, e.g. backend.move_to
+
+        Returns:
+            Wrapped callable with the same signature
+        """
+        record = self.backend_latency.record
+        clock = time.perf_counter
+
+        def timed_move(*args, **kwargs):
+            start = clock()
+            try:
+                return move(*args, **kwargs)
+            finally:
+                record(clock() - start)
+                self.moves += 1
+
+        return timed_move
+
+    def snapshot(self) -> Dict[str, Any]:
+        """All metrics as a plain dict"""
+        return {
+            "moves": self.moves,
+            "skipped_points": self.skipped_points,
+            "errors": self.errors,
+            "stopped": self.stopped,
+            "backend_latency": self.backend_latency.snapshot(),
+        }
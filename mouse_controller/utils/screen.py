@@ -0,0 +1,227 @@
+"""
+Cached screen geometry shared by movers, helpers and the GUI
+
+The monitor layout is read from the output backend once and reused. After
+the TTL expires the next read does a cheap change check (the screen size);
+the monitor list is queried again only if the size changed or a refresh is
+forced.
+"""
+
+import threading
+import time
+from typing import Dict, NamedTuple, Optional, Tuple, Union
+
+import numpy as np
+
+from ..backends import DEFAULT_BACKEND, Monitor, MouseBackend, get_backend
+from ..core.path import Path
+from .helpers import BoundsReport, PointsLike, filter_path, validate_coordinates
+
+# Seconds a layout is trusted before the next change check
+DEFAULT_TTL = 2.0
+
+
+class ScreenLayout(NamedTuple):
+    """Virtual screen size and the monitors inside it"""
+
+    width: int
+    height: int
+    monitors: Tuple[Monitor, ...]
+
+    @property
+    def center(self) -> Tuple[int, int]:
+        """Center of the virtual screen"""
+        return self.width // 2, self.height // 2
+
+    @property
+    def checked_monitors(self) -> Optional[Tuple[Monitor, ...]]:
+        """Monitors to check points against, or None if one fills the screen"""
+        if self.monitors == (Monitor(0, 0, self.width, self.height),):
+            return None
+        return self.monitors
+
+    def monitor_at(self, x: int, y: int) -> Optional[Monitor]:
+        """
+        Find the monitor containing a point
+
+        Args:
+            x: X coordinate
+            y: Y coordinate
+
+        Returns:
+            Monitor, or None if the point is outside every monitor
+        """
+        for monitor in self.monitors:
+            if (
+                monitor.x <= x < monitor.x + monitor.width
+                and monitor.y <= y < monitor.y + monitor.height
+            ):
+                return monitor
+        return None
+
+    def nearest_monitor(self, x: int, y: int) -> Monitor:
+        """
+        Find the monitor containing a point, or the closest one
+
+        Args:
+            x: X coordinate
+            y: Y coordinate
+
+        Returns:
+            Monitor
+        """
+        monitor = self.monitor_at(x, y)
+        if monitor is not None:
+            return monitor
+
+        def distance(monitor: Monitor) -> int:
+            dx = max(monitor.x - x, 0, x - (monitor.x + monitor.width - 1))
+            dy = max(monitor.y - y, 0, y - (monitor.y + monitor.height - 1))
+            return dx * dx + dy * dy
+
+        return min(self.monitors, key=distance)
+
+
+class ScreenGeometry:
+    """Monitor layout of a backend, cached with a TTL"""
+
+    def __init__(
+        self,
+        backend: Union[str, MouseBackend, None] = None,
+        ttl: float = DEFAULT_TTL,
+    ):
+        """
+        Initialize ScreenGeometry
+
+        Args:
+            backend: Output backend name or instance to read the layout from
+            ttl: Seconds before the next change check
+        """
+        self.backend = get_backend(backend)
+        self.ttl = ttl
+        # Number of full monitor queries, for diagnostics
+        self.refreshes = 0
+
+        self._layout: Optional[ScreenLayout] = None
+        self._expires = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def layout(self) -> ScreenLayout:
+        """Current layout, rechecked once the TTL has expired"""
+        layout = self._layout
+        if layout is None or time.monotonic() >= self._expires:
+            layout = self.refresh(force=False)
+        return layout
+
+    def refresh(self, force: bool = True) -> ScreenLayout:
+        """
+        Read the layout from the backend
+
+        Args:
+            force: Query monitors even if the screen size did not change
+
+        Returns:
+            Current layout
+        """
+        with self._lock:
+            size = tuple(self.backend.size())
+            layout = self._layout
+            if force or layout is None or size != (layout.width, layout.height):
+                monitors = tuple(self.backend.monitors()) or (Monitor(0, 0, *size),)
+                layout = self._layout = ScreenLayout(size[0], size[1], monitors)
+                self.refreshes += 1
+            self._expires = time.monotonic() + self.ttl
+            return layout
+
+    def invalidate(self):
+        """Recheck the layout on the next read"""
+        self._expires = 0.0
+
+    def validate(self, x: int, y: int) -> bool:
+        """
+        Check if a point is on the screen and on some monitor
+
+        Args:
+            x: X coordinate
+            y: Y coordinate
+
+        Returns:
+            True if the point is valid
+        """
+        layout = self.layout
+        return validate_coordinates(
+            x, y, layout.width, layout.height, layout.checked_monitors
+        )
+
+    def filter(self, points: PointsLike) -> Tuple[Path, np.ndarray, BoundsReport]:
+        """
+        Drop points that are off the screen or between monitors
+
+        Args:
+            points: Path, (N, 2) array or list of points
+
+        Returns:
+            Tuple of (path of valid points, their indices in the input,
+            summary of rejected points)
+        """
+        layout = self.layout
+        return filter_path(points, layout.width, layout.height, layout.checked_monitors)
+
+    @property
+    def size(self) -> Tuple[int, int]:
+        """Virtual screen size as (width, height)"""
+        layout = self.layout
+        return layout.width, layout.height
+
+    @property
+    def center(self) -> Tuple[int, int]:
+        """Center of the virtual screen"""
+        return self.layout.center
+
+    @property
+    def monitors(self) -> Tuple[Monitor, ...]:
+        """All monitors of the layout"""
+        return self.layout.monitors
+
+
+# Geometry of real displays, one per backend name; virtual backends keep
+# their own in a _screen_geometry attribute
+_shared: Dict[str, ScreenGeometry] = {}
+_shared_lock = threading.Lock()
+
+
+def shared_geometry(backend: Union[str, MouseBackend, None] = None) -> ScreenGeometry:
+    """
+    Get the geometry shared by everything using a backend
+
+    Backends driving the real display share one geometry per backend name;
+    virtual backends (``shared_screen = False``) get one per instance.
+
+    Args:
+        backend: Output backend name or instance (default backend if None)
+
+    Returns:
+        Shared ScreenGeometry
+    """
+    with _shared_lock:
+        if isinstance(backend, MouseBackend) and not backend.shared_screen:
+            geometry = getattr(backend, "_screen_geometry", None)
+            if geometry is None:
+                geometry = backend._screen_geometry = ScreenGeometry(backend)
+            return geometry
+
+        if isinstance(backend, MouseBackend):
+            name = backend.name
+        else:
+            name = backend or DEFAULT_BACKEND
+        geometry = _shared.get(name)
+        if geometry is None:
+            geometry = _shared[name] = ScreenGeometry(backend or name)
+        return geometry
+
+
+def clear_shared_geometry():
+    """Forget the shared geometries of real displays"""
+    with _shared_lock:
+        _shared.clear()
@@ -0,0 +1,200 @@
+"""
+Spline curves with adaptive, vectorized flattening
+
+Every spline type is converted to a chain of cubic Bézier segments, which
+are then flattened together. The number of samples per segment comes from
+Wang's bound on the segment's second differences, so straight stretches
+get a single line and tight turns get as many points as the pixel
+tolerance requires.
+"""
+
+from typing import Iterable, Union
+
+import numpy as np
+
+from ..core.path import Path
+
+PointsLike = Union[Path, np.ndarray, Iterable]
+
+# Safety cap on samples per segment for degenerate inputs
+MAX_SEGMENT_SAMPLES = 1024
+
+
+def _as_float_points(points: PointsLike) -> np.ndarray:
+    if isinstance(points, np.ndarray):
+        return np.asarray(points, dtype=float).reshape(-1, 2)
+    return Path(points).array.astype(float)
+
+
+def catmull_rom_segments(points: PointsLike) -> np.ndarray:
+    """
+    Convert a uniform Catmull-Rom spline through points to Bézier segments
+
+    Args:
+        points: Points the curve passes through
+
+    Returns:
+        Float array of shape (N - 1, 4, 2)
+    """
+    xy = _as_float_points(points)
+    padded = np.concatenate((xy[:1], xy, xy[-1:]))
+
+    p0, p1, p2, p3 = padded[:-3], padded[1:-2], padded[2:-1], padded[3:]
+    return np.stack((p1, p1 + (p2 - p0) / 6, p2 - (p3 - p1) / 6, p2), axis=1)
+
+
+def bspline_segments(points: PointsLike) -> np.ndarray:
+    """
+    Convert a clamped uniform cubic B-spline to Bézier segments
+
+    The end control points are tripled so the curve starts and ends on them.
+
+    Args:
+        points: B-spline control points
+
+    Returns:
+        Float array of shape (N + 1, 4, 2)
+    """
+    xy = _as_float_points(points)
+    padded = np.concatenate((xy[:1], xy[:1], xy, xy[-1:], xy[-1:]))
+
+    p0, p1, p2, p3 = padded[:-3], padded[1:-2], padded[2:-1], padded[3:]
+    return np.stack(
+        (
+            (p0 + 4 * p1 + p2) / 6,
+            (2 * p1 + p2) / 3,
+            (p1 + 2 * p2) / 3,
+            (p1 + 4 * p2 + p3) / 6,
+        ),
+        axis=1,
+    )
+
+
+def bezier_segments(control_points: PointsLike) -> np.ndarray:
+    """
+    Split a piecewise cubic Bézier control polygon into segments
+
+    Args:
+        control_points: 3k + 1 points; segments share their end points
+
+    Returns:
+        Float array of shape (k, 4, 2)
+    """
+    xy = _as_float_points(control_points)
+    if len(xy) < 4 or (len(xy) - 1) % 3:
+        raise ValueError("Cubic Bézier chain needs 3k + 1 control points")
+
+    starts = np.arange(0, len(xy) - 1, 3)
+    return xy[starts[:, np.newaxis] + np.arange(4)]
+
+
+def _is_flat(segments: np.ndarray, tolerance: float) -> np.ndarray:
+    """Check which segments are within tolerance of their chord"""
+    start = segments[:, 0]
+    chord = segments[:, 3] - start
+    length_sq = np.einsum("ij,ij->i", chord, chord)
+
+    flat = np.ones(len(segments), dtype=bool)
+    for inner in (segments[:, 1], segments[:, 2]):
+        offset = inner - start
+        projection = np.einsum("ij,ij->i", offset, chord)
+        cross = chord[:, 0] * offset[:, 1] - chord[:, 1] * offset[:, 0]
+        # Distance to the chord line, and projection inside the chord
+        flat &= cross**2 <= tolerance**2 * length_sq
+        flat &= (projection >= 0) & (projection <= length_sq)
+
+    return flat & (length_sq > 0)
+
+
+def flatten_segments(segments: np.ndarray, tolerance: float = 0.5) -> Path:
+    """
+    Sample Bézier segments adaptively, all segments at once
+
+    Args:
+        segments: Float array of shape (M, 4, 2)
+        tolerance: Maximum distance from the true curve in pixels
+
+    Returns:
+        Path through the sampled points
+    """
+    if tolerance <= 0:
+        raise ValueError("tolerance must be positive")
+    if not len(segments):
+        return Path()
+
+    # Wang's formula: n >= sqrt(3/4 * max|second difference| / tolerance)
+    second = np.maximum(
+        np.hypot(*(segments[:, 0] - 2 * segments[:, 1] + segments[:, 2]).T),
+        np.hypot(*(segments[:, 1] - 2 * segments[:, 2] + segments[:, 3]).T),
+    )
+    samples = np.ceil(np.sqrt(0.75 * second / tolerance)).astype(np.int64)
+    samples = np.clip(samples, 1, MAX_SEGMENT_SAMPLES)
+
+    # The curve stays inside its control polygon, so segments whose inner
+    # control points lie within tolerance of the chord are drawn as one line
+    samples[_is_flat(segments, tolerance)] = 1
+
+    # Parameters t = k / n for k in 0..n-1 of every segment, then the end point
+    segment = np.repeat(np.arange(len(segments)), samples)
+    first = np.cumsum(samples) - samples
+    k = np.arange(len(segment)) - np.repeat(first, samples)
+    t = (k / samples[segment])[:, np.newaxis]
+
+    b = segments[segment]
+    u = 1 - t
+    curve = (
+        u**3 * b[:, 0]
+        + 3 * u**2 * t * b[:, 1]
+        + 3 * u * t**2 * b[:, 2]
+        + t**3 * b[:, 3]
+    )
+    curve = np.concatenate((curve, segments[-1:, 3]))
+    return Path(np.rint(curve))
+
+
+def catmull_rom_spline(points: PointsLike, tolerance: float = 0.5) -> Path:
+    """
+    Smooth curve passing through every point
+
+    Args:
+        points: Path, (N, 2) array or list of points
+        tolerance: Maximum flattening error in pixels
+
+    Returns:
+        Sampled curve
+    """
+    path = Path(points)
+    if len(path) < 3:
+        return path
+    return flatten_segments(catmull_rom_segments(path), tolerance)
+
+
+def bspline(points: PointsLike, tolerance: float = 0.5) -> Path:
+    """
+    Smooth curve approximating the control points (C2 continuous)
+
+    Args:
+        points: B-spline control points
+        tolerance: Maximum flattening error in pixels
+
+    Returns:
+        Sampled curve starting and ending at the end control points
+    """
+    path = Path(points)
+    if len(path) < 3:
+        return path
+    return flatten_segments(bspline_segments(path), tolerance)
+
+
+def cubic_bezier(control_points: PointsLike, tolerance: float = 0.5) -> Path:
+    """
+    Piecewise cubic Bézier curve
+
+    Args:
+        control_points: 3k + 1 control points
+        tolerance: Maximum flattening error in pixels
+
+    Returns:
+        Sampled curve
+    """
+    return flatten_segments(bezier_segments(control_points), tolerance)
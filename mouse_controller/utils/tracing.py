@@ -0,0 +1,159 @@
+"""
+Optional tracing of movements in Chrome Trace Event format
+
+Spans are appended to a bounded deque, which is thread-safe without a lock
+(one append per finished span), and exported as JSON that chrome://tracing
+and ui.perfetto.dev open directly. Tracing is off by default; movers only
+wrap their backend calls while it is on, so a disabled tracer costs nothing
+per point.
+"""
+
+import json
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager, nullcontext
+from typing import IO, Any, Callable, ContextManager, Dict, Iterator, List, Union
+
+# Spans kept before the oldest are dropped
+DEFAULT_CAPACITY = 100_000
+
+_NULL_SPAN = nullcontext()
+
+
+class Tracer:
+    """Collects timed spans into a bounded in-memory buffer"""
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY, enabled: bool = False):
+        """
+        Initialize Tracer
+
+        Args:
+            capacity: Maximum number of spans kept
+            enabled: Start recording right away
+        """
+        self.enabled = enabled
+        # (name, category, start ns, duration ns, thread id, args)
+        self._spans: deque = deque(maxlen=capacity)
+        self._pid = os.getpid()
+
+    def enable(self):
+        """Start recording spans"""
+        self.enabled = True
+
+    def disable(self):
+        """Stop recording spans; recorded ones are kept"""
+        self.enabled = False
+
+    def clear(self):
+        """Drop all recorded spans"""
+        self._spans.clear()
+
+    def __len__(self) -> int:
+        return len(self._spans)
+
+    def add(self, name: str, category: str, start_ns: int, end_ns: int, **args: Any):
+        """
+        Record a finished span
+
+        Args:
+            name: Span name
+            category: Span category, e.g. "backend"
+            start_ns: perf_counter_ns at the start
+            end_ns: perf_counter_ns at the end
+            **args: Values shown with the span
+        """
+        self._spans.append(
+            (name, category, start_ns, end_ns - start_ns, threading.get_ident(), args)
+        )
+
+    def span(self, name: str, category: str = "mover", **args: Any) -> ContextManager:
+        """
+        Time a block as one span (a no-op while disabled)
+
+        Args:
+            name: Span name
+            category: Span category
+            **args: Values shown with the span
+
+        Returns:
+            Context manager timing the block
+        """
+        if not self.enabled:
+            return _NULL_SPAN
+        return self._span(name, category, args)
+
+    @contextmanager
+    def _span(self, name: str, category: str, args: Dict[str, Any]) -> Iterator:
+        start = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            self.add(name, category, start, time.perf_counter_ns(), **args)
+
+    def wrap(
+        self, func: Callable[..., Any], name: str, category: str = "backend"
+    ) -> Callable[..., Any]:
+        """
+        Wrap a callable to record a span per call
+
+        Args:
+            func: Callable to trace, e.g. backend.move_to
+            name: Span name
+            category: Span category
+
+        Returns:
+            Wrapped callable with the same signature
+        """
+        spans = self._spans
+        clock = time.perf_counter_ns
+        get_ident = threading.get_ident
+
+        def traced(*args, **kwargs):
+            start = clock()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                spans.append((name, category, start, clock() - start, get_ident(), {}))
+
+        return traced
+
+    def events(self) -> List[Dict[str, Any]]:
+        """
+        Recorded spans as Chrome trace events
+
+        Returns:
+            List of complete ("X") events with times in microseconds
+        """
+        return [
+            {
+                "name": name,
+                "cat": category,
+                "ph": "X",
+                "ts": start / 1000,
+                "dur": duration / 1000,
+                "pid": self._pid,
+                "tid": tid,
+                "args": args,
+            }
+            for name, category, start, duration, tid, args in list(self._spans)
+        ]
+
+    def export(self, target: Union[str, IO[str]]):
+        """
+        Write the trace as Chrome Trace Event / Perfetto JSON
+
+        Args:
+            target: File path or text file object
+        """
+        trace = {"traceEvents": self.events(), "displayTimeUnit": "ms"}
+        if isinstance(target, str):
+            with open(target, "w", encoding="utf-8") as f:
+                json.dump(trace, f, default=str)
+        else:
+            json.dump(trace, target, default=str)
+
+
+# Tracer used by movers and patterns unless they are given their own
+tracer = Tracer()
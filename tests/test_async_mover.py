@@ -0,0 +1,126 @@
+"""
+Тести для асинхронного керування курсором
+"""
+
+import asyncio
+import time
+import unittest
+
+from mouse_controller.backends import MemoryBackend
+from mouse_controller.core.async_mover import AsyncMouseMover, backend_lock
+
+
+class TestAsyncMouseMover(unittest.IsolatedAsyncioTestCase):
+    """Тести для класу AsyncMouseMover"""
+
+    def setUp(self):
+        """Налаштування перед кожним тестом"""
+        self.backend = MemoryBackend(800, 600, position=(100, 100))
+        self.mover = AsyncMouseMover(failsafe=False, backend=self.backend, rate=200)
+
+    async def test_move_to_position(self):
+        """Тест плавного переміщення до позиції"""
+        result = await self.mover.move_to_position(200, 300, duration=0.05)
+        self.assertTrue(result)
+        self.assertEqual(len(self.backend.moves), 10)
+        self.assertEqual(self.mover.get_current_position(), (200, 300))
+
+    async def test_pause_after_discrete_move(self):
+        """Тест паузи після дискретного переміщення"""
+        mover = AsyncMouseMover(failsafe=False, pause=0.1, backend=self.backend)
+        start = time.perf_counter()
+        self.assertTrue(await mover.move_to_position(200, 300, duration=0.05))
+        self.assertGreaterEqual(time.perf_counter() - start, 0.1)
+
+    async def test_smooth_path_and_circle(self):
+        """Тест руху по шляху та по колу"""
+        self.assertTrue(
+            await self.mover.move_smooth_path([(1, 1), (2, 2), (-5, 3)], 0.001)
+        )
+        self.assertEqual([move[:2] for move in self.backend.moves], [(1, 1), (2, 2)])
+
+        self.assertTrue(await self.mover.move_in_circle(400, 300, 50, 20, True, 0.001))
+        self.assertEqual(self.mover.get_current_position(), (450, 300))
+
+    async def test_cancellation_mid_path(self):
+        """Тест скасування посеред шляху"""
+        points = [(i, i) for i in range(100)]
+        task = asyncio.create_task(self.mover.move_smooth_path(points, 0.01))
+        await asyncio.sleep(0.05)
+        task.cancel()
+
+        with self.assertRaises(asyncio.CancelledError):
+            await task
+        self.assertLess(len(self.backend.moves), 50)
+        self.assertFalse(self.mover.lock.locked())
+
+    async def test_circle_events(self):
+        """Тест назви подій руху по колу"""
+        task = asyncio.create_task(self.mover.move_in_circle(400, 300, 50, 100))
+        await asyncio.sleep(0.05)
+        with self.assertLogs("mouse_controller.core.async_mover") as logs:
+            task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+        self.assertEqual(
+            [record.event for record in logs.records], ["circle.cancelled"]
+        )
+
+    async def test_clients_share_backend(self):
+        """Тест почергового доступу кількох клієнтів до одного бекенду"""
+        other = AsyncMouseMover(failsafe=False, backend=self.backend)
+        first = [(10, i) for i in range(10)]
+        second = [(20, i) for i in range(10)]
+
+        results = await asyncio.gather(
+            self.mover.move_smooth_path(first, 0.001),
+            other.move_smooth_path(second, 0.001),
+        )
+
+        self.assertEqual(results, [True, True])
+        # Запізнілі кадри можуть об'єднуватися, але шляхи не перемежовуються
+        xs = [move[0] for move in self.backend.moves]
+        self.assertEqual(xs, sorted(xs))
+        self.assertEqual(set(xs), {10, 20})
+        ends = [move[:2] for move in self.backend.moves if move[1] == 9]
+        self.assertEqual(ends, [(10, 9), (20, 9)])
+
+    async def test_display_lock_is_shared_by_name(self):
+        """Тест спільного блокування для різних екземплярів одного дисплея"""
+        first, second = MemoryBackend(), MemoryBackend()
+        self.assertIsNot(backend_lock(first), backend_lock(second))
+
+        first.shared_screen = second.shared_screen = True
+        self.assertIs(backend_lock(first), backend_lock(second))
+
+    async def test_rejects_zero_duration_per_point(self):
+        """Тест відхилення нульового часу на точку"""
+        self.assertFalse(await self.mover.move_smooth_path([(1, 1)], 0))
+        self.assertFalse(await self.mover.move_in_circle(400, 300, 50, 20, True, 0))
+        self.assertEqual(self.backend.moves, [])
+
+    async def test_shake_returns_to_origin(self):
+        """Тест повернення курсора після струшування"""
+        self.assertTrue(await self.mover.shake_cursor(0.1, 10, seed=1))
+        self.assertEqual(self.mover.get_current_position(), (100, 100))
+
+
+class TestBackendLock(unittest.TestCase):
+    """Тести для блокувань бекендів у різних циклах подій"""
+
+    def test_lock_per_event_loop(self):
+        """Тест окремого блокування для кожного циклу подій"""
+        backend = MemoryBackend()
+
+        async def use_lock():
+            async with backend_lock(backend):
+                pass
+            return backend_lock(backend)
+
+        first = asyncio.run(use_lock())
+        second = asyncio.run(use_lock())
+        self.assertIsNot(first, second)
+
+
+if __name__ == "__main__":
+    unittest.main()
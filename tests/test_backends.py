@@ -0,0 +1,123 @@
+"""
+Тести для бекендів виводу курсора
+"""
+
+import os
+import time
+import unittest
+
+from mouse_controller.backends import (
+    FailSafeError,
+    MemoryBackend,
+    MouseBackend,
+    get_backend,
+)
+from mouse_controller.core.mouse_mover import MouseMover
+
+
+class WarpRecorder(MouseBackend):
+    """Бекенд, що записує миттєві переміщення"""
+
+    def __init__(self):
+        super().__init__()
+        self.warps = [(0, 0)]
+
+    def size(self):
+        return 800, 600
+
+    def position(self):
+        return self.warps[-1]
+
+    def warp(self, x, y):
+        self.warps.append((x, y))
+
+
+class TestBackends(unittest.TestCase):
+    """Тести для бекендів"""
+
+    def test_memory_backend_records_moves(self):
+        """Тест запису рухів у пам'яті"""
+        backend = MemoryBackend(800, 600)
+        backend.configure(failsafe=False, pause=0.1)
+        backend.move_to(10, 20, duration=0.5)
+
+        self.assertEqual(backend.moves, [(10, 20, 0.5)])
+        self.assertEqual(backend.position(), (10, 20))
+        self.assertAlmostEqual(backend.clock, 0.6)
+
+    def test_failsafe_in_corner(self):
+        """Тест аварійної зупинки в куті екрана"""
+        backend = MemoryBackend(800, 600, position=(0, 0))
+        with self.assertRaises(FailSafeError):
+            backend.move_to(100, 100)
+
+        backend.configure(failsafe=False)
+        backend.move_to(100, 100)
+        self.assertEqual(backend.position(), (100, 100))
+
+    def test_generic_tween(self):
+        """Тест лінійної анімації з миттєвих переміщень"""
+        backend = WarpRecorder()
+        backend.configure(failsafe=False)
+        backend.move_to(100, 50, duration=0.05)
+
+        self.assertEqual(len(backend.warps), 4)
+        self.assertEqual(backend.warps[1], (33, 17))
+        self.assertEqual(backend.warps[-1], (100, 50))
+
+    def test_short_move_takes_its_duration(self):
+        """Тест очікування тривалості рухів, коротших за кадр анімації"""
+        backend = WarpRecorder()
+        backend.configure(failsafe=False)
+
+        start = time.perf_counter()
+        for _ in range(5):
+            backend.move_to(10, 10, duration=0.008)
+        elapsed = time.perf_counter() - start
+
+        self.assertGreaterEqual(elapsed, 0.04)
+        self.assertEqual(backend.warps[1:], [(10, 10)] * 5)
+
+    def test_failsafe_reuses_screen_size(self):
+        """Тест повторного використання розміру екрана перевіркою failsafe"""
+        backend = WarpRecorder()
+        backend.warp(50, 50)
+        calls = []
+        size = backend.size
+        backend.size = lambda: calls.append(None) or size()
+
+        for i in range(10):
+            backend.move_to(100 + i, 100)
+        self.assertEqual(len(calls), 1)
+
+        backend._failsafe_size_at -= backend.failsafe_size_ttl
+        backend.move_to(100, 100)
+        self.assertEqual(len(calls), 2)
+
+    def test_get_backend(self):
+        """Тест вибору бекенду за назвою"""
+        backend = MemoryBackend()
+        self.assertIs(get_backend(backend), backend)
+        self.assertIsInstance(get_backend("memory"), MemoryBackend)
+        with self.assertRaises(ValueError):
+            get_backend("missing")
+
+    def test_mover_with_memory_backend(self):
+        """Тест MouseMover без дисплея"""
+        mover = MouseMover(failsafe=False, pause=0, backend="memory")
+        mover.move_smooth_path([(10, 10), (20, 20), (5000, 5)], 0.1)
+
+        self.assertEqual(mover.backend.moves, [(10, 10, 0.1), (20, 20, 0.1)])
+        self.assertEqual(mover.get_current_position(), (20, 20))
+
+    @unittest.skipUnless(os.environ.get("DISPLAY"), "X display is required")
+    def test_xlib_backend_warp(self):
+        """Тест бекенду X11 (під Xvfb)"""
+        with get_backend("xlib") as backend:
+            width, height = backend.size()
+            backend.warp(width // 2, height // 2)
+            self.assertEqual(backend.position(), (width // 2, height // 2))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,113 @@
+"""
+Тести для алгебри композиції патернів
+"""
+
+import tracemalloc
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+
+from mouse_controller.core.compose import pattern
+from mouse_controller.core.mouse_mover import MouseMover
+from mouse_controller.core.patterns import PatternGenerator
+
+
+class TestPatternExpr(unittest.TestCase):
+    """Тести для лінивих виразів патернів"""
+
+    def setUp(self):
+        """Налаштування перед кожним тестом"""
+        self.line = pattern([(0, 0), (10, 0), (20, 0)])
+
+    def test_concat_and_repeat(self):
+        """Тест конкатенації та повторення"""
+        expr = self.line + [(30, 5)]
+        self.assertEqual(list(expr), [(0, 0), (10, 0), (20, 0), (30, 5)])
+
+        repeated = self.line * 1000
+        self.assertEqual(len(repeated), 3000)
+        self.assertEqual(list(repeated)[3:6], list(self.line))
+
+    def test_generator_called_once(self):
+        """Тест одноразової генерації при повтореннях"""
+        calls = []
+
+        def factory():
+            calls.append(1)
+            return PatternGenerator.generate_star_points(100, 100, 50, 25)
+
+        expr = pattern(factory) * 5
+        self.assertEqual(len(list(expr)), 5 * 11)
+        self.assertEqual(len(calls), 1)
+
+    def test_reverse(self):
+        """Тест зворотного порядку"""
+        self.assertEqual(list(self.line.reverse()), [(20, 0), (10, 0), (0, 0)])
+        combined = (self.line + [(30, 0)]).reverse()
+        self.assertEqual(list(combined)[0], (30, 0))
+
+    def test_reverse_nested_expressions(self):
+        """Тест зворотного порядку складених виразів"""
+        other = pattern([(1, 1), (2, 2)])
+        expr = (self.line * 2 + other.translate(10, 0).stretch(2)).reverse()
+        forward = list(
+            (self.line * 2 + other.translate(10, 0).stretch(2)).iter_timed(1)
+        )
+
+        self.assertEqual(list(expr.iter_timed(1)), forward[::-1])
+        self.assertEqual(list(expr.reverse()), [xy[:2] for xy in forward])
+
+    def test_reverse_streams_repeats(self):
+        """Тест зворотного повторення без буферизації всіх точок"""
+        star = pattern(PatternGenerator.generate_star_points(500, 500, 100, 50))
+        expr = (star * 100_000).reverse()
+        list(star)
+
+        tracemalloc.start()
+        try:
+            count = sum(len(xy) for xy, _ in expr.chunks())
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+        self.assertEqual(count, 1_100_000)
+        self.assertLess(peak, 1 << 20)
+
+    def test_repeat_accepts_numpy_integers(self):
+        """Тест повторення з цілим числом NumPy"""
+        self.assertEqual(len(self.line * np.int64(3)), 9)
+        self.assertEqual(len(np.int32(2) * self.line), 6)
+
+    def test_transforms(self):
+        """Тест афінних перетворень"""
+        self.assertEqual(list(self.line.translate(5, 7))[0], (5, 7))
+        self.assertEqual(list(self.line.mirror("x")), [(20, 0), (10, 0), (0, 0)])
+        self.assertEqual(list(self.line.scale(2, about=(0, 0)))[-1], (40, 0))
+        self.assertEqual(list(self.line.rotate(90, about=(0, 0)))[-1], (0, 20))
+        self.assertEqual(
+            list(self.line.rotate(90, about=(0, 0)).translate(1, 1))[-1], (1, 21)
+        )
+
+    def test_stretch(self):
+        """Тест розтягування в часі"""
+        expr = self.line + self.line.stretch(3)
+        durations = [d for _, _, d in expr.iter_timed(0.1)]
+        self.assertEqual(durations[:3], [0.1] * 3)
+        self.assertAlmostEqual(durations[-1], 0.3)
+
+    @patch("pyautogui.size", return_value=(1920, 1080))
+    @patch("pyautogui.moveTo")
+    def test_move_timed_path(self, mock_move, mock_size):
+        """Тест відтворення виразу через MouseMover"""
+        mover = MouseMover(failsafe=False, pause=0)
+        expr = self.line.translate(100, 100).stretch(2) * 2
+
+        result = mover.move_timed_path(expr.iter_timed(0.05))
+        self.assertTrue(result)
+        self.assertEqual(mock_move.call_count, 6)
+        mock_move.assert_called_with(120, 100, duration=0.1)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,186 @@
+"""
+Тести для демона керування через Unix-сокет
+"""
+
+import os
+import shutil
+import socket
+import stat
+import tempfile
+import threading
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+
+from mouse_controller.backends import MemoryBackend
+from mouse_controller.core.mouse_mover import MouseMover
+from mouse_controller.daemon import DaemonError, MotionClient, MotionDaemon
+from mouse_controller.daemon import protocol
+
+
+class TestProtocol(unittest.TestCase):
+    """Тести для двійкового формату кадрів"""
+
+    def test_points_use_int16_when_they_fit(self):
+        """Тест вибору int16 для малих координат"""
+        kind, payload = protocol.encode_points([(1, 2), (300, -400)], rate=60.0)
+
+        self.assertEqual(kind, protocol.POINTS16)
+        self.assertEqual(len(payload), protocol.RATE.size + 2 * 2 * 2)
+        path, rate = protocol.decode_points(kind, payload)
+        self.assertEqual(path.tolist(), [(1, 2), (300, -400)])
+        self.assertEqual(rate, 60.0)
+
+    def test_large_points_use_int32(self):
+        """Тест вибору int32 для великих координат"""
+        kind, payload = protocol.encode_points(np.array([[70000, 5]]))
+
+        self.assertEqual(kind, protocol.POINTS32)
+        path, _ = protocol.decode_points(kind, payload)
+        self.assertEqual(path.tolist(), [(70000, 5)])
+
+    def test_rejects_malformed_batches(self):
+        """Тест відхилення пошкоджених пакетів точок"""
+        with self.assertRaises(protocol.ProtocolError):
+            protocol.decode_points(protocol.POINTS16, b"\x00\x00\x00\x00\x01")
+        with self.assertRaises(protocol.ProtocolError):
+            protocol.decode_points(protocol.POINTS16, protocol.RATE.pack(-1.0))
+
+
+@unittest.skipUnless(hasattr(socket, "AF_UNIX"), "Unix sockets are required")
+class TestMotionDaemon(unittest.TestCase):
+    """Тести для класу MotionDaemon"""
+
+    def setUp(self):
+        """Запуск демона з бекендом у пам'яті"""
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, "mouse.sock")
+        self.backend = MemoryBackend()
+        mover = MouseMover(failsafe=False, pause=0, backend=self.backend)
+        self.daemon = MotionDaemon(self.path, mover=mover, window=2).start()
+        self.client = MotionClient(self.path, window=4, timeout=5.0)
+
+    def tearDown(self):
+        """Зупинка демона"""
+        self.client.close()
+        self.daemon.close()
+        shutil.rmtree(self.directory)
+
+    def test_control_messages(self):
+        """Тест керуючих повідомлень"""
+        self.client.ping()
+        self.assertEqual(self.client.position(), (960, 540))
+        self.assertEqual(self.client.stop(), 0)
+        self.assertEqual(self.client.stats()["clients"], 1)
+
+    def test_streams_point_batches(self):
+        """Тест потокової передачі пакетів точок"""
+        batches = [[(x, y) for x in range(10, 20)] for y in range(20)]
+        for batch in batches:
+            self.client.send_points(batch)
+
+        self.assertTrue(self.client.flush())
+        visited = [(x, y) for x, y, _ in self.backend.moves]
+        self.assertEqual(visited, [point for batch in batches for point in batch])
+        # Зворотний тиск: у черзі не більше вікна одного клієнта
+        self.assertLessEqual(self.client.stats()["max_depth"], 2)
+
+    def test_runs_named_pattern(self):
+        """Тест запуску зареєстрованого шаблону"""
+        self.assertTrue(self.client.pattern("square", size=100, duration=0.0))
+        self.assertEqual(len(self.backend.moves), 5)
+
+    def test_reports_errors(self):
+        """Тест повідомлення про помилки запиту"""
+        with self.assertRaises(DaemonError):
+            self.client.pattern("no_such_pattern")
+        self.client.ping()
+
+    def test_unwaited_replies_are_not_kept(self):
+        """Тест: відповіді на запити без очікування не накопичуються"""
+        for _ in range(10):
+            self.client.send_points([(1, 1)])
+        self.client.pattern("no_such_pattern", wait=False)
+
+        self.assertFalse(self.client.flush())
+        self.assertEqual(self.client.failures, 1)
+        self.assertEqual(self.client._replies, {})
+        self.assertTrue(self.client.flush())
+
+    def test_request_ids_skip_ids_in_use(self):
+        """Тест: id не повторюється, поки запит у дорозі або відповідь збережена"""
+        self.client._pending.add(0xFFFF)
+        self.client._replies[0] = protocol.Frame(protocol.OK, 0, b"")
+        self.client._next_id = 0xFFFF
+        self.assertEqual(self.client._new_id(), 1)
+
+        self.client._pending.clear()
+        self.client._replies.clear()
+        for _ in range(3):
+            self.client.send_points([(2, 2)])
+        self.assertTrue(self.client.flush())
+        self.assertEqual(self.client.position(), (2, 2))
+
+    def test_stalled_client_does_not_block_others(self):
+        """Тест: клієнт, що не читає відповіді, не блокує інших"""
+        self.client.ping()
+        connection = next(iter(self.daemon._connections))
+        release = threading.Event()
+
+        class StalledSocket:
+            """Сокет, запис у який чекає на release"""
+
+            def __init__(self, sock):
+                self.sock = sock
+
+            def sendall(self, data):
+                release.wait()
+                self.sock.sendall(data)
+
+            def __getattr__(self, name):
+                return getattr(self.sock, name)
+
+        connection.sock = StalledSocket(connection.sock)
+        self.client.send_points([(5, 5)])
+        try:
+            with MotionClient(self.path, timeout=2.0) as other:
+                self.assertTrue(other.send_points([(6, 6)], wait=True))
+        finally:
+            release.set()
+        self.assertTrue(self.client.flush())
+
+    def test_socket_is_private(self):
+        """Тест прав доступу до файлу сокета"""
+        mode = os.stat(self.path).st_mode
+        self.assertTrue(stat.S_ISSOCK(mode))
+        self.assertEqual(stat.S_IMODE(mode), 0o600)
+
+    def test_bind_leaves_umask_alone(self):
+        """Тест: bind() не змінює umask процесу"""
+        path = os.path.join(self.directory, "other.sock")
+        daemon = MotionDaemon(path, mover=self.daemon.mover)
+        with patch("os.umask") as umask:
+            daemon.bind()
+        daemon.close()
+
+        umask.assert_not_called()
+
+    def test_keeps_regular_file_at_socket_path(self):
+        """Тест: звичайний файл на шляху сокета не видаляється"""
+        path = os.path.join(self.directory, "file.sock")
+        with open(path, "w") as f:
+            f.write("data")
+
+        with self.assertRaises(RuntimeError):
+            MotionDaemon(path, mover=self.daemon.mover).bind()
+        self.assertTrue(os.path.isfile(path))
+
+    def test_refuses_second_daemon(self):
+        """Тест заборони другого демона на тому ж сокеті"""
+        with self.assertRaises(RuntimeError):
+            MotionDaemon(self.path, mover=self.daemon.mover).bind()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,107 @@
+"""
+Тести для подій журналу та метрик руху
+"""
+
+import logging
+import unittest
+
+from mouse_controller.backends import MemoryBackend
+from mouse_controller.core.mouse_mover import MouseMover
+from mouse_controller.utils.events import EventLog
+from mouse_controller.utils.metrics import LatencyHistogram, MoverMetrics
+
+
+class Unprintable:
+    """Значення, що падає при форматуванні"""
+
+    def __str__(self):
+        raise AssertionError("formatted while disabled")
+
+
+class TestEventLog(unittest.TestCase):
+    """Тести для класу EventLog"""
+
+    def setUp(self):
+        """Налаштування перед кожним тестом"""
+        self.logger = logging.getLogger("test.events")
+        self.events = EventLog(self.logger)
+
+    def test_fields_in_record(self):
+        with self.assertLogs(self.logger, level="INFO") as logs:
+            self.events.info("path.start", points=3)
+
+        record = logs.records[0]
+        self.assertEqual(record.event, "path.start")
+        self.assertEqual(record.fields, {"points": 3})
+        self.assertEqual(record.getMessage(), "path.start points=3")
+
+    def test_disabled_level_not_formatted(self):
+        self.logger.setLevel(logging.WARNING)
+        try:
+            # Формування рядка впало б, якби подія не була відкинута
+            self.events.info("path.start", value=Unprintable())
+        finally:
+            self.logger.setLevel(logging.NOTSET)
+
+    def test_sampling(self):
+        with self.assertLogs(self.logger, level="WARNING") as logs:
+            for index in range(10):
+                self.events.emit(logging.WARNING, "skip", sample_every=4, i=index)
+
+        self.assertEqual([r.fields["i"] for r in logs.records], [0, 4, 8])
+
+
+class TestMetrics(unittest.TestCase):
+    """Тести для LatencyHistogram та MoverMetrics"""
+
+    def test_histogram(self):
+        histogram = LatencyHistogram()
+        for seconds in (0.0001, 0.0002, 0.002, 0.5):
+            histogram.record(seconds)
+
+        self.assertEqual(histogram.count, 4)
+        self.assertAlmostEqual(histogram.max, 0.5)
+        self.assertLessEqual(histogram.percentile(50), 0.00025)
+        self.assertEqual(histogram.percentile(100), 0.5)
+        self.assertEqual(sum(histogram.snapshot()["counts"]), 4)
+
+    def test_disabled_uses_backend_directly(self):
+        mover = MouseMover(failsafe=False, pause=0, backend=MemoryBackend())
+        self.assertEqual(mover._mover(), mover.backend.move_to)
+
+        self.assertTrue(mover.move_smooth_path([(10, 10), (20, 20)], 0))
+        self.assertEqual(mover.metrics.snapshot()["moves"], 0)
+
+    def test_mover_counters(self):
+        backend = MemoryBackend(width=100, height=100)
+        mover = MouseMover(failsafe=False, pause=0, backend=backend, metrics=True)
+
+        mover.move_smooth_path([(10, 10), (-5, 10), (20, 20)], 0)
+        mover.move_to_position(500, 500)
+
+        metrics = mover.metrics
+        self.assertEqual(metrics.moves, 2)
+        self.assertEqual(metrics.skipped_points, 2)
+        self.assertEqual(metrics.backend_latency.count, 2)
+
+        metrics.reset()
+        self.assertEqual(metrics.snapshot()["backend_latency"]["count"], 0)
+
+    def test_errors_counted(self):
+        backend = MemoryBackend()
+        mover = MouseMover(failsafe=False, pause=0, backend=backend)
+        mover.metrics = MoverMetrics(enabled=True)
+
+        def broken_move(x, y, duration=0.0):
+            raise RuntimeError("backend gone")
+
+        backend.move_to = broken_move
+        with self.assertLogs(mover.logger, level="ERROR"):
+            self.assertFalse(mover.move_to_position(10, 10))
+
+        self.assertEqual(mover.metrics.errors, 1)
+        self.assertEqual(mover.metrics.backend_latency.count, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
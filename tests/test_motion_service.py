@@ -0,0 +1,159 @@
+"""
+Тести для черги команд руху
+"""
+
+import threading
+import unittest
+from concurrent.futures import CancelledError
+
+from mouse_controller.backends import MemoryBackend
+from mouse_controller.core.motion_service import MotionService, Priority
+from mouse_controller.core.mouse_mover import MouseMover
+
+
+class TestMotionService(unittest.TestCase):
+    """Тести для класу MotionService"""
+
+    def setUp(self):
+        """Налаштування перед кожним тестом"""
+        self.backend = MemoryBackend()
+        self.mover = MouseMover(failsafe=False, pause=0, backend=self.backend)
+        self.service = MotionService(self.mover, start=False)
+
+    def tearDown(self):
+        """Зупинка робочого потоку"""
+        self.service.shutdown(timeout=1.0)
+
+    def test_runs_commands_by_priority(self):
+        """Тест виконання команд за пріоритетом, потім за порядком"""
+        order = []
+        self.service.submit(order.append, "low", priority=Priority.LOW)
+        self.service.submit(order.append, "first")
+        self.service.submit(order.append, "second")
+        last = self.service.submit(order.append, "high", priority=Priority.HIGH)
+
+        self.service.start()
+        last.result(timeout=1.0)
+        self.service.submit(lambda: None).result(timeout=1.0)
+
+        self.assertEqual(order, ["high", "first", "second", "low"])
+
+    def test_coalesces_absolute_moves(self):
+        """Тест об'єднання абсолютних переміщень у черзі"""
+        first = self.service.move_to(100, 100, 0.0)
+        second = self.service.move_to(200, 200, 0.0)
+        third = self.service.move_to(300, 300, 0.0)
+
+        self.assertIs(first, second)
+        self.assertIs(second, third)
+        self.assertEqual(self.service.depth, 1)
+
+        self.service.start()
+        self.assertTrue(third.result(timeout=1.0))
+        self.assertEqual(self.backend.moves, [(300, 300, 0.0)])
+
+        metrics = self.service.metrics()
+        self.assertEqual(metrics.submitted, 3)
+        self.assertEqual(metrics.completed, 1)
+        self.assertEqual(metrics.coalesced, 2)
+        self.assertEqual(metrics.max_depth, 1)
+
+    def test_high_priority_preempts_path(self):
+        """Тест переривання шляху командою з вищим пріоритетом"""
+        points = [(100 + i, 200) for i in range(1000)]
+        started = threading.Event()
+        warp = self.backend.warp
+
+        def first_frame(x, y):
+            started.set()
+            warp(x, y)
+
+        # Команда HIGH має прийти, коли шлях уже відтворюється
+        self.backend.warp = first_frame
+        self.service.start()
+        path = self.service.submit(
+            self.mover.play_path, points, 200.0, priority=Priority.LOW
+        )
+
+        self.assertTrue(started.wait(1.0))
+        move = self.service.move_to(5, 5, 0.0, priority=Priority.HIGH)
+
+        self.assertFalse(path.result(timeout=1.0))
+        self.assertTrue(move.result(timeout=1.0))
+        self.assertEqual(self.backend.moves[-1], (5, 5, 0.0))
+        self.assertEqual(self.service.metrics().preempted, 1)
+
+        # Перерваний шлях продовжується з місця зупинки
+        halted_at = path.stop_token.halted_at
+        self.assertLess(halted_at, len(points))
+        resumed = self.service.submit(
+            self.mover.play_path, points, 1000.0, start_index=halted_at
+        )
+        self.assertTrue(resumed.result(timeout=2.0))
+        self.assertEqual(self.backend.moves[-1][:2], points[-1])
+
+    def test_unstoppable_command_is_not_preempted(self):
+        """Тест: команда без stop_token не вважається перерваною"""
+        release = threading.Event()
+        started = threading.Event()
+
+        def blocking():
+            started.set()
+            release.wait(1.0)
+            return True
+
+        self.service.start()
+        running = self.service.submit(blocking, priority=Priority.LOW)
+        self.assertTrue(started.wait(1.0))
+        move = self.service.move_to(5, 5, 0.0, priority=Priority.HIGH)
+        release.set()
+
+        self.assertTrue(running.result(timeout=1.0))
+        self.assertTrue(move.result(timeout=1.0))
+        self.assertEqual(self.service.metrics().preempted, 0)
+
+    def test_cancel_all_drops_queue(self):
+        """Тест скасування команд у черзі"""
+        futures = [self.service.submit(lambda: None) for _ in range(3)]
+
+        self.assertEqual(self.service.cancel_all(), 3)
+        self.assertTrue(all(future.cancelled() for future in futures))
+        with self.assertRaises(CancelledError):
+            futures[0].result()
+        self.assertEqual(self.service.metrics().cancelled, 3)
+
+    def test_cancelled_futures_are_not_completed(self):
+        """Тест обліку скасованих через future команд"""
+        order = []
+        cancelled = self.service.submit(order.append, "cancelled")
+        move = self.service.move_to(100, 100, 0.0)
+        self.service.move_to(200, 200, 0.0)
+        self.assertTrue(cancelled.cancel())
+        self.assertTrue(move.cancel())
+
+        self.service.start()
+        self.service.submit(order.append, "done").result(timeout=1.0)
+
+        metrics = self.service.metrics()
+        self.assertEqual(order, ["done"])
+        self.assertEqual(self.backend.moves, [])
+        self.assertEqual(metrics.submitted, 4)
+        self.assertEqual(metrics.completed, 1)
+        self.assertEqual(metrics.coalesced, 1)
+        self.assertEqual(metrics.cancelled, 2)
+
+    def test_reports_errors_and_wait_time(self):
+        """Тест передачі помилок і метрик очікування"""
+        self.service.start()
+        future = self.service.submit(int, "not a number")
+
+        with self.assertRaises(ValueError):
+            future.result(timeout=1.0)
+        metrics = self.service.metrics()
+        self.assertEqual(metrics.completed, 1)
+        self.assertGreaterEqual(metrics.max_wait, metrics.mean_wait)
+        self.assertGreater(metrics.mean_wait, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -6,13 +6,32 @@ import unittest
 from unittest.mock import patch, MagicMock
 import sys
 import os
+import tracemalloc
+
+import numpy as np
 
 # Додавання шляху до модуля
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 
-from mouse_controller.core.mouse_mover import MouseMover
+from mouse_controller.backends import MemoryBackend
+from mouse_controller.core.compose import pattern
+from mouse_controller.core.mouse_mover import STREAM_FILTER_CHUNK, MouseMover
+from mouse_controller.core.path import Path
 from mouse_controller.core.patterns import PatternGenerator
-from mouse_controller.utils.helpers import validate_coordinates, get_screen_center
+from mouse_controller.utils.helpers import (
+    clamp_path,
+    filter_path,
+    get_screen_center,
+    validate_coordinates,
+    validate_path,
+)
+
+
+class NullBackend(MemoryBackend):
+    """Бекенд, що не зберігає переміщення"""
+
+    def move_to(self, x, y, duration=0.0):
+        pass
 
 
 class TestMouseMover(unittest.TestCase):
@@ -63,6 +82,17 @@ class TestMouseMover(unittest.TestCase):
         self.assertTrue(result)
         mock_move.assert_called_once_with(150, 175, duration=1.0)
 
+    @patch("pyautogui.moveTo")
+    @patch("pyautogui.position")
+    def test_move_human_like(self, mock_position, mock_move):
+        """Тест руху по людиноподібній траєкторії"""
+        mock_position.return_value = MagicMock(x=100, y=100)
+
+        result = self.mover.move_human_like(400, 300)
+        self.assertTrue(result)
+        self.assertGreater(mock_move.call_count, 10)
+        self.assertEqual(mock_move.call_args[0], (400, 300))
+
     @patch("pyautogui.moveTo")
     def test_move_to_center(self, mock_move):
         """Тест переміщення в центр"""
@@ -115,12 +145,23 @@ class TestPatternGenerator(unittest.TestCase):
         expected_length = 5 * 2 + 1  # points * 2 + замикання
         self.assertEqual(len(points), expected_length)
 
+        # Вершини збігаються з початковою формулою до пікселя
+        points = self.pattern_gen.generate_star_points(0, 0, 10, 40, 3)
+        self.assertEqual(points[5], (-34, -19))
+        points = self.pattern_gen.generate_star_points(0, 0, 100, 5, 12)
+        self.assertEqual(points[10], (50, 86))
+        self.assertEqual(points[20], (-86, -49))
+
     def test_generate_spiral_points(self):
         """Тест генерації точок спіралі"""
         points = self.pattern_gen.generate_spiral_points(100, 100, 50, 2, 10)
         expected_length = 2 * 10 + 1  # turns * steps_per_turn + 1
         self.assertEqual(len(points), expected_length)
 
+        # Точки збігаються з початковою формулою до пікселя
+        points = self.pattern_gen.generate_spiral_points(0, 0, 33, 5, 3)
+        self.assertEqual(points[10], (-11, 19))
+
     def test_generate_random_walk(self):
         """Тест генерації випадкового блукання"""
         points = self.pattern_gen.generate_random_walk(100, 100, 5, 10)
@@ -129,6 +170,48 @@ class TestPatternGenerator(unittest.TestCase):
         # Перша точка повинна бути початковою
         self.assertEqual(points[0], (100, 100))
 
+    def test_generate_arrays_match_lists(self):
+        """Тест відповідності масивів і списків точок"""
+        cases = [
+            ("generate_circle_array", "generate_circle_points", (100, 100, 50, 10)),
+            ("generate_star_array", "generate_star_points", (100, 100, 50, 25, 5)),
+            ("generate_spiral_array", "generate_spiral_points", (100, 100, 50, 2, 10)),
+            ("generate_heart_array", "generate_heart_points", (300, 300, 5, 40)),
+            (
+                "generate_figure_eight_array",
+                "generate_figure_eight",
+                (200, 200, 80, 40),
+            ),
+        ]
+        for array_name, list_name, args in cases:
+            array = getattr(self.pattern_gen, array_name)(*args)
+            points = getattr(self.pattern_gen, list_name)(*args)
+            self.assertEqual(array.shape, (len(points), 2))
+            self.assertEqual([tuple(p) for p in array.tolist()], points)
+
+    def test_generate_random_walk_seeded(self):
+        """Тест відтворюваності випадкового блукання з seed"""
+        first = self.pattern_gen.generate_random_walk_array(0, 0, 50, 10, seed=7)
+        second = self.pattern_gen.generate_random_walk_array(0, 0, 50, 10, seed=7)
+        self.assertTrue((first == second).all())
+        self.assertLessEqual(abs(first[1:] - first[:-1]).max(), 10)
+
+    def test_iter_points_match_lists(self):
+        """Тест відповідності потокових генераторів спискам точок"""
+        self.assertEqual(
+            list(self.pattern_gen.iter_spiral_points(100, 100, 50, 20, 50)),
+            self.pattern_gen.generate_spiral_points(100, 100, 50, 20, 50),
+        )
+        self.assertEqual(
+            list(self.pattern_gen.iter_random_walk(0, 0, 500, 10, seed=3)),
+            self.pattern_gen.generate_random_walk(0, 0, 500, 10, seed=3),
+        )
+
+    def test_iter_points_is_lazy(self):
+        """Тест лінивої генерації точок"""
+        stream = self.pattern_gen.iter_circle_points(0, 0, 100, 10**9)
+        self.assertEqual(next(stream), (100, 0))
+
 
 class TestHelpers(unittest.TestCase):
     """Тести для допоміжних функцій"""
@@ -146,6 +229,29 @@ class TestHelpers(unittest.TestCase):
         self.assertFalse(validate_coordinates(1920, 100, 1920, 1080))
         self.assertFalse(validate_coordinates(100, 1080, 1920, 1080))
 
+    def test_validate_path(self):
+        """Тест пакетної валідації шляху"""
+        points = [(0, 0), (-1, 5), (1919, 1079), (100, 1080)]
+        mask = validate_path(points, 1920, 1080)
+        self.assertEqual(mask.tolist(), [True, False, True, False])
+
+    def test_clamp_path(self):
+        """Тест обмеження всього шляху межами екрана"""
+        clamped = clamp_path([(-5, 10), (2000, 2000)], 1920, 1080)
+        self.assertEqual(clamped, [(0, 10), (1919, 1079)])
+
+    def test_filter_path_report(self):
+        """Тест фільтрації шляху зі звітом про відкинуті точки"""
+        points = [(10, 10), (-1, -1), (20, 20), (3000, 5)]
+        path, kept, report = filter_path(points, 1920, 1080)
+
+        self.assertEqual(path, [(10, 10), (20, 20)])
+        self.assertEqual(kept.tolist(), [0, 2])
+        self.assertEqual(report.rejected, 2)
+        self.assertEqual(report.kept, 2)
+        self.assertEqual((report.left, report.top, report.right), (1, 1, 1))
+        self.assertEqual(report.first_rejected, 1)
+
     @patch("pyautogui.size", return_value=(1920, 1080))
     def test_get_screen_center(self, mock_size):
         """Тест отримання центру екрана"""
@@ -176,6 +282,68 @@ class TestIntegration(unittest.TestCase):
         # Перевірка що moveTo було викликано для кожної точки
         self.assertEqual(mock_move.call_count, len(points))
 
+    @patch("pyautogui.size", return_value=(1920, 1080))
+    @patch("pyautogui.moveTo")
+    def test_move_smooth_path_array(self, mock_move, mock_size):
+        """Тест руху по шляху, заданому масивом NumPy"""
+        mover = MouseMover(failsafe=False, pause=0)
+        points = PatternGenerator.generate_spiral_array(960, 540, 100, 2, 10)
+
+        result = mover.move_smooth_path(points, 0.1)
+        self.assertTrue(result)
+        self.assertEqual(mock_move.call_count, len(points))
+        mock_move.assert_any_call(960, 540, duration=0.1)
+
+    @patch("pyautogui.size", return_value=(1920, 1080))
+    @patch("pyautogui.moveTo")
+    def test_move_smooth_path_iterator(self, mock_move, mock_size):
+        """Тест руху по потоковому шляху"""
+        mover = MouseMover(failsafe=False, pause=0)
+        points = PatternGenerator.iter_heart_points(960, 540, 5, 50)
+
+        result = mover.move_smooth_path(points, 0.1)
+        self.assertTrue(result)
+        self.assertEqual(mock_move.call_count, 51)
+
+    @patch("pyautogui.size", return_value=(1920, 1080))
+    @patch("pyautogui.moveTo")
+    def test_move_smooth_path_skips_offscreen(self, mock_move, mock_size):
+        """Тест пропуску точок поза екраном з одним попередженням"""
+        mover = MouseMover(failsafe=False, pause=0)
+        points = [(10, 10), (-5, 10), (20, 20), (10, 5000)]
+
+        with self.assertLogs(mover.logger, level="WARNING") as logs:
+            self.assertTrue(mover.move_smooth_path(points, 0.1))
+
+        self.assertEqual(len(logs.records), 1)
+        self.assertEqual(mock_move.call_count, 2)
+        mock_move.assert_called_with(20, 20, duration=0.1)
+
+    def test_move_smooth_path_long_paths_in_chunks(self):
+        """Тест руху довгими шляхами без завантаження в пам'ять"""
+        backend = NullBackend()
+        mover = MouseMover(failsafe=False, pause=0, backend=backend)
+        star = pattern(PatternGenerator.generate_star_points, 500, 500, 100, 50)
+        long_path = Path(np.tile([(10, 10), (-5, 10)], (STREAM_FILTER_CHUNK * 4, 1)))
+
+        for points in (star * 2_000, long_path):
+            tracemalloc.start()
+            try:
+                self.assertTrue(mover.move_smooth_path(points, 0))
+                peak = tracemalloc.get_traced_memory()[1]
+            finally:
+                tracemalloc.stop()
+            self.assertLess(peak, 2_000_000)
+
+        # Одне попередження на весь шлях, а не на кожен блок
+        with self.assertLogs(mover.logger, level="WARNING") as logs:
+            self.assertTrue(mover.move_smooth_path(long_path, 0, start_index=1))
+        self.assertEqual(len(logs.records), 1)
+        self.assertEqual(
+            logs.records[0].fields,
+            {"rejected": len(long_path) // 2, "total": len(long_path) - 1, "first": 1},
+        )
+
 
 if __name__ == "__main__":
     # Запуск тестів
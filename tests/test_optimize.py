@@ -0,0 +1,58 @@
+"""
+Тести для оптимізації шляхів
+"""
+
+import unittest
+
+from mouse_controller.core.optimize import (
+    PathOptimizer,
+    drop_duplicates,
+    merge_collinear,
+    simplify_rdp,
+)
+from mouse_controller.core.patterns import PatternGenerator
+
+
+class TestOptimizationPasses(unittest.TestCase):
+    """Тести для окремих проходів оптимізації"""
+
+    def test_drop_duplicates(self):
+        """Тест видалення послідовних дублікатів"""
+        path = drop_duplicates([(0, 0), (0, 0), (1, 1), (1, 1), (0, 0)])
+        self.assertEqual(path, [(0, 0), (1, 1), (0, 0)])
+
+    def test_merge_collinear(self):
+        """Тест злиття колінеарних відрізків"""
+        path = merge_collinear([(0, 0), (1, 1), (2, 2), (3, 3), (3, 4), (3, 5)])
+        self.assertEqual(path, [(0, 0), (3, 3), (3, 5)])
+
+    def test_merge_collinear_keeps_reversal(self):
+        """Тест збереження розвороту на прямій"""
+        path = merge_collinear([(0, 0), (5, 0), (2, 0)])
+        self.assertEqual(len(path), 3)
+
+    def test_simplify_rdp(self):
+        """Тест спрощення Рамера-Дугласа-Пекера"""
+        path = simplify_rdp([(0, 0), (5, 1), (10, 0), (15, 8), (20, 0)], 1.5)
+        self.assertEqual(path, [(0, 0), (10, 0), (15, 8), (20, 0)])
+
+
+class TestPathOptimizer(unittest.TestCase):
+    """Тести для конвеєра PathOptimizer"""
+
+    def test_report(self):
+        """Тест звіту про видалені точки"""
+        points = PatternGenerator.generate_spiral_points(500, 500, 20, 3, 100)
+        optimized, report = PathOptimizer.default(0.5).run(points)
+
+        self.assertEqual([r.name for r in report][:2], ["dedupe", "merge_collinear"])
+        self.assertEqual(report[0].points_in, len(points))
+        self.assertEqual(report[-1].points_out, len(optimized))
+        self.assertEqual(sum(r.removed for r in report), len(points) - len(optimized))
+        self.assertGreater(report[0].removed, 0)
+        self.assertEqual(optimized[0], points[0])
+        self.assertEqual(optimized[-1], points[-1])
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
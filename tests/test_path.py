@@ -0,0 +1,87 @@
+"""
+Тести для типу Path
+"""
+
+import sys
+import unittest
+
+import numpy as np
+
+from mouse_controller.core.path import Path
+from mouse_controller.core.patterns import PatternGenerator
+from mouse_controller.utils.helpers import create_smooth_curve, interpolate_points
+
+
+class TestPath(unittest.TestCase):
+    """Тести для класу Path"""
+
+    def setUp(self):
+        """Налаштування перед кожним тестом"""
+        self.path = Path([(0, 0), (10, 5), (20, 10), (30, 15)])
+
+    def test_sequence_protocol(self):
+        """Тест індексації та ітерації"""
+        self.assertEqual(len(self.path), 4)
+        self.assertEqual(self.path[1], (10, 5))
+        self.assertEqual(self.path[-1], (30, 15))
+        self.assertEqual(list(self.path), [(0, 0), (10, 5), (20, 10), (30, 15)])
+
+    def test_slice_is_view(self):
+        """Тест зрізу без копіювання"""
+        tail = self.path[1:]
+        self.assertIsInstance(tail, Path)
+        self.assertTrue(np.shares_memory(tail.array, self.path.array))
+        self.assertEqual(tail, [(10, 5), (20, 10), (30, 15)])
+
+    def test_concatenation(self):
+        """Тест конкатенації шляхів"""
+        combined = self.path + [(40, 20)]
+        self.assertEqual(len(combined), 5)
+        self.assertEqual(combined[-1], (40, 20))
+        self.assertEqual([(-10, 0)] + self.path, Path.concat([(-10, 0)], self.path))
+
+    def test_buffer_protocol(self):
+        """Тест буферного протоколу"""
+        view = self.path.memoryview()
+        self.assertEqual(view.shape, (4, 2))
+        self.assertEqual(view.nbytes, 4 * 2 * 4)
+        self.assertTrue(np.array_equal(np.asarray(self.path), self.path.array))
+
+    def test_memoryview_shares_buffer(self):
+        """Тест спільного буфера без копіювання на будь-якій версії Python"""
+        view = self.path.memoryview()
+        self.assertTrue(view.readonly)
+        self.assertTrue(np.shares_memory(np.asarray(view), self.path.array))
+        self.assertEqual(view.tolist(), [list(point) for point in self.path])
+
+    @unittest.skipIf(sys.version_info < (3, 12), "__buffer__ потребує Python 3.12")
+    def test_native_buffer_export(self):
+        """Тест memoryview(path) через __buffer__"""
+        view = memoryview(self.path)
+        self.assertEqual(view.shape, (4, 2))
+        self.assertTrue(np.shares_memory(np.asarray(view), self.path.array))
+
+    def test_immutable(self):
+        """Тест незмінності буфера"""
+        with self.assertRaises(ValueError):
+            self.path.array[0, 0] = 1
+
+    def test_from_iterator(self):
+        """Тест створення шляху з ітератора"""
+        path = Path(PatternGenerator.iter_circle_points(0, 0, 10, 8))
+        self.assertEqual(path, PatternGenerator.generate_circle_points(0, 0, 10, 8))
+
+    def test_helpers_produce_paths(self):
+        """Тест допоміжних функцій, що повертають Path"""
+        points = interpolate_points((0, 0), (30, 15), 2)
+        self.assertIsInstance(points, Path)
+        self.assertEqual(points, self.path)
+
+        curve = create_smooth_curve(self.path, 2)
+        self.assertIsInstance(curve, Path)
+        self.assertEqual(curve[0], (0, 0))
+        self.assertEqual(curve[-1], (30, 15))
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,96 @@
+"""
+Тести для планувальника відтворення з фіксованою частотою
+"""
+
+import time
+import tracemalloc
+import unittest
+
+import numpy as np
+
+from mouse_controller.backends import MemoryBackend
+from mouse_controller.core.mouse_mover import MouseMover
+from mouse_controller.core.path import Path
+from mouse_controller.core.playback import JITTER_BINS_MS, PlaybackScheduler
+
+
+class SlowBackend(MemoryBackend):
+    """Бекенд, якому потрібно 5 мс на кожне переміщення"""
+
+    def warp(self, x, y):
+        time.sleep(0.005)
+        super().warp(x, y)
+
+
+class TestPlaybackScheduler(unittest.TestCase):
+    """Тести для класу PlaybackScheduler"""
+
+    def setUp(self):
+        """Налаштування перед кожним тестом"""
+        self.backend = MemoryBackend()
+        self.backend.configure(failsafe=False, pause=0)
+
+    def test_plays_every_frame_on_time(self):
+        """Тест відтворення всіх кадрів у заданому темпі"""
+        # Період 10 мс, щоб затримки планувальника ОС не пропускали кадри
+        points = [(i, i) for i in range(20)]
+        report = PlaybackScheduler(self.backend, rate=100).play(points)
+
+        self.assertEqual(report.sent, 20)
+        self.assertEqual(report.skipped, 0)
+        self.assertAlmostEqual(report.elapsed, 19 / 100, delta=0.05)
+        self.assertEqual(sum(report.jitter_histogram), 20)
+        self.assertEqual(len(report.jitter_histogram), len(JITTER_BINS_MS))
+        self.assertEqual(self.backend.moves[-1], (19, 19, 0.0))
+
+    def test_late_frames_are_coalesced(self):
+        """Тест об'єднання запізнілих кадрів без накопичення дрейфу"""
+        backend = SlowBackend()
+        backend.configure(failsafe=False, pause=0)
+        points = [(i, 0) for i in range(100)]
+        report = PlaybackScheduler(backend, rate=1000).play(points)
+
+        self.assertGreater(report.skipped, 0)
+        self.assertEqual(report.sent + report.skipped, 100)
+        self.assertEqual(backend.position(), (99, 0))
+        # Загальний час близький до запланованого, а не 100 * 5 мс
+        self.assertLess(report.elapsed, 0.3)
+
+    def test_long_path_memory(self):
+        """Тест відтворення довгого шляху без копіювання всіх точок"""
+        backend = MemoryBackend()
+        backend.configure(failsafe=False, pause=0)
+        path = Path.from_xy(np.arange(200_000), np.zeros(200_000, dtype=int))
+
+        tracemalloc.start()
+        try:
+            report = PlaybackScheduler(backend, rate=2_000_000).play(
+                path, warp=lambda x, y: None
+            )
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+        self.assertEqual(report.sent + report.skipped, 200_000)
+        self.assertEqual(sum(report.jitter_histogram), report.sent)
+        # Перелік усіх точок у list зайняв би понад 20 МБ
+        self.assertLess(peak, 1 << 20)
+
+    def test_mover_realtime_path(self):
+        """Тест відтворення шляху через MouseMover"""
+        mover = MouseMover(failsafe=False, pause=0, backend=self.backend)
+        result = mover.move_smooth_path([(1, 1), (2, 2), (3, 3)], 0.01, realtime=True)
+
+        self.assertTrue(result)
+        self.assertEqual(mover.last_playback.sent, 3)
+        self.assertIn("3/3 frames", mover.last_playback.summary())
+
+    def test_mover_realtime_rejects_zero_duration(self):
+        """Тест відхилення нульового часу на точку в реальному часі"""
+        mover = MouseMover(failsafe=False, pause=0, backend=self.backend)
+        self.assertFalse(mover.move_smooth_path([(1, 1)], 0, realtime=True))
+        self.assertEqual(self.backend.moves, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,72 @@
+"""
+Тести для рушія випадкового блукання
+"""
+
+import unittest
+
+import numpy as np
+
+from mouse_controller.core.patterns import PatternGenerator
+from mouse_controller.core.random_walk import RandomWalkEngine
+
+
+class TestRandomWalkEngine(unittest.TestCase):
+    """Тести для класу RandomWalkEngine"""
+
+    def test_reproducible(self):
+        """Тест відтворюваності з однаковим seed"""
+        first = RandomWalkEngine(seed=11).generate(0, 0, 1000, 20)
+        second = RandomWalkEngine(seed=11).generate(0, 0, 1000, 20)
+        self.assertEqual(first, second)
+
+    def test_clamp_matches_sequential(self):
+        """Тест режиму clamp проти покрокового обмеження"""
+        engine = RandomWalkEngine(seed=5, bounds=(50, 40), boundary="clamp")
+        deltas = engine.draw_steps(2000, 30)
+        positions, _ = engine.advance(engine.start_state(10, 10), deltas)
+
+        x, y = 10, 10
+        expected = []
+        for dx, dy in deltas.tolist():
+            x = min(max(x + dx, 0), 49)
+            y = min(max(y + dy, 0), 39)
+            expected.append((x, y))
+        self.assertEqual(positions.tolist(), [list(p) for p in expected])
+
+    def test_bounded_modes_stay_on_screen(self):
+        """Тест утримання блукання в межах екрана"""
+        for boundary in ("clamp", "reflect"):
+            walk = PatternGenerator.generate_random_walk_array(
+                5, 5, 5000, 80, seed=1, bounds=(1920, 1080), boundary=boundary
+            )
+            self.assertTrue((walk >= 0).all())
+            self.assertTrue((walk < (1920, 1080)).all())
+            steps = np.abs(np.diff(walk, axis=0))
+            self.assertLessEqual(steps.max(), 80)
+
+    def test_stream_matches_array(self):
+        """Тест відповідності потокової та векторної версій"""
+        kwargs = dict(seed=3, bounds=(800, 600), boundary="clamp")
+        self.assertEqual(
+            list(PatternGenerator.iter_random_walk(400, 300, 3000, 60, **kwargs)),
+            PatternGenerator.generate_random_walk(400, 300, 3000, 60, **kwargs),
+        )
+
+    def test_spawned_streams(self):
+        """Тест незалежних відтворюваних потоків для воркерів"""
+        starts = [(100, 100)] * 4
+        first = RandomWalkEngine(seed=42).generate_many(starts, 500, max_workers=4)
+        second = RandomWalkEngine(seed=42).generate_many(starts, 500, max_workers=2)
+        self.assertEqual(first, second)
+        self.assertNotEqual(first[0], first[1])
+
+    def test_invalid_boundary(self):
+        """Тест некоректного режиму меж"""
+        with self.assertRaises(ValueError):
+            RandomWalkEngine(boundary="wrap", bounds=(100, 100))
+        with self.assertRaises(ValueError):
+            RandomWalkEngine(boundary="clamp")
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
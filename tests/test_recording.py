@@ -0,0 +1,174 @@
+"""
+Тести для запису та відтворення траєкторій курсора
+"""
+
+import io
+import threading
+import time
+import unittest
+
+import numpy as np
+
+from mouse_controller.backends import MemoryBackend
+from mouse_controller.core.mouse_mover import MouseMover
+from mouse_controller.core.recording import (
+    RecordingError,
+    TrajectoryReader,
+    TrajectoryRecorder,
+    decode_varints,
+    encode_varints,
+    zigzag_decode,
+    zigzag_encode,
+)
+from mouse_controller.core.stop_token import StopToken
+
+
+def record_line(points, period=0.01, **kwargs):
+    """Записати точки з рівним інтервалом і повернути вміст файлу"""
+    buffer = io.BytesIO()
+    recorder = TrajectoryRecorder(buffer, **kwargs)
+    for index, (x, y) in enumerate(points):
+        recorder.record(x, y, recorder._origin + index * period)
+    recorder.close()
+    return buffer.getvalue()
+
+
+class TestEncoding(unittest.TestCase):
+    """Тести для кодування varint та zigzag"""
+
+    def test_varint_round_trip(self):
+        values = np.array([0, 1, 127, 128, 300, 2**35, 2**64 - 1], dtype=np.uint64)
+        self.assertEqual(encode_varints([300]), b"\xac\x02")
+        np.testing.assert_array_equal(decode_varints(encode_varints(values)), values)
+
+    def test_zigzag_round_trip(self):
+        values = np.array([0, -1, 1, -64, 64, -(2**40)], dtype=np.int64)
+        np.testing.assert_array_equal(zigzag_encode([0, -1, 1, -2]), [0, 1, 2, 3])
+        np.testing.assert_array_equal(zigzag_decode(zigzag_encode(values)), values)
+
+    def test_truncated_varint(self):
+        with self.assertRaises(RecordingError):
+            decode_varints(b"\xac")
+
+
+class TestTrajectoryRecorder(unittest.TestCase):
+    """Тести для TrajectoryRecorder та TrajectoryReader"""
+
+    def test_round_trip_across_chunks(self):
+        points = [(100 + i, 200 - 2 * i) for i in range(50)]
+        reader = TrajectoryReader(record_line(points, chunk_size=8))
+
+        times, path = reader.read()
+        self.assertEqual(len(reader.chunks), 7)
+        self.assertEqual(path.tolist(), points)
+        np.testing.assert_allclose(times, np.arange(50) * 0.01)
+
+    def test_stores_only_changes(self):
+        data = record_line([(5, 5), (5, 5), (5, 5), (6, 5)])
+        times, path = TrajectoryReader(data).read()
+
+        self.assertEqual(path.tolist(), [(5, 5), (6, 5)])
+        np.testing.assert_allclose(times, [0.0, 0.03])
+
+    def test_read_time_range(self):
+        points = [(i, i) for i in range(100)]
+        reader = TrajectoryReader(record_line(points, chunk_size=10))
+
+        times, path = reader.read(0.25, 0.5)
+        self.assertEqual(path.tolist()[0], (25, 25))
+        self.assertEqual(path.tolist()[-1], (50, 50))
+
+    def test_truncated_file_readable(self):
+        data = record_line([(i, 0) for i in range(30)], chunk_size=10)
+        cut = TrajectoryReader(data).chunks[-1].offset + 5
+        reader = TrajectoryReader(data[:cut])
+
+        # Без індексу лишаються лише цілі блоки
+        self.assertEqual(len(reader), 20)
+        self.assertEqual(reader.read()[1].tolist()[-1], (19, 0))
+
+    def test_compact_for_smooth_motion(self):
+        angles = np.linspace(0, 20 * np.pi, 6000)
+        points = np.column_stack(
+            (960 + 300 * np.cos(angles), 540 + 300 * np.sin(angles))
+        )
+        data = record_line(np.rint(points).astype(int).tolist())
+
+        self.assertLess(len(data) / 6000, 2.0)
+
+    def test_polls_mover(self):
+        backend = MemoryBackend()
+        mover = MouseMover(failsafe=False, pause=0, backend=backend)
+        buffer = io.BytesIO()
+
+        with TrajectoryRecorder(buffer, rate=200) as recorder:
+            recorder.start(mover)
+            for x in (10, 20, 30):
+                backend.x = x
+                time.sleep(0.03)
+
+        xs = [x for x, _ in TrajectoryReader(buffer.getvalue()).read()[1].tolist()]
+        self.assertEqual(xs[-3:], [10, 20, 30])
+
+    def test_polling_survives_position_errors(self):
+        """Тест продовження запису після помилки отримання позиції"""
+        backend = MemoryBackend()
+        failures = threading.Semaphore(2)
+        polled = threading.Event()
+
+        class FlakyMover:
+            def get_current_position(self):
+                if failures.acquire(blocking=False):
+                    raise OSError("display lost")
+                polled.set()
+                return backend.position()
+
+        buffer = io.BytesIO()
+        with self.assertLogs("mouse_controller.core.recording", "ERROR") as logs:
+            with TrajectoryRecorder(buffer, rate=200) as recorder:
+                recorder.start(FlakyMover())
+                self.assertTrue(polled.wait(2.0))
+                self.assertTrue(recorder._thread.is_alive())
+
+        self.assertEqual(len(logs.records), 2)
+        self.assertIn("display lost", logs.output[0])
+        self.assertGreater(len(TrajectoryReader(buffer.getvalue()).read()[1]), 0)
+
+
+class TestReplay(unittest.TestCase):
+    """Тести відтворення запису"""
+
+    def setUp(self):
+        """Налаштування перед кожним тестом"""
+        self.backend = MemoryBackend()
+        self.mover = MouseMover(failsafe=False, pause=0, backend=self.backend)
+
+    def test_replay_at_speed(self):
+        # Рух 0.5 с, пауза 5 с, ще 0.5 с руху
+        points = [(100 + i, 100) for i in range(50)]
+        buffer = io.BytesIO()
+        recorder = TrajectoryRecorder(buffer)
+        for index, (x, y) in enumerate(points):
+            offset = 5.0 if index >= 25 else 0.0
+            recorder.record(x, y, recorder._origin + index * 0.02 + offset)
+        recorder.close()
+
+        reader = TrajectoryReader(buffer.getvalue())
+        start = time.perf_counter()
+        self.assertTrue(reader.replay(self.mover, speed=20.0))
+        elapsed = time.perf_counter() - start
+
+        self.assertAlmostEqual(elapsed, reader.duration / 20, delta=0.1)
+        self.assertEqual(self.backend.moves[-1][:2], (149, 100))
+
+    def test_replay_stops(self):
+        reader = TrajectoryReader(record_line([(i, 0) for i in range(100)]))
+        token = StopToken()
+        token.stop("test")
+
+        self.assertFalse(reader.replay(self.mover, stop_token=token))
+        self.assertEqual(self.backend.moves, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
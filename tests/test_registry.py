@@ -0,0 +1,78 @@
+"""
+Тести для реєстру шаблонів
+"""
+
+import unittest
+from importlib.metadata import EntryPoint
+from unittest.mock import patch
+
+from mouse_controller.core import registry
+from mouse_controller.core.registry import (
+    PatternContext,
+    PatternRegistry,
+    PatternSpec,
+)
+
+CONTEXT = PatternContext(960, 540, 150, 1920, 1080, 100, 100)
+
+
+def zigzag(context, teeth: int = 4, height=None):
+    """Тестовий шаблон-плагін"""
+    height = height or context.size // 4
+    return [
+        (context.center_x + i * 10, context.center_y + (i % 2) * height)
+        for i in range(teeth * 2 + 1)
+    ]
+
+
+class TestPatternRegistry(unittest.TestCase):
+    """Тести для класу PatternRegistry"""
+
+    def test_builtins_cover_all_shapes(self):
+        """Тест наявності всіх вбудованих фігур"""
+        reg = PatternRegistry(group="mouse_controller.tests.none")
+        names = [spec.name for spec in reg]
+        self.assertEqual(names[0], "circle")
+        self.assertIn("random_walk", names)
+        self.assertEqual(len(reg), 9)
+        self.assertEqual(
+            reg.categories(), ["Geometric Shapes", "Waves and Complex Movements"]
+        )
+
+    def test_builtin_builds_path(self):
+        """Тест побудови вбудованої фігури"""
+        reg = PatternRegistry(group="mouse_controller.tests.none")
+        path = reg.get("circle").build(CONTEXT)
+        self.assertEqual(path[0], (1110, 540))
+        self.assertEqual(len(path), 101)
+
+    def test_entry_point_loaded_lazily(self):
+        """Тест лінивого імпорту плагіна з точки входу"""
+        entry_point = EntryPoint(
+            "zigzag", f"{__name__}:zigzag", registry.ENTRY_POINT_GROUP
+        )
+        with patch.object(registry, "_entry_points", return_value=[entry_point]):
+            reg = PatternRegistry(builtins=False)
+            with patch.object(registry.importlib, "import_module") as import_module:
+                spec = reg.get("zigzag")
+                self.assertEqual(spec.category, registry.PLUGIN_CATEGORY)
+                self.assertEqual(spec.label, "Zigzag")
+                import_module.assert_not_called()
+
+        self.assertFalse(spec.loaded)
+        self.assertEqual([param.name for param in spec.params], ["teeth", "height"])
+        self.assertTrue(spec.loaded)
+        self.assertEqual(len(spec.build(CONTEXT, teeth=2)), 5)
+
+    def test_duplicate_and_unknown_names(self):
+        """Тест повторної реєстрації та невідомої назви"""
+        reg = PatternRegistry(builtins=False, group="mouse_controller.tests.none")
+        reg.register(PatternSpec("zigzag", f"{__name__}:zigzag"))
+        with self.assertRaises(ValueError):
+            reg.register(PatternSpec("zigzag", f"{__name__}:zigzag"))
+        with self.assertRaises(KeyError):
+            reg.get("missing")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,84 @@
+"""
+Тести для перепараметризації шляхів за довжиною дуги
+"""
+
+import unittest
+
+import numpy as np
+
+from mouse_controller.core.patterns import PatternGenerator
+from mouse_controller.core.resample import (
+    cumulative_arc_length,
+    resample_by_arc_length,
+    resample_by_velocity,
+)
+
+
+def _segment_lengths(path):
+    """Довжини сегментів шляху"""
+    return np.hypot(*np.diff(path.array.astype(float), axis=0).T)
+
+
+class TestResample(unittest.TestCase):
+    """Тести для функцій перепараметризації"""
+
+    def test_cumulative_arc_length(self):
+        """Тест накопиченої довжини дуги"""
+        lengths = cumulative_arc_length([(0, 0), (3, 4), (3, 10)])
+        self.assertEqual(lengths.tolist(), [0.0, 5.0, 11.0])
+
+    def test_even_spacing(self):
+        """Тест рівномірного розподілу точок уздовж кривої"""
+        points = PatternGenerator.generate_spiral_array(500, 500, 300, 3, 50)
+        resampled = resample_by_arc_length(points, count=len(points))
+
+        self.assertEqual(len(resampled), len(points))
+        self.assertEqual(resampled[0], tuple(points[0]))
+        self.assertEqual(resampled[-1], tuple(points[-1]))
+
+        # Сегменти вихідної спіралі зростають від центру, а тут майже рівні
+        original = _segment_lengths(
+            PatternGenerator.generate_spiral_points(500, 500, 300, 3, 50)
+        )
+        lengths = _segment_lengths(resampled)
+        self.assertLess(lengths.std(), original.std() / 4)
+
+    def test_spacing(self):
+        """Тест заданого кроку в пікселях"""
+        resampled = resample_by_arc_length([(0, 0), (100, 0)], spacing=10)
+        self.assertEqual(len(resampled), 11)
+        self.assertEqual(resampled[3], (30, 0))
+
+    def test_constant_velocity(self):
+        """Тест сталої швидкості"""
+        resampled = resample_by_velocity([(0, 0), (600, 0)], velocity=300, rate=10)
+        self.assertEqual(len(resampled), 21)
+        self.assertEqual(resampled[1], (30, 0))
+
+    def test_velocity_profile(self):
+        """Тест профілю швидкості"""
+        resampled = resample_by_velocity(
+            [(0, 0), (1000, 0)], velocity=[100, 1000], rate=50
+        )
+        lengths = _segment_lengths(resampled)
+        self.assertLess(lengths[0], lengths[-2])
+
+        with self.assertRaises(ValueError):
+            resample_by_velocity([(0, 0), (10, 0)], velocity=0)
+
+    def test_velocity_function(self):
+        """Тест функції швидкості, зокрема сталої"""
+        constant = resample_by_velocity([(0, 0), (600, 0)], lambda u: 300, rate=10)
+        self.assertEqual(len(constant), 21)
+        self.assertEqual(constant[1], (30, 0))
+
+        ramp = resample_by_velocity([(0, 0), (1000, 0)], lambda u: 100 + 900 * u, 50)
+        lengths = _segment_lengths(ramp)
+        self.assertLess(lengths[0], lengths[-2])
+
+        with self.assertRaises(ValueError):
+            resample_by_velocity([(0, 0), (10, 0)], lambda u: [100, 200])
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
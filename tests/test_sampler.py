@@ -0,0 +1,116 @@
+"""
+Тести для семплера позиції курсора
+"""
+
+import time
+import unittest
+from unittest.mock import patch
+
+from mouse_controller.backends import MemoryBackend
+from mouse_controller.core.sampler import PositionSampler, corner_guard
+from mouse_controller.core.stop_token import StopToken
+
+
+class CountingBackend(MemoryBackend):
+    """Бекенд, що рахує запити позиції"""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.position_calls = 0
+
+    def position(self):
+        self.position_calls += 1
+        return super().position()
+
+
+class TestPositionSampler(unittest.TestCase):
+    """Тести для класу PositionSampler"""
+
+    def setUp(self):
+        """Налаштування перед кожним тестом"""
+        self.backend = CountingBackend()
+        self.sampler = PositionSampler(self.backend, capacity=4)
+
+    def tearDown(self):
+        """Зупинка потоку семплера"""
+        self.sampler.stop()
+
+    def test_ring_buffer_keeps_newest_samples(self):
+        """Тест кільцевого буфера з найновішими вибірками"""
+        for x in range(6):
+            self.backend.x = x
+            self.sampler.sample()
+
+        times, xy = self.sampler.history()
+        self.assertEqual(xy[:, 0].tolist(), [2, 3, 4, 5])
+        self.assertTrue((times[1:] >= times[:-1]).all())
+        self.assertEqual(self.sampler.latest().x, 5)
+        self.assertEqual(self.sampler.count, 6)
+
+    def test_subscribers_get_changes_only(self):
+        """Тест сповіщення підписників лише про зміни позиції"""
+        received = []
+        unsubscribe = self.sampler.subscribe(received.append)
+
+        self.sampler.sample()
+        self.sampler.sample()
+        self.backend.x += 1
+        self.sampler.sample()
+        unsubscribe()
+        self.backend.x += 1
+        self.sampler.sample()
+
+        self.assertEqual([sample.x for sample in received], [960, 961])
+        self.assertEqual(self.backend.position_calls, 4)
+
+    def test_idles_after_stillness(self):
+        """Тест зниження частоти у спокої за штучним годинником"""
+        clock = [100.0]
+        sampler = PositionSampler(self.backend, rate=1000, idle_rate=50, idle_after=0.1)
+
+        with patch("mouse_controller.core.sampler.time.perf_counter") as now:
+            now.side_effect = lambda: clock[0]
+            sampler.sample()
+            self.assertEqual(sampler.current_rate, 1000)
+
+            clock[0] += 0.05
+            sampler.sample()
+            self.assertEqual(sampler.current_rate, 1000)
+
+            clock[0] += 0.06
+            sampler.sample()
+            self.assertEqual(sampler.current_rate, 50)
+
+            self.backend.x += 5
+            sampler.sample()
+            self.assertEqual(sampler.current_rate, 1000)
+
+    def test_thread_samples(self):
+        """Тест фонової вибірки"""
+        sampler = PositionSampler(self.backend, rate=1000, idle_rate=50, idle_after=0.1)
+        with sampler:
+            self.backend.x += 5
+            deadline = time.monotonic() + 2.0
+            while sampler.latest() is None or sampler.latest().x != 965:
+                self.assertLess(time.monotonic(), deadline)
+                time.sleep(0.01)
+
+        self.assertFalse(sampler.running)
+        count = sampler.count
+        time.sleep(0.05)
+        self.assertEqual(sampler.count, count)
+
+    def test_corner_guard_stops_token(self):
+        """Тест зупинки токена в куті екрана"""
+        token = StopToken()
+        self.sampler.subscribe(corner_guard(token, 1920, 1080))
+
+        self.sampler.sample()
+        self.assertFalse(token.stopped)
+        self.backend.x, self.backend.y = 0, 0
+        self.sampler.sample()
+        self.assertTrue(token.stopped)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,104 @@
+"""
+Тести для кешованої геометрії екрана
+"""
+
+import unittest
+
+from mouse_controller.backends import MemoryBackend, Monitor
+from mouse_controller.core.mouse_mover import MouseMover
+from mouse_controller.core.registry import PatternContext
+from mouse_controller.utils.screen import ScreenGeometry, shared_geometry
+
+# Два монітори різної висоти: під правим є порожня область
+MONITORS = [Monitor(0, 0, 1920, 1080), Monitor(1920, 0, 1280, 720)]
+
+
+class CountingBackend(MemoryBackend):
+    """Бекенд, що рахує запити розміру та моніторів"""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.size_calls = 0
+        self.monitor_calls = 0
+
+    def size(self):
+        self.size_calls += 1
+        return super().size()
+
+    def monitors(self):
+        self.monitor_calls += 1
+        return super().monitors()
+
+
+class TestScreenGeometry(unittest.TestCase):
+    """Тести для класу ScreenGeometry"""
+
+    def setUp(self):
+        """Налаштування перед кожним тестом"""
+        self.backend = CountingBackend(width=3200, height=1080, monitors=MONITORS)
+
+    def test_caches_layout(self):
+        """Тест кешування розкладки без повторних запитів"""
+        geometry = ScreenGeometry(self.backend, ttl=60)
+        for _ in range(100):
+            self.assertEqual(geometry.size, (3200, 1080))
+
+        self.assertEqual(self.backend.size_calls, 1)
+        self.assertEqual(self.backend.monitor_calls, 1)
+        self.assertEqual(geometry.monitors, tuple(MONITORS))
+
+    def test_change_check_after_ttl(self):
+        """Тест дешевої перевірки змін після закінчення TTL"""
+        geometry = ScreenGeometry(self.backend, ttl=60)
+        geometry.layout
+
+        geometry.invalidate()
+        geometry.layout
+        self.assertEqual(self.backend.monitor_calls, 1)
+
+        self.backend.width = 1920
+        self.backend._monitors = None
+        geometry.invalidate()
+        self.assertEqual(geometry.size, (1920, 1080))
+        self.assertEqual(geometry.monitors, (Monitor(0, 0, 1920, 1080),))
+        self.assertEqual(geometry.refreshes, 2)
+
+    def test_validates_against_monitors(self):
+        """Тест перевірки точок у проміжках між моніторами"""
+        geometry = ScreenGeometry(self.backend)
+
+        self.assertTrue(geometry.validate(100, 1000))
+        self.assertTrue(geometry.validate(2000, 700))
+        self.assertFalse(geometry.validate(2000, 900))
+
+        path, kept, report = geometry.filter([(100, 1000), (2000, 900), (3300, 5)])
+        self.assertEqual(path.tolist(), [(100, 1000)])
+        self.assertEqual(kept.tolist(), [0])
+        self.assertEqual((report.rejected, report.right), (2, 1))
+
+    def test_nearest_monitor(self):
+        """Тест пошуку найближчого монітора"""
+        layout = ScreenGeometry(self.backend).layout
+
+        self.assertEqual(layout.monitor_at(2500, 100), MONITORS[1])
+        self.assertIsNone(layout.monitor_at(2500, 900))
+        self.assertEqual(layout.nearest_monitor(2500, 900), MONITORS[1])
+
+    def test_shared_by_movers(self):
+        """Тест спільної геометрії для всіх користувачів бекенда"""
+        first = MouseMover(failsafe=False, backend=self.backend)
+        second = MouseMover(failsafe=False, backend=self.backend)
+
+        self.assertIs(first.geometry, second.geometry)
+        self.assertIs(first.geometry, shared_geometry(self.backend))
+        self.assertEqual(self.backend.monitor_calls, 1)
+
+        # Шаблони центруються на моніторі під курсором
+        self.backend.x, self.backend.y = 2500, 300
+        context = PatternContext.from_mover(first, 100)
+        self.assertEqual((context.center_x, context.center_y), (2560, 360))
+        self.assertEqual(context.screen_width, 3200)
+
+
+if __name__ == "__main__":
+    unittest.main()
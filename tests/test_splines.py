@@ -0,0 +1,83 @@
+"""
+Тести для сплайнів
+"""
+
+import unittest
+
+import numpy as np
+
+from mouse_controller.utils.helpers import create_smooth_curve
+from mouse_controller.utils.splines import (
+    bspline,
+    catmull_rom_segments,
+    catmull_rom_spline,
+    cubic_bezier,
+    flatten_segments,
+)
+
+
+class TestSplines(unittest.TestCase):
+    """Тести для модуля splines"""
+
+    def setUp(self):
+        """Налаштування перед кожним тестом"""
+        self.points = [(0, 0), (100, 0), (200, 0), (300, 0), (300, 100), (200, 200)]
+
+    def test_catmull_rom_passes_through_points(self):
+        """Тест проходження кривої через усі точки"""
+        curve = catmull_rom_spline(self.points, 0.5)
+        for point in self.points:
+            self.assertIn(point, list(curve))
+
+    def test_straight_segments_not_subdivided(self):
+        """Тест відсутності зайвих точок на прямих ділянках"""
+        curve = catmull_rom_spline(self.points, 0.5)
+        self.assertEqual(list(curve)[:3], [(0, 0), (100, 0), (200, 0)])
+
+    def test_tolerance(self):
+        """Тест точності апроксимації"""
+        segments = catmull_rom_segments(self.points)
+        coarse = flatten_segments(segments, 2.0)
+        fine = flatten_segments(segments, 0.1)
+        self.assertLess(len(coarse), len(fine))
+
+        # Кожна точка щільної кривої близька до ламаної грубої
+        coarse_xy = coarse.array.astype(float)
+        for point in fine.array.astype(float):
+            starts, ends = coarse_xy[:-1], coarse_xy[1:]
+            chord = ends - starts
+            t = np.clip(
+                np.einsum("ij,ij->i", point - starts, chord)
+                / np.maximum(np.einsum("ij,ij->i", chord, chord), 1e-9),
+                0,
+                1,
+            )
+            nearest = starts + t[:, np.newaxis] * chord
+            self.assertLess(np.hypot(*(nearest - point).T).min(), 2.0 + 1.5)
+
+    def test_bspline_endpoints(self):
+        """Тест кінцевих точок B-сплайна"""
+        curve = bspline(self.points)
+        self.assertEqual(curve[0], (0, 0))
+        self.assertEqual(curve[-1], (200, 200))
+
+    def test_cubic_bezier(self):
+        """Тест кубічної кривої Безьє"""
+        curve = cubic_bezier([(0, 0), (0, 100), (100, 100), (100, 0)], 0.5)
+        self.assertEqual(curve[0], (0, 0))
+        self.assertEqual(curve[-1], (100, 0))
+        self.assertAlmostEqual(int(curve.ys.max()), 75, delta=1)
+
+        with self.assertRaises(ValueError):
+            cubic_bezier([(0, 0), (1, 1), (2, 2)])
+
+    def test_create_smooth_curve_keeps_first_segment(self):
+        """Тест збереження першого сегмента у згладженій кривій"""
+        curve = create_smooth_curve([(0, 0), (50, 50), (100, 0)])
+        self.assertEqual(curve[0], (0, 0))
+        self.assertIn((50, 50), list(curve))
+        self.assertGreater(len(curve), 3)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,161 @@
+"""
+Тести для кооперативної зупинки рухів
+"""
+
+import threading
+import time
+import unittest
+
+from mouse_controller.backends import MemoryBackend
+from mouse_controller.core.mouse_mover import MouseMover
+from mouse_controller.core.playback import PlaybackScheduler
+from mouse_controller.core.stop_token import StopToken
+
+
+class StoppingBackend(MemoryBackend):
+    """Бекенд, що зупиняє токен після заданої кількості переміщень"""
+
+    def __init__(self, token, after, **kwargs):
+        super().__init__(**kwargs)
+        self.token = token
+        self.after = after
+
+    def move_to(self, x, y, duration=0.0):
+        super().move_to(x, y, duration=0.0)
+        if len(self.moves) == self.after:
+            self.token.stop("test")
+
+
+class TestStopToken(unittest.TestCase):
+    """Тести для класу StopToken"""
+
+    def test_stop_and_reset(self):
+        """Тест зупинки та повторного використання токена"""
+        token = StopToken()
+        self.assertFalse(token.stopped)
+        self.assertFalse(token.wait(0))
+
+        token.stop("user")
+        self.assertTrue(token.stopped)
+        self.assertEqual(token.reason, "user")
+        self.assertTrue(token.wait(0))
+
+        token.halted_at = 3
+        token.reset()
+        self.assertFalse(token.stopped)
+        self.assertIsNone(token.halted_at)
+
+
+class TestMoverStop(unittest.TestCase):
+    """Тести зупинки та відновлення рухів MouseMover"""
+
+    def setUp(self):
+        """Налаштування перед кожним тестом"""
+        self.token = StopToken()
+        self.backend = StoppingBackend(self.token, after=4)
+        self.mover = MouseMover(failsafe=False, backend=self.backend)
+        self.points = [(100 + i, 200) for i in range(10)]
+
+    def test_smooth_path_halts_and_resumes(self):
+        """Тест зупинки шляху та відновлення з halted_at"""
+        result = self.mover.move_smooth_path(self.points, 0.0, stop_token=self.token)
+
+        self.assertFalse(result)
+        self.assertEqual(len(self.backend.moves), 4)
+        self.assertEqual(self.token.halted_at, 4)
+
+        start = self.token.halted_at
+        self.token.reset()
+        self.backend.after = None
+        result = self.mover.move_smooth_path(self.points, 0.0, start_index=start)
+
+        self.assertTrue(result)
+        visited = [(x, y) for x, y, _ in self.backend.moves]
+        self.assertEqual(visited, self.points)
+
+    def test_halted_at_counts_skipped_points(self):
+        """Тест індексу зупинки з урахуванням пропущених точок"""
+        points = [(-5, -5)] * 3 + self.points
+        self.mover.move_smooth_path(points, 0.0, stop_token=self.token)
+
+        self.assertEqual(self.token.halted_at, 7)
+
+    def test_streamed_path_halts(self):
+        """Тест зупинки потокового шляху"""
+        self.mover.move_smooth_path(iter(self.points), 0.0, stop_token=self.token)
+
+        self.assertEqual(self.token.halted_at, 4)
+        self.assertEqual(len(self.backend.moves), 4)
+
+    def test_timed_path_halts(self):
+        """Тест зупинки шляху з тривалостями"""
+        samples = [(x, y, 0.0) for x, y in self.points]
+        result = self.mover.move_timed_path(samples, stop_token=self.token)
+
+        self.assertFalse(result)
+        self.assertEqual(self.token.halted_at, 4)
+
+    def test_square_halts_and_resumes(self):
+        """Тест зупинки квадрата та відновлення з кута зупинки"""
+        self.backend.after = 2
+        result = self.mover.move_in_square(100, 100, 50, stop_token=self.token)
+
+        self.assertFalse(result)
+        self.assertEqual(self.token.halted_at, 2)
+
+        start = self.token.halted_at
+        self.token.reset()
+        self.backend.after = None
+        self.assertTrue(self.mover.move_in_square(100, 100, 50, start_index=start))
+        visited = [(x, y) for x, y, _ in self.backend.moves]
+        self.assertEqual(
+            visited, [(100, 100), (150, 100), (150, 150), (100, 150), (100, 100)]
+        )
+
+    def test_emergency_stop_halts_running_path(self):
+        """Тест зупинки руху з іншого потоку протягом одного кадру"""
+        backend = MemoryBackend()
+        mover = MouseMover(failsafe=False, backend=backend)
+        token = StopToken()
+        points = [(100 + i, 200) for i in range(1000)]
+        thread = threading.Thread(
+            target=mover.play_path, args=(points, 100.0, token), daemon=True
+        )
+        thread.start()
+
+        time.sleep(0.1)
+        stopped_at = time.perf_counter()
+        mover.emergency_stop()
+        thread.join(1.0)
+
+        self.assertFalse(thread.is_alive())
+        self.assertLess(time.perf_counter() - stopped_at, 0.1)
+        self.assertEqual(token.reason, "emergency stop")
+        self.assertLess(token.halted_at, 1000)
+        self.assertEqual(
+            backend.moves[token.halted_at - 1][:2], points[token.halted_at - 1]
+        )
+
+
+class TestPlaybackStop(unittest.TestCase):
+    """Тести зупинки планувальника відтворення"""
+
+    def test_report_records_halted_frame(self):
+        """Тест запису кадру зупинки у звіті"""
+        backend = MemoryBackend()
+        backend.configure(failsafe=False, pause=0)
+        token = StopToken()
+        token.stop()
+
+        report = PlaybackScheduler(backend, rate=100).play(
+            [(1, 1)] * 5, stop_token=token
+        )
+
+        self.assertEqual(report.sent, 0)
+        self.assertEqual(report.halted_at, 0)
+        self.assertEqual(token.halted_at, 0)
+        self.assertEqual(backend.moves, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
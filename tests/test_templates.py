@@ -0,0 +1,73 @@
+"""
+Тести для кешу шаблонів фігур
+"""
+
+import unittest
+from unittest.mock import patch
+
+from mouse_controller.core import builtin_patterns
+from mouse_controller.core.patterns import PatternGenerator
+from mouse_controller.core.registry import PatternContext
+from mouse_controller.core.templates import ShapeTemplateCache
+
+
+class TestShapeTemplateCache(unittest.TestCase):
+    """Тести для класу ShapeTemplateCache"""
+
+    def setUp(self):
+        """Налаштування перед кожним тестом"""
+        self.cache = ShapeTemplateCache(maxsize=2)
+
+    def test_place_matches_generator(self):
+        """Тест відповідності розміщеного шаблону генератору"""
+        placed = self.cache.place("circle", 500, 400, 120, steps=60)
+        expected = PatternGenerator.generate_circle_array(500, 400, 120, 60)
+        self.assertEqual(placed, expected)
+
+    def test_star_matches_generator(self):
+        """Тест точного збігу зірки з генератором і ключа кешу"""
+        cases = [((960, 540, 333), None), ((960, 540, 333), 100), ((0, 0, 23), 13)]
+        with patch.object(builtin_patterns, "template_cache", self.cache):
+            for (x, y, size), inner_radius in cases:
+                context = PatternContext(x, y, size, 1920, 1080, 0, 0)
+                placed = builtin_patterns.star(context, inner_radius, points=5)
+                expected = PatternGenerator.generate_star_points(
+                    x, y, size, inner_radius or size // 2, 5
+                )
+                self.assertEqual(placed, expected)
+
+            context = PatternContext(10, 10, 333, 1920, 1080, 0, 0)
+            builtin_patterns.star(context, 100, points=5)
+        self.assertEqual(self.cache.stats()["hits"], 1)
+
+    def test_hits_and_misses(self):
+        """Тест лічильників влучань і промахів"""
+        self.cache.place("heart", 100, 100, 5, steps=50)
+        self.cache.place("heart", 300, 200, 7, steps=50)
+        stats = self.cache.stats()
+        self.assertEqual(stats["misses"], 1)
+        self.assertEqual(stats["hits"], 1)
+
+    def test_eviction(self):
+        """Тест витіснення найдавніше використаного шаблону"""
+        self.cache.get_template("circle", 10)
+        self.cache.get_template("spiral", 10, turns=2)
+        self.cache.get_template("circle", 10)
+        self.cache.get_template("heart", 10)
+
+        stats = self.cache.stats()
+        self.assertEqual(stats["evictions"], 1)
+        self.assertEqual(stats["size"], 2)
+
+        # Коло використовувалось нещодавно, тому залишилось у кеші
+        self.cache.get_template("circle", 10)
+        self.assertEqual(self.cache.stats()["hits"], 2)
+
+    def test_unknown_shape(self):
+        """Тест невідомої фігури"""
+        with self.assertRaises(ValueError):
+            self.cache.get_template("hexagon", 10)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,86 @@
+"""
+Тести для трасування рухів
+"""
+
+import io
+import json
+import unittest
+
+from mouse_controller.backends import MemoryBackend
+from mouse_controller.core.mouse_mover import MouseMover
+from mouse_controller.core.registry import PatternContext, pattern_registry
+from mouse_controller.utils.tracing import Tracer, tracer
+
+
+class TestTracer(unittest.TestCase):
+    """Тести для класу Tracer"""
+
+    def test_disabled_records_nothing(self):
+        trace = Tracer()
+        with trace.span("path.filter"):
+            pass
+
+        self.assertEqual(len(trace), 0)
+
+    def test_capacity_drops_oldest(self):
+        trace = Tracer(capacity=3, enabled=True)
+        for index in range(5):
+            with trace.span(f"span{index}"):
+                pass
+
+        self.assertEqual(
+            [e["name"] for e in trace.events()], ["span2", "span3", "span4"]
+        )
+
+    def test_export_chrome_trace(self):
+        trace = Tracer(enabled=True)
+        move = trace.wrap(lambda x, y: None, "backend.move_to")
+        move(1, 2)
+
+        out = io.StringIO()
+        trace.export(out)
+        event = json.loads(out.getvalue())["traceEvents"][0]
+
+        self.assertEqual(event["name"], "backend.move_to")
+        self.assertEqual(event["ph"], "X")
+        self.assertGreaterEqual(event["dur"], 0)
+
+
+class TestMoverTracing(unittest.TestCase):
+    """Тести трасування в MouseMover"""
+
+    def test_disabled_uses_backend_directly(self):
+        mover = MouseMover(failsafe=False, pause=0, backend=MemoryBackend())
+        self.assertEqual(mover._mover(), mover.backend.move_to)
+
+    def test_spans_per_backend_call(self):
+        trace = Tracer(enabled=True)
+        mover = MouseMover(
+            failsafe=False, pause=0, backend=MemoryBackend(), tracer=trace
+        )
+
+        mover.move_smooth_path([(10, 10), (20, 20), (30, 30)], 0)
+        mover.play_path([(10, 10), (20, 20)], rate=1000)
+
+        names = [event["name"] for event in trace.events()]
+        self.assertEqual(names.count("path.filter"), 2)
+        self.assertEqual(names.count("backend.move_to"), 3)
+        self.assertEqual(names.count("backend.warp"), 2)
+
+    def test_pattern_generation_span(self):
+        context = PatternContext(500, 500, 100, 1000, 1000, 500, 500)
+        tracer.clear()
+        tracer.enable()
+        try:
+            pattern_registry.get("circle").build(context)
+        finally:
+            tracer.disable()
+
+        events = tracer.events()
+        tracer.clear()
+        self.assertEqual([e["cat"] for e in events], ["pattern"])
+        self.assertEqual(events[0]["name"], "pattern.circle")
+
+
+if __name__ == "__main__":
+    unittest.main()
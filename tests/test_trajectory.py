@@ -0,0 +1,104 @@
+"""
+Тести для моделі траєкторій
+"""
+
+import time
+import unittest
+
+import numpy as np
+
+from mouse_controller.backends import MemoryBackend
+from mouse_controller.core.mouse_mover import MouseMover
+from mouse_controller.core.trajectory import (
+    TrajectoryPlanner,
+    fitts_duration,
+    minimum_jerk,
+)
+
+
+class TestTrajectory(unittest.TestCase):
+    """Тести для планувальника траєкторій"""
+
+    def test_minimum_jerk_profile(self):
+        """Тест профілю мінімального ривка"""
+        tau = np.array([0.0, 0.5, 1.0])
+        np.testing.assert_allclose(minimum_jerk(tau), [0.0, 0.5, 1.0])
+
+    def test_fitts_duration_grows_with_distance(self):
+        """Тест зростання тривалості з відстанню за законом Фіттса"""
+        durations = fitts_duration(np.array([0, 100, 1000]))
+        self.assertAlmostEqual(durations[0], 0.1)
+        self.assertTrue(np.all(np.diff(durations) > 0))
+
+    def test_batch_starts_and_ends_exactly(self):
+        """Тест початку і кінця кожного руху в пакеті"""
+        starts = np.array([[0, 0], [100, 100], [500, 20]])
+        ends = np.array([[300, 200], [100, 100], [20, 500]])
+        batch = TrajectoryPlanner(rate=60).plan(starts, ends)
+
+        self.assertEqual(len(batch), 3)
+        np.testing.assert_allclose(batch.positions[batch.offsets[:-1]], starts)
+        np.testing.assert_allclose(batch.positions[batch.offsets[1:] - 1], ends)
+        for i in range(3):
+            path, times = batch.move(i)
+            self.assertEqual(times[0], 0.0)
+            self.assertTrue(np.all(np.diff(times) > 0))
+        np.testing.assert_allclose(
+            batch.durations, fitts_duration([360.555, 0.0, 678.82]), rtol=1e-4
+        )
+
+    def test_overshoot_is_bounded(self):
+        """Тест обмеженого перельоту цілі"""
+        planner = TrajectoryPlanner(overshoot=0.2, max_overshoot=15, seed=1)
+        path, _ = planner.plan_one((0, 0), (400, 0)).move(0)
+
+        self.assertGreater(path.xs.max(), 400)
+        self.assertLessEqual(path.xs.max(), 415)
+        self.assertEqual(path[-1], (400, 0))
+
+    def test_corrections_are_seeded(self):
+        """Тест відтворюваності мікрокорекцій"""
+        first = TrajectoryPlanner(corrections=2, seed=5).plan_one((0, 0), (90, 90))
+        second = TrajectoryPlanner(corrections=2, seed=5).plan_one((0, 0), (90, 90))
+        np.testing.assert_array_equal(first.positions, second.positions)
+        self.assertEqual(tuple(first.move(0)[0][-1]), (90, 90))
+
+
+class ClockBackend(MemoryBackend):
+    """Бекенд, що записує час кожного переміщення"""
+
+    def __init__(self):
+        super().__init__()
+        self.stamps = []
+
+    def warp(self, x, y):
+        self.stamps.append(time.perf_counter())
+        super().warp(x, y)
+
+
+class TestMoveHumanLike(unittest.TestCase):
+    """Тести для MouseMover.move_human_like"""
+
+    def test_follows_planned_timing(self):
+        """Тест руху за запланованими мітками часу на реальному годиннику"""
+        backend = ClockBackend()
+        mover = MouseMover(failsafe=False, pause=0, backend=backend)
+        backend.x, backend.y = 100, 100
+        planner = TrajectoryPlanner()
+        duration = float(planner.plan_one((100, 100), (900, 500)).durations[0])
+
+        start = time.perf_counter()
+        self.assertTrue(mover.move_human_like(900, 500, planner))
+        elapsed = time.perf_counter() - start
+
+        self.assertEqual(backend.position(), (900, 500))
+        self.assertGreaterEqual(elapsed, duration - 0.01)
+        self.assertLess(elapsed, duration + 0.1)
+        # Половину шляху курсор проходить посередині руху (мінімальний ривок)
+        xs = np.array([x for x, _, _ in backend.moves])
+        halfway = backend.stamps[int(np.argmax(xs >= 500))] - start
+        self.assertAlmostEqual(halfway, duration / 2, delta=0.05)
+
+
+if __name__ == "__main__":
+    unittest.main()
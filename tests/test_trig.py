@@ -0,0 +1,62 @@
+"""
+Тести для спільних тригонометричних таблиць
+"""
+
+import unittest
+
+import numpy as np
+
+from mouse_controller.core import trig
+
+
+class TestAngleTable(unittest.TestCase):
+    """Тести для таблиць кутів"""
+
+    def setUp(self):
+        """Налаштування перед кожним тестом"""
+        trig.clear_tables()
+
+    def test_values_match_direct_computation(self):
+        """Тест збігу значень таблиці з прямим обчисленням"""
+        table = trig.angle_table(100, 4)
+        t = 2 * np.pi * np.arange(101) / 100
+        for k in range(1, 5):
+            np.testing.assert_array_equal(table.cos[k - 1], np.cos(k * t))
+            np.testing.assert_array_equal(table.sin[k - 1], np.sin(k * t))
+
+    def test_table_is_shared_and_read_only(self):
+        """Тест спільного використання таблиці та захисту від запису"""
+        table = trig.angle_table(64, 2)
+        self.assertIs(trig.angle_table(64), table)
+        with self.assertRaises(ValueError):
+            table.cos[0, 0] = 2.0
+
+    def test_more_harmonics_extend_table(self):
+        """Тест розширення таблиці при запиті більшої кількості гармонік"""
+        trig.angle_table(32)
+        table = trig.angle_table(32, 3)
+        self.assertEqual(table.harmonics, 3)
+        self.assertIs(trig.angle_table(32, 2), table)
+
+    def test_cache_is_bounded_by_bytes(self):
+        """Тест обмеження кешу сумарним розміром таблиць"""
+        for steps in range(trig.MAX_TABLE_STEPS - 40, trig.MAX_TABLE_STEPS + 1):
+            trig.angle_table(steps, 4)
+
+        cached = sum(table.nbytes for table in trig._tables.values())
+        self.assertLessEqual(cached, trig.MAX_CACHE_BYTES)
+        self.assertEqual(cached, trig._cached_bytes)
+        self.assertIn(trig.MAX_TABLE_STEPS, trig._tables)
+
+    def test_large_step_counts_are_not_tabulated(self):
+        """Тест прямого обчислення для великої кількості кроків"""
+        steps = trig.MAX_TABLE_STEPS * 4
+        i = np.array([0, steps // 4, steps // 2])
+        cos, sin = trig.cos_sin(i, steps)
+        np.testing.assert_allclose(cos, [1, 0, -1], atol=1e-12)
+        np.testing.assert_allclose(sin, [0, 1, 0], atol=1e-12)
+        self.assertEqual(trig._tables, {})
+
+
+if __name__ == "__main__":
+    unittest.main()